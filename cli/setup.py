@@ -1,4 +1,67 @@
-from setuptools import setup, find_packages
+import glob
+import os
+import shutil
+import subprocess
+
+from setuptools import Extension, setup, find_packages
+from setuptools.command.build_py import build_py
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # Cython이 없으면 ctypes 경로만 사용
+    cythonize = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORE_SOURCE_DIR = os.path.join(HERE, '..', 'core', 'blake_hash')
+NATIVE_DIR = os.path.join(HERE, 'virus_tracker', '_native')
+
+
+class BuildPyWithNative(build_py):
+    """detective_core / blake3를 CMake로 빌드하여 virus_tracker/_native에 복사한 뒤 패키징합니다."""
+
+    def run(self):
+        self._build_native()
+        super().run()
+
+    def _build_native(self):
+        if not os.path.isfile(os.path.join(CORE_SOURCE_DIR, 'CMakeLists.txt')):
+            print("경고: core/blake_hash 소스가 없어 네이티브 라이브러리 빌드를 건너뜁니다.")
+            return
+
+        build_dir = os.path.join(CORE_SOURCE_DIR, 'build')
+        try:
+            subprocess.check_call(['cmake', '-S', CORE_SOURCE_DIR, '-B', build_dir,
+                                   '-DCMAKE_BUILD_TYPE=Release'])
+            subprocess.check_call(['cmake', '--build', build_dir, '--config', 'Release'])
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"경고: 네이티브 라이브러리 빌드 실패 (실행 시 빌드 디렉토리에서 검색): {e}")
+            return
+
+        os.makedirs(NATIVE_DIR, exist_ok=True)
+        for pattern in ('libdetective_core.so', 'libdetective_core.dylib', 'detective_core.dll',
+                        'libblake3.so', 'libblake3.dylib', 'blake3.dll'):
+            for path in glob.glob(os.path.join(build_dir, '**', pattern), recursive=True):
+                shutil.copy2(path, NATIVE_DIR)
+
+
+def _cython_extensions():
+    """virus_tracker._core Cython 확장 (detective_core C 소스를 함께 컴파일, 실패해도 설치는 계속)"""
+    if cythonize is None or not os.path.isdir(CORE_SOURCE_DIR):
+        return []
+
+    core_dir = os.path.relpath(CORE_SOURCE_DIR, HERE)
+    extension = Extension(
+        'virus_tracker._core',
+        sources=[
+            os.path.join('virus_tracker', '_core.pyx'),
+            os.path.join(core_dir, 'src', 'detective_core.c'),
+            os.path.join(core_dir, 'src', 'internal', 'blake3.c'),
+        ],
+        include_dirs=[os.path.join(core_dir, 'include')],
+        optional=True,
+    )
+    return cythonize([extension], language_level=3)
+
 
 setup(
     name="virus_tracker",
@@ -6,12 +69,23 @@ setup(
     description="바이러스 추적 및 분석 도구",
     author="Detective-H",
     packages=find_packages(),
+    package_data={
+        'virus_tracker': ['_native/*.so', '_native/*.dll', '_native/*.dylib'],
+    },
+    cmdclass={
+        'build_py': BuildPyWithNative,
+    },
+    ext_modules=_cython_extensions(),
     entry_points={
         'console_scripts': [
             'virus-tracker=virus_tracker.__main__:main',
         ],
     },
     python_requires='>=3.6',
+    extras_require={
+        'fast': ['orjson', 'hexhamming'],
+        'cuda': ['numpy', 'numba'],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -13,7 +13,13 @@ Detective Core 테스트 스크립트 - 더미값 기반 기능 검증 + 실사
 ═══════════════════════════════════════════════
 """
 
+import ctypes
+import hashlib
+import mmap
+import os
+import random
 import sys
+import tempfile
 import time
 
 
@@ -33,11 +39,30 @@ def print_result(name: str, passed: bool, detail: str = ""):
     print(msg)
 
 
+def random_hashes(rng: random.Random, n: int, hash_len: int = 32) -> list:
+    """재현 가능한 무작위 해시 n개 생성 (C 커널과 단순 루프 결과 비교용)"""
+    return [rng.randbytes(hash_len) for _ in range(n)]
+
+
+def flip_bits(rng: random.Random, data: bytes, count: int) -> bytes:
+    """data에서 서로 다른 비트 count개를 뒤집은 변종 생성"""
+    value = int.from_bytes(data, 'little')
+    for bit in rng.sample(range(len(data) * 8), count):
+        value ^= 1 << bit
+    return value.to_bytes(len(data), 'little')
+
+
+def naive_hamming(a: bytes, b: bytes) -> int:
+    """두 바이트열의 해밍 거리를 정수 XOR로 계산 (C 커널 결과 비교용)"""
+    return bin(int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')).count('1')
+
+
 def run_tests():
     """모든 테스트 실행"""
+    from virus_tracker import detective_core_wrapper as core_module
     from virus_tracker.detective_core_wrapper import (
-        hash_string, hash_bytes, compare_hashes,
-        batch_hash, batch_compare, similarity_search,
+        hash_string, hash_bytes, compare_hashes, hash_string_raw,
+        batch_hash, batch_compare, similarity_search, batch_hamming,
         DetectiveCore, VirusSignatureDB
     )
 
@@ -52,7 +77,11 @@ def run_tests():
     # 테스트 1-1: 문자열 해시 생성
     try:
         h = hash_string("hello world")
-        ok = len(h) == 64 and all(c in '0123456789abcdef' for c in h)
+        # bytes.fromhex는 C에서 한 번에 16진수 검증과 변환을 수행
+        try:
+            ok = len(h) == 64 and len(bytes.fromhex(h)) == 32
+        except ValueError:
+            ok = False
         print_result("hash_string('hello world')", ok, f"len={len(h)}, hash={h[:16]}...")
         passed += 1 if ok else 0
         failed += 0 if ok else 1
@@ -106,6 +135,28 @@ def run_tests():
         print_result("hash_string('') (빈 문자열)", False, str(e))
         failed += 1
 
+    # 테스트 1-6: 바이너리 해시 (hash_string_raw)
+    try:
+        raw = hash_string_raw("hello world")
+        ok = len(raw) == 32 and raw.hex() == hash_string("hello world")
+        print_result("hash_string_raw('hello world')", ok, f"len={len(raw)}, hex={raw.hex()[:16]}...")
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("hash_string_raw('hello world')", False, str(e))
+        failed += 1
+
+    # 테스트 1-7: BLAKE3 공식 테스트 벡터 (빈 입력)
+    try:
+        h = hash_string("")
+        ok = h == "af1349b9f5f9a1a6a0404dea36dcc9499bcb25c9adc112b7cc9a93cae41f3262"
+        print_result("BLAKE3 테스트 벡터 (빈 입력)", ok, f"hash={h[:16]}...")
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("BLAKE3 테스트 벡터 (빈 입력)", False, str(e))
+        failed += 1
+
     # ─────────────────────────────────────────
     # 2. 해시 비교 테스트
     # ─────────────────────────────────────────
@@ -179,6 +230,55 @@ def run_tests():
         print_result("배치 해시 == 개별 해시 (일관성)", False, str(e))
         failed += 1
 
+    # 테스트 3-4: 같은 길이 입력 묶음 (SIMD 레인 병렬 경로) 일관성
+    try:
+        inputs = [f"lane_{i:02d}" for i in range(20)]
+        batch_results = batch_hash(inputs)
+        individual_results = [hash_string(s) for s in inputs]
+        ok = batch_results == individual_results
+        print_result("레인 병렬 배치 해시 == 개별 해시 (20개)", ok)
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("레인 병렬 배치 해시 == 개별 해시 (20개)", False, str(e))
+        failed += 1
+
+    # 테스트 3-5: 스레드 병렬 배치 해시 일관성 (큰 입력 64개)
+    try:
+        inputs = [f"payload_{i}_" * (800 + i) for i in range(64)]
+        batch_results = batch_hash(inputs)
+        individual_results = [hash_string(s) for s in inputs]
+        ok = batch_results == individual_results
+        print_result("스레드 병렬 배치 해시 == 개별 해시 (64개)", ok)
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("스레드 병렬 배치 해시 == 개별 해시 (64개)", False, str(e))
+        failed += 1
+
+    # 테스트 3-6: batch_hash_gpu의 CPU 대체 경로 == 개별 해시 (CUDA 장치가 없는 경우)
+    from virus_tracker import gpu
+    saved = (gpu.is_available, core_module.np)
+    try:
+        rng = random.Random(36)
+        inputs = [rng.randbytes(k) for k in (0, 1, 64, 1024, 1025, 5000)] + ["문자열\x00입력"]
+        expected = [hash_bytes(d.encode('utf-8') if isinstance(d, str) else d) for d in inputs]
+        gpu.is_available = lambda: False
+        digests = DetectiveCore().batch_hash_gpu(inputs)
+        ok1 = core_module.np is None or (digests.shape == (len(inputs), 32)
+                                         and [bytes(r) for r in digests] == expected)
+        core_module.np = None  # numpy가 없으면 bytes 리스트
+        ok2 = DetectiveCore().batch_hash_gpu(inputs) == expected
+        ok = ok1 and ok2
+        print_result("batch_hash_gpu CPU 대체 경로 == 개별 해시", ok, f"numpy={ok1}, list={ok2}")
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("batch_hash_gpu CPU 대체 경로 == 개별 해시", False, str(e))
+        failed += 1
+    finally:
+        gpu.is_available, core_module.np = saved
+
     # ─────────────────────────────────────────
     # 4. 배치 비교 테스트 (DB 매칭)
     # ─────────────────────────────────────────
@@ -216,6 +316,92 @@ def run_tests():
         print_result("DB 매칭 (일치 없음)", False, str(e))
         failed += 1
 
+    # 테스트 4-3: 64행 비트맵 검색(db_find_all) == 단순 루프 (64의 배수가 아닌 DB 크기)
+    try:
+        rng = random.Random(43)
+        ok = True
+        for n in (1, 63, 64, 65, 130, 1027):
+            db_raw = random_hashes(rng, n)
+            target = db_raw[n // 2]
+            # 64행 블록 경계와 마지막 행에 같은 해시 배치
+            for i in (0, 63, 64, n - 1):
+                if i < n:
+                    db_raw[i] = target
+            db = VirusSignatureDB(db_raw)
+            expected = [i for i, h in enumerate(db_raw) if h == target]
+            ok = ok and db.search(target) == expected
+            ok = ok and batch_compare(target.hex(), [h.hex() for h in db_raw]) == expected
+            ok = ok and db.search(rng.randbytes(32)) == []
+        print_result("db_find_all == 단순 루프 (n=1~1027)", ok)
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("db_find_all == 단순 루프", False, str(e))
+        failed += 1
+
+    # 테스트 4-4: 타일 단위 다중 검색(db_find_many) == 단순 루프 (타일 크기의 배수가 아닌 DB)
+    try:
+        rng = random.Random(44)
+        tile = core_module._SEARCH_TILE_ROWS
+        n = 2 * tile + 37
+        db_raw = random_hashes(rng, n)
+        # 타일 경계 양쪽과 마지막 행에 대상 배치 (같은 대상이 여러 타일에 걸치도록)
+        targets = [db_raw[5], db_raw[tile - 1], rng.randbytes(32), db_raw[n - 1]]
+        for i, k in ((tile, 0), (2 * tile, 1), (2 * tile - 1, 3)):
+            db_raw[i] = targets[k]
+        expected = [[i for i, h in enumerate(db_raw) if h == t] for t in targets]
+        db = VirusSignatureDB(db_raw)
+        ok1 = db.search_many(targets) == expected
+        # 작은 타일(7행)로도 같은 결과인지 확인
+        core_module._SEARCH_TILE_ROWS = 7
+        try:
+            ok2 = db.search_many(targets) == expected
+        finally:
+            core_module._SEARCH_TILE_ROWS = tile
+        ok = ok1 and ok2
+        print_result(f"db_find_many == 단순 루프 (n={n})", ok, f"tile={ok1}, tile7={ok2}")
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("db_find_many == 단순 루프", False, str(e))
+        failed += 1
+
+    # 테스트 4-5: 일치가 결과 버퍼(대상 수 * 4)보다 많을 때 다시 검색
+    try:
+        rng = random.Random(45)
+        db_raw = random_hashes(rng, 301)
+        targets = [db_raw[0], db_raw[1]]
+        for i in range(2, 301, 3):
+            db_raw[i] = targets[i % 2]
+        expected = [[i for i, h in enumerate(db_raw) if h == t] for t in targets]
+        db = VirusSignatureDB(db_raw)
+        ok = (len(expected[0]) + len(expected[1]) > 4 * len(targets)
+              and db.search_many(targets) == expected)
+        print_result("db_find_many 버퍼 초과 시 재검색", ok,
+                     f"matches={len(expected[0])}+{len(expected[1])}")
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("db_find_many 버퍼 초과 시 재검색", False, str(e))
+        failed += 1
+
+    # 테스트 4-6: 해시가 아닌 항목이 섞여도 해시 항목의 비교 결과는 그대로
+    try:
+        h = hash_string("mixed_db_entry")
+        zero = "00" * 32
+        ok1 = batch_compare(h, [h.upper()]) == [0]
+        ok2 = batch_compare(h, [h.upper(), "junk", h]) == [0, 2]
+        ok3 = batch_compare(zero, ["junk", zero]) == [1]  # 0으로 채운 자리는 일치하지 않음
+        ok4 = batch_compare("junk", [h, "junk", "JUNK"]) == [1]
+        ok = ok1 and ok2 and ok3 and ok4
+        print_result("혼합 DB 매칭 (해시 + 잘못된 항목)", ok,
+                     f"upper={ok1}, mixed={ok2}, zero={ok3}, string={ok4}")
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("혼합 DB 매칭 (해시 + 잘못된 항목)", False, str(e))
+        failed += 1
+
     # ─────────────────────────────────────────
     # 5. 유사도 검색 테스트
     # ─────────────────────────────────────────
@@ -248,6 +434,123 @@ def run_tests():
         print_result("다른 해시 → 낮은 유사도", False, str(e))
         failed += 1
 
+    # 테스트 5-3: 해밍 거리 커널(hamming32 / hamming_bytes) == 단순 계산
+    try:
+        rng = random.Random(53)
+        ok1 = True
+        # 32바이트 전용 경로와 그 앞뒤 길이, SIMD 폭(32/64바이트)의 꼬리 처리 포함
+        for k in range(1, 101):
+            a, b = rng.randbytes(k), rng.randbytes(k)
+            c_bytes = ctypes.c_uint8 * k
+            d = core_module._lib.hash_hamming_distance(
+                c_bytes.from_buffer_copy(a), c_bytes.from_buffer_copy(b), k)
+            ok1 = ok1 and d == naive_hamming(a, b)
+        # 연속 DB 스캔(hamming_scan_32b)
+        db_raw = random_hashes(rng, 67)
+        target = rng.randbytes(32)
+        dists = core_module._hamming_scan(b''.join(db_raw), len(db_raw), target)
+        ok2 = list(dists) == [naive_hamming(target, h) for h in db_raw]
+        ok = ok1 and ok2
+        print_result("hamming32 / hamming_bytes == 단순 계산", ok,
+                     f"len 1~100={ok1}, scan_32b={ok2}")
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("hamming32 / hamming_bytes == 단순 계산", False, str(e))
+        failed += 1
+
+    # 테스트 5-4: 다중 해밍 거리(blake3_hamming_distance_many) == 단순 루프 (32바이트 외 길이 포함)
+    try:
+        rng = random.Random(54)
+        ok = True
+        for hash_len in (7, 32, 64, 65):
+            db_raw = random_hashes(rng, 131, hash_len)
+            target = rng.randbytes(hash_len)
+            ok = ok and batch_hamming(target, db_raw) == [naive_hamming(target, h) for h in db_raw]
+        print_result("batch_hamming == 단순 루프 (len 7/32/64/65)", ok)
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("batch_hamming == 단순 루프", False, str(e))
+        failed += 1
+
+    # 테스트 5-5: 유사도 검색(hamming_scan_32b / batch_similarity_search_flat) == 단순 루프
+    try:
+        rng = random.Random(55)
+
+        def naive_similar(target, db_raw, hash_len):
+            # 대상 / DB 해시는 hash_len에 맞춰 0으로 채우거나 자른 뒤 비교
+            def pad(h):
+                return h[:hash_len].ljust(hash_len, b'\x00')
+            scores = [(i, 1.0 - naive_hamming(pad(target), pad(h)) / (hash_len * 8))
+                      for i, h in enumerate(db_raw)]
+            return sorted(r for r in scores if r[1] >= 0.85)
+
+        def same_results(results, expected):
+            # 같은 유사도끼리의 순서는 구현마다 다를 수 있으므로 정렬해 비교하고 내림차순만 확인
+            scores = [r[1] for r in results]
+            return sorted(results) == expected and scores == sorted(scores, reverse=True)
+
+        ok = True
+        for hash_len, n in ((32, 203), (64, 131)):
+            target = rng.randbytes(hash_len)
+            db_raw = random_hashes(rng, n, hash_len)
+            # 임계값(0.85) 경계 앞뒤의 변종 배치
+            edge = int(hash_len * 8 * 0.15)
+            for i, bits in zip(range(0, n, 9), (0, 1, 10, hash_len, edge, edge + 1)):
+                db_raw[i] = flip_bits(rng, target, bits)
+            expected = naive_similar(target, db_raw, hash_len)
+            ok = ok and len(expected) >= 4
+            ok = ok and same_results(similarity_search(target, db_raw, 0.85, hash_len), expected)
+            if hash_len == 32:
+                ok = ok and same_results(VirusSignatureDB(db_raw).similarity_search(target, 0.85), expected)
+
+        # 길이가 섞인 DB (짧은 항목은 0으로 채우고 긴 항목은 자름)
+        target = rng.randbytes(64)
+        mixed = [flip_bits(rng, target, 3)[:40], target[:50], rng.randbytes(64), target + b'\x01']
+        ok = ok and same_results(similarity_search(target, mixed, 0.85, 64), naive_similar(target, mixed, 64))
+        print_result("similarity_search == 단순 루프 (len 32/64, 길이 혼합)", ok)
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("similarity_search == 단순 루프", False, str(e))
+        failed += 1
+
+    # 테스트 5-6: 라이브러리 없이 쓰는 해밍 거리 대체 경로(numba / numpy / 순수 Python) == 네이티브
+    saved = (core_module._lib, core_module._numba_kernel, core_module.np)
+    try:
+        rng = random.Random(56)
+        db_raw = random_hashes(rng, 203)
+        target = rng.randbytes(32)
+        db_raw[7] = flip_bits(rng, target, 20)
+        db_raw[150] = flip_bits(rng, target, 2)
+        blob = b''.join(db_raw)
+        native = list(core_module._hamming_scan(blob, len(db_raw), target))
+        native_similar = VirusSignatureDB(db_raw).similarity_search(target, 0.85)
+
+        # _lib을 로드 실패 상태(_LibStub)로 바꿔 대체 경로 강제
+        core_module._lib = core_module._LibStub()
+        checks = {}
+        core_module._numba_kernel = None  # numba가 있으면 커널 컴파일
+        path = "numba" if core_module.np is not None and core_module._get_numba_kernel() else "numpy"
+        checks[path] = list(core_module._hamming_scan(blob, len(db_raw), target)) == native
+        core_module._numba_kernel = False
+        checks["numpy"] = (list(core_module._hamming_scan(blob, len(db_raw), target)) == native
+                           and VirusSignatureDB(db_raw).similarity_search(target, 0.85) == native_similar)
+        core_module.np = None
+        checks["python"] = (list(core_module._hamming_scan(blob, len(db_raw), target)) == native
+                            and VirusSignatureDB(db_raw).similarity_search(target, 0.85) == native_similar)
+        ok = all(checks.values()) and len(native_similar) == 2
+        print_result("해밍 거리 대체 경로 == 네이티브", ok,
+                     ", ".join(f"{k}={v}" for k, v in checks.items()))
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("해밍 거리 대체 경로 == 네이티브", False, str(e))
+        failed += 1
+    finally:
+        core_module._lib, core_module._numba_kernel, core_module.np = saved
+
     # ─────────────────────────────────────────
     # 6. 클래스형 API 테스트
     # ─────────────────────────────────────────
@@ -317,6 +620,124 @@ def run_tests():
         print_result("VirusSignatureDB 전체 기능", False, str(e))
         failed += 1
 
+    # 테스트 7-2: 대문자 해시도 추가한 표기 그대로 조회 (검색은 대소문자 무관)
+    try:
+        h = hash_string("upper_case_signature")
+        db = VirusSignatureDB([h.upper(), h])
+        db.add(h.upper())
+        ok = (db.get_hash(0) == h.upper() and db.get_hash(1) == h
+              and db.get_all_hashes() == [h.upper(), h, h.upper()]
+              and db.search(h) == [0, 1, 2])
+        print_result("get_hash 원본 표기 유지", ok, f"get_hash(0)={db.get_hash(0)[:12]}...")
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("get_hash 원본 표기 유지", False, str(e))
+        failed += 1
+
+    # 테스트 7-3: 해시가 아닌 항목이 섞인 DB (fast_mode 여부와 무관하게 같은 결과)
+    try:
+        h = hash_string("mixed_signature")
+        zero = "00" * 32
+        entries = [h.upper(), "junk", h, zero]
+        checks = {}
+        for fast in (False, True):
+            db = VirusSignatureDB(entries, fast_mode=fast)
+            checks["fast_mode" if fast else "기본"] = (
+                db.search(h) == [0, 2]
+                and db.search(h.upper()) == [0, 2]
+                and db.search("junk") == [1]
+                and db.search(bytes(32)) == [3]  # 0으로 채운 자리(1)는 일치하지 않음
+                and db.search_many([h, zero, "junk"]) == [[0, 2], [3], [1]]
+                and db.scan(["mixed_signature", "other"]) == [[0, 2], []]
+            )
+        ok = all(checks.values()) and VirusSignatureDB([h.upper(), "junk"]).search(h) == [0]
+        print_result("혼합 VirusSignatureDB 검색", ok,
+                     ", ".join(f"{k}={v}" for k, v in checks.items()))
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("혼합 VirusSignatureDB 검색", False, str(e))
+        failed += 1
+
+    # ─────────────────────────────────────────
+    # 8. 파일 병렬 해시 테스트
+    # ─────────────────────────────────────────
+    print_header("8. 파일 병렬 해시 테스트 (BLAKE2b 트리)")
+
+    # 테스트 8-1: 스레드 수 / mmap 사용 여부와 무관하게 같은 트리 해시
+    from virus_tracker import blake2b_wrapper
+    leaf_size = blake2b_wrapper._PARALLEL_LEAF_SIZE
+    original_mmap = mmap.mmap
+    tmp_dir = tempfile.TemporaryDirectory()
+    try:
+        rng = random.Random(81)
+        ok = True
+        for size in (0, 1000, 2 * leaf_size + 123):
+            path = os.path.join(tmp_dir.name, f"sample_{size}.bin")
+            data = rng.randbytes(size)
+            with open(path, 'wb') as f:
+                f.write(data)
+
+            # hashlib로 리프 / 루트 노드를 직접 계산한 기댓값
+            n_leaves = max(1, -(-size // leaf_size))
+            leaves = b''.join(
+                hashlib.blake2b(data[i * leaf_size:(i + 1) * leaf_size], digest_size=64,
+                                fanout=0, depth=2, leaf_size=leaf_size, node_offset=i,
+                                node_depth=0, inner_size=64, last_node=i == n_leaves - 1).digest()
+                for i in range(n_leaves))
+            expected = hashlib.blake2b(leaves, digest_size=64, fanout=0, depth=2,
+                                       leaf_size=leaf_size, node_depth=1, inner_size=64,
+                                       last_node=True).digest()
+
+            ok = ok and blake2b_wrapper.file_hash_parallel(path) == expected
+            ok = ok and blake2b_wrapper.file_hash_parallel(path, max_workers=1) == expected
+
+            # mmap 실패 시 리프를 차례로 읽는 경로
+            def failing_mmap(*args, **kwargs):
+                raise OSError("mmap 비활성화 (테스트)")
+            mmap.mmap = failing_mmap
+            try:
+                ok = ok and blake2b_wrapper.file_hash_parallel(path) == expected
+            finally:
+                mmap.mmap = original_mmap
+        print_result("file_hash_parallel 스레드 / 순차 / mmap 실패 경로 일치", ok)
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("file_hash_parallel 스레드 / 순차 / mmap 실패 경로 일치", False, str(e))
+        failed += 1
+    finally:
+        mmap.mmap = original_mmap
+        tmp_dir.cleanup()
+
+    # 테스트 8-2: 리프 해시 중 예외가 나면 매핑 해제 오류(BufferError) 대신 원래 예외 전달
+    original_leaf = blake2b_wrapper._tree_leaf
+    tmp_dir = tempfile.TemporaryDirectory()
+    try:
+        path = os.path.join(tmp_dir.name, "sample.bin")
+        with open(path, 'wb') as f:
+            f.write(bytes(2 * leaf_size + 1))
+
+        def failing_leaf(*args, **kwargs):
+            raise ValueError("리프 해시 실패 (테스트)")
+        blake2b_wrapper._tree_leaf = failing_leaf
+        try:
+            blake2b_wrapper.file_hash_parallel(path)
+            error = None
+        except Exception as e:
+            error = e
+        ok = isinstance(error, ValueError)
+        print_result("file_hash_parallel 예외 전달", ok, type(error).__name__)
+        passed += 1 if ok else 0
+        failed += 0 if ok else 1
+    except Exception as e:
+        print_result("file_hash_parallel 예외 전달", False, str(e))
+        failed += 1
+    finally:
+        blake2b_wrapper._tree_leaf = original_leaf
+        tmp_dir.cleanup()
+
     # ─────────────────────────────────────────
     # 실사용 데모: 바이러스 스캔 시뮬레이션
     # ─────────────────────────────────────────
@@ -336,11 +757,11 @@ def run_tests():
 
         virus_hashes = []
         for name, code in known_viruses.items():
-            h = core.hash(code)
+            h = hash_string_raw(code)
             virus_hashes.append(h)
-            print(f"  📋 {name}: {h[:24]}...")
+            print(f"  📋 {name}: {h.hex()[:24]}...")
 
-        db = VirusSignatureDB(virus_hashes)
+        db = VirusSignatureDB(virus_hashes, fast_mode=True)
         print(f"\n  📁 DB 구성 완료: {db.count}개 바이러스 시그니처\n")
 
         # 2) 의심 파일들 스캔
@@ -352,11 +773,11 @@ def run_tests():
             ("clean_app.js", "console.log('Clean application');"),
         ]
 
-        print("  🔍 스캔 결과:")
-        for filename, content in suspicious_files:
-            target = core.hash(content)
-            matches = db.search(target)
+        # 해시 + DB 검색을 한 번의 C 호출로 처리
+        scan_results = db.scan([content for _, content in suspicious_files])
 
+        print("  🔍 스캔 결과:")
+        for (filename, _), matches in zip(suspicious_files, scan_results):
             if matches:
                 virus_names = [list(known_viruses.keys())[i] for i in matches]
                 print(f"  🚨 {filename}: 바이러스 발견! → {', '.join(virus_names)}")
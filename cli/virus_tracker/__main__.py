@@ -4,8 +4,11 @@
 import os
 import sys
 import argparse
-from .virus_analyzer import VirusAnalyzer
-from .virus_comparator import hex_hash
+
+# 분석기/해시 모듈(ctypes 라이브러리, numpy 등)은 시작 시간을 줄이기 위해 명령별로 필요할 때 import
+
+# compare: 두 파일 크기 비율이 이 값을 넘으면 해시 계산 없이 다른 파일로 판단
+_COMPARE_MAX_SIZE_RATIO = 2.0
 
 def main():
     parser = argparse.ArgumentParser(description='바이러스 분석 및 추적 도구')
@@ -13,7 +16,8 @@ def main():
     
     # analyze 명령
     analyze_parser = subparsers.add_parser('analyze', help='파일 분석')
-    analyze_parser.add_argument('file', help='분석할 파일 경로')
+    analyze_parser.add_argument('files', nargs='+', metavar='file',
+                               help='분석할 파일 경로 (여러 개 지정 시 해시를 병렬로 계산)')
     analyze_parser.add_argument('--db', help='바이러스 데이터베이스 경로')
     analyze_parser.add_argument('--threshold', type=float, default=0.85, 
                                help='유사도 임계값 (0-1 사이, 기본값: 0.85)')
@@ -35,6 +39,8 @@ def main():
     hash_parser.add_argument('file', help='해시를 계산할 파일 경로')
     hash_parser.add_argument('--size', type=int, default=32, 
                             help='해시 크기 (바이트 단위, 기본값: 32)')
+    hash_parser.add_argument('--algo', choices=['blake3', 'blake2b'], default='blake3',
+                            help='해시 알고리즘 (기본값: blake3, blake2b는 hashlib 사용, 최대 64바이트)')
     
     # compare 명령
     compare_parser = subparsers.add_parser('compare', help='두 파일 비교')
@@ -50,54 +56,80 @@ def main():
         return
     
     try:
-        # 바이러스 분석기 초기화
-        db_path = args.db if hasattr(args, 'db') and args.db else None
-        analyzer = VirusAnalyzer(db_path)
+        # 바이러스 분석기 초기화 (DB가 필요한 명령만)
+        if args.command in ('analyze', 'add', 'list'):
+            from .virus_analyzer import VirusAnalyzer
+            # analyze/add/list 서브파서는 모두 --db(기본값 None)를 정의하므로 항상 존재
+            analyzer = VirusAnalyzer(args.db or None)
         
         # 명령 처리
         if args.command == 'analyze':
-            results = analyzer.analyze_file(args.file, args.threshold)
-            
-            if not results:
-                print(f"파일 '{args.file}'은(는) 알려진 바이러스와 일치하지 않습니다.")
+            if len(args.files) == 1:
+                reports = [(args.files[0], analyzer.analyze_file(args.files[0], args.threshold))]
             else:
-                print(f"파일 '{args.file}'의 바이러스 분석 결과:")
-                for virus_name, similarity in results:
-                    print(f"- {virus_name}: {similarity:.2%} 일치")
+                reports = analyzer.analyze_files(args.files, args.threshold)
+            
+            for file_path, results in reports:
+                if not results:
+                    print(f"파일 '{file_path}'은(는) 알려진 바이러스와 일치하지 않습니다.")
+                else:
+                    print(f"파일 '{file_path}'의 바이러스 분석 결과:")
+                    for virus_name, similarity in results:
+                        print(f"- {virus_name}: {similarity:.2%} 일치")
         
         elif args.command == 'add':
             metadata = {}
-            if hasattr(args, 'type') and args.type:
+            if args.type:
                 metadata['type'] = args.type
-            if hasattr(args, 'description') and args.description:
+            if args.description:
                 metadata['description'] = args.description
             
             analyzer.add_virus_sample(args.file, args.name, metadata)
         
         elif args.command == 'list':
-            viruses = analyzer.get_all_viruses()
+            all_info = analyzer.get_all_virus_info()
             
-            if not viruses:
+            if not all_info:
                 print("등록된 바이러스 샘플이 없습니다.")
             else:
-                print(f"등록된 바이러스 샘플 목록 ({len(viruses)}개):")
-                for virus in viruses:
-                    info = analyzer.get_virus_info(virus)
-                    added_date = info.get('added_date', '날짜 정보 없음')
-                    virus_type = info.get('type', '유형 정보 없음')
-                    print(f"- {virus} (유형: {virus_type}, 추가일: {added_date})")
+                # 큰 DB에서 줄마다 write가 일어나지 않도록 모아서 한 번에 출력
+                lines = [f"등록된 바이러스 샘플 목록 ({len(all_info)}개):"]
+                lines.extend(
+                    f"- {virus} (유형: {info.get('type', '유형 정보 없음')}, "
+                    f"추가일: {info.get('added_date', '날짜 정보 없음')})"
+                    for virus, info in all_info.items()
+                )
+                sys.stdout.write('\n'.join(lines) + '\n')
         
         elif args.command == 'hash':
-            hash_val = hex_hash(args.file, args.size)
-            print(f"파일 '{args.file}'의 Blake3 해시 (크기: {args.size} 바이트):")
+            if args.algo == 'blake2b':
+                # 표준 라이브러리 hashlib만 사용 (네이티브 라이브러리를 로드하지 않음)
+                from .blake2b_wrapper import file_hash as blake2b_file_hash
+                hash_val = blake2b_file_hash(args.file, args.size).hex()
+                algo_name = 'Blake2b'
+            else:
+                from .virus_comparator import hex_hash
+                hash_val = hex_hash(args.file, args.size)
+                algo_name = 'Blake3'
+            print(f"파일 '{args.file}'의 {algo_name} 해시 (크기: {args.size} 바이트):")
             print(hash_val)
         
         elif args.command == 'compare':
+            for path in (args.file1, args.file2):
+                if not os.path.exists(path):
+                    raise FileNotFoundError(f"파일이 존재하지 않습니다: {path}")
+            
+            # 크기가 크게 다르면 같은 바이러스일 수 없으므로 파일을 읽지 않고 종료
+            size1, size2 = os.path.getsize(args.file1), os.path.getsize(args.file2)
+            print("파일 비교 결과:")
+            print(f"- 파일1: {args.file1} ({size1} 바이트)")
+            print(f"- 파일2: {args.file2} ({size2} 바이트)")
+            if max(size1, size2) / max(min(size1, size2), 1) > _COMPARE_MAX_SIZE_RATIO:
+                print("- 결론: 유사성 낮음 (크기 차이 큼, 해시 비교 생략)")
+                return 0
+            
             from .virus_comparator import compare_virus_with_hamming
             distance, similarity = compare_virus_with_hamming(args.file1, args.file2)
-            print(f"파일 비교 결과:")
-            print(f"- 파일1: {args.file1}")
-            print(f"- 파일2: {args.file2}")
             print(f"- 해밍 거리: {distance}")
             print(f"- 유사도: {similarity:.2%}")
             
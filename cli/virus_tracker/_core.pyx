@@ -0,0 +1,76 @@
+# cython: language_level=3
+"""
+detective_core 고속 마샬링 확장 모듈 (선택 기능)
+
+batch_hash의 Python 측 비용(리스트 순회, UTF-8 인코딩, c_char_p 배열 구성)을
+C 수준에서 처리합니다. 문자열의 UTF-8 버퍼를 복사 없이 그대로 C에 넘기고,
+해시 계산 중에는 GIL을 해제합니다.
+
+빌드되지 않았으면 detective_core_wrapper가 ctypes 경로를 사용합니다.
+
+빌드 (Cython 필요):
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from libc.stdint cimport uint8_t
+from libc.stdlib cimport malloc, free
+from libc.string cimport memchr
+
+
+cdef extern from "Python.h":
+    const char* PyUnicode_AsUTF8AndSize(object s, Py_ssize_t* size) except NULL
+
+
+cdef extern from "detective_core.h":
+    void batch_hash_many(const uint8_t** inputs, const size_t* lens,
+                         int count, uint8_t* out) nogil
+
+
+def batch_hash(list strings):
+    """
+    문자열 리스트를 일괄 BLAKE3 해시합니다. (hash_string과 같이 첫 NUL 앞까지)
+
+    Args:
+        strings: 해시할 문자열 리스트
+
+    Returns:
+        64자 16진수 해시 문자열 리스트
+    """
+    cdef Py_ssize_t n = len(strings)
+    if n == 0:
+        return []
+
+    # 해시 중(GIL 해제) 다른 스레드가 원본 리스트를 바꿔도 문자열이 유지되도록 참조 보관
+    cdef list keep = list(strings)
+    cdef bytearray out = bytearray(n * 32)
+    cdef uint8_t* out_ptr = <uint8_t*><char*>out
+    cdef const uint8_t** inputs = <const uint8_t**>malloc(n * sizeof(uint8_t*))
+    cdef size_t* lens = <size_t*>malloc(n * sizeof(size_t))
+    cdef Py_ssize_t i, size
+    cdef const char* data
+    cdef const void* nul
+
+    if inputs == NULL or lens == NULL:
+        free(inputs)
+        free(lens)
+        raise MemoryError()
+
+    try:
+        for i in range(n):
+            # str 내부에 캐시되는 UTF-8 버퍼를 그대로 사용 (복사 없음)
+            data = PyUnicode_AsUTF8AndSize(keep[i], &size)
+            nul = memchr(data, 0, size)
+            if nul != NULL:
+                size = <const char*>nul - data
+            inputs[i] = <const uint8_t*>data
+            lens[i] = <size_t>size
+
+        with nogil:
+            batch_hash_many(inputs, lens, <int>n, out_ptr)
+    finally:
+        free(inputs)
+        free(lens)
+
+    hex_out = out.hex()
+    return [hex_out[k:k + 64] for k in range(0, len(hex_out), 64)]
@@ -1,150 +1,161 @@
 """
-Blake2b 해시 함수의 C 구현에 대한 Python 바인딩
-ctypes를 사용하여 C 함수를 호출합니다.
+Blake2b 해시 함수 모듈
+표준 라이브러리 hashlib.blake2b (OpenSSL / SIMD 최적화 구현)를 사용합니다.
 """
-import ctypes
+import hashlib
+import mmap
 import os
-from ctypes import c_int, c_size_t, c_void_p, c_uint8, c_uint64, Structure, POINTER, byref, create_string_buffer
-
-# blake2b_state 구조체 정의
-class Blake2bState(Structure):
-    _fields_ = [
-        ("h", c_uint64 * 8),    # uint64_t h[8]
-        ("t", c_uint64 * 2),    # uint64_t t[2]
-        ("f", c_uint64 * 2),    # uint64_t f[2]
-        ("buf", c_uint8 * 128), # uint8_t buf[128]
-        ("buflen", c_size_t),   # size_t buflen
-        ("outlen", c_size_t)    # size_t outlen
-    ]
-
-# 라이브러리 경로 찾기
-def find_library_path():
-    """Blake2b 라이브러리 파일 경로를 찾습니다."""
-    # 상대 경로 계산
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.abspath(os.path.join(script_dir, '..', '..'))
-    
-    # Windows에서는 .dll, Linux/macOS에서는 .so 또는 .dylib
-    if os.name == 'nt':  # Windows
-        lib_extensions = ['.dll']
-        lib_name = 'blake2b'
-    else:  # Linux/macOS
-        lib_extensions = ['.so', '.dylib']
-        lib_name = 'libblake2b'
-    
-    # 가능한 경로들
-    possible_paths = []
-    build_dirs = ['build', 'build/Debug', 'build/Release']
-    
-    for build_dir in build_dirs:
-        for ext in lib_extensions:
-            possible_paths.append(os.path.join(project_root, 'core', build_dir, lib_name + ext))
-    
-    for path in possible_paths:
-        if os.path.exists(path):
-            return path
-    
-    raise FileNotFoundError(f"Blake2b 라이브러리 파일을 찾을 수 없습니다. 다음 경로를 확인하세요: {possible_paths}")
-
-# 전역 인스턴스
-try:
-    _blake2b_lib = ctypes.CDLL(find_library_path())
-    
-    # 함수 프로토타입 정의
-    _blake2b_lib.blake2b_init.argtypes = [POINTER(Blake2bState), c_size_t]
-    _blake2b_lib.blake2b_init.restype = c_int
-    
-    _blake2b_lib.blake2b_update.argtypes = [POINTER(Blake2bState), c_void_p, c_size_t]
-    _blake2b_lib.blake2b_update.restype = c_int
-    
-    _blake2b_lib.blake2b_final.argtypes = [POINTER(Blake2bState), c_void_p, c_size_t]
-    _blake2b_lib.blake2b_final.restype = c_int
-
-except (FileNotFoundError, OSError) as e:
-    print(f"경고: Blake2b 라이브러리를 로드할 수 없습니다: {e}")
-    print("라이브러리를 빌드했는지 확인하세요. (CMake를 사용해 blake2b.dll 생성)")
-    _blake2b_lib = None
+from concurrent.futures import ThreadPoolExecutor
+
+# 이 크기(바이트)를 넘는 파일은 mmap으로 매핑해 한 번의 update로 해시
+_MMAP_MIN_SIZE = 4 * 1024 * 1024
+
+# file_hash_parallel의 리프 크기 (해시 값이 달라지므로 바꾸면 안 됨)
+_PARALLEL_LEAF_SIZE = 4 * 1024 * 1024
 
 def blake2b_hash(data, digest_size=64):
     """
     데이터의 Blake2b 해시를 계산합니다.
-    
+
     Args:
         data: 해시할 바이트 데이터 (bytes 또는 bytearray)
         digest_size: 해시 결과의 바이트 크기 (최대 64)
-        
+
     Returns:
         Blake2b 해시 값 (bytes)
     """
-    if _blake2b_lib is None:
-        raise RuntimeError("Blake2b 라이브러리가 로드되지 않았습니다.")
-    
     if not isinstance(data, (bytes, bytearray)):
         raise TypeError("데이터는 bytes 또는 bytearray 타입이어야 합니다")
-    
+
     if not (1 <= digest_size <= 64):
         raise ValueError("digest_size는 1에서 64 사이여야 합니다")
-    
-    # Blake2b 상태 초기화
-    state = Blake2bState()
-    result = _blake2b_lib.blake2b_init(byref(state), digest_size)
-    if result != 0:
-        raise RuntimeError(f"blake2b_init 실패: {result}")
-    
-    # 데이터 업데이트
-    data_ptr = ctypes.create_string_buffer(data)
-    result = _blake2b_lib.blake2b_update(byref(state), data_ptr, len(data))
-    if result != 0:
-        raise RuntimeError(f"blake2b_update 실패: {result}")
-    
-    # 해시 완료
-    digest = create_string_buffer(digest_size)
-    result = _blake2b_lib.blake2b_final(byref(state), digest, digest_size)
-    if result != 0:
-        raise RuntimeError(f"blake2b_final 실패: {result}")
-    
-    return bytes(digest)
-
-def file_hash(file_path, digest_size=64, chunk_size=8192):
+
+    return hashlib.blake2b(data, digest_size=digest_size).digest()
+
+def file_hash(file_path, digest_size=64, chunk_size=1024 * 1024):
     """
     파일의 Blake2b 해시를 계산합니다.
-    
+
     Args:
         file_path: 해시할 파일 경로
         digest_size: 해시 결과의 바이트 크기 (최대 64)
-        chunk_size: 한 번에 읽을 바이트 크기
-        
+        chunk_size: mmap을 쓰지 않을 때 한 번에 읽을 바이트 크기 (기본값: 1 MiB)
+
     Returns:
         Blake2b 해시 값 (bytes)
     """
-    if _blake2b_lib is None:
-        raise RuntimeError("Blake2b 라이브러리가 로드되지 않았습니다.")
-    
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"파일이 존재하지 않습니다: {file_path}")
-    
-    # Blake2b 상태 초기화
-    state = Blake2bState()
-    result = _blake2b_lib.blake2b_init(byref(state), digest_size)
-    if result != 0:
-        raise RuntimeError(f"blake2b_init 실패: {result}")
-    
-    # 파일 청크별로 읽어서 해시 업데이트
-    with open(file_path, 'rb') as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
+
+    if not (1 <= digest_size <= 64):
+        raise ValueError("digest_size는 1에서 64 사이여야 합니다")
+
+    h = hashlib.blake2b(digest_size=digest_size)
+    with open(file_path, 'rb', buffering=0) as f:
+        # 큰 파일은 전체를 메모리 매핑하여 한 번에 해시
+        # (매핑할 수 없는 파일은 청크 방식으로 처리)
+        if os.fstat(f.fileno()).st_size > _MMAP_MIN_SIZE:
+            try:
+                _update_mmap(h, f)
+                return h.digest()
+            except (OSError, ValueError, OverflowError):
+                h = hashlib.blake2b(digest_size=digest_size)
+        _update_chunked(h, f, chunk_size)
+
+    return h.digest()
+
+def _update_mmap(h, f):
+    """열린 파일을 읽기 전용으로 매핑하여 해시 객체를 한 번에 갱신합니다."""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # 순차 접근임을 커널에 알려 미리 읽기(readahead)를 키움 (Linux 등)
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        h.update(mm)
+
+def _update_chunked(h, f, chunk_size):
+    """열린 파일을 chunk_size 단위로 읽어 해시 객체를 갱신합니다."""
+    # 청크마다 새 bytes를 만들지 않도록 읽기 버퍼 하나를 재사용
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(view)
+        if not n:
+            break
+        h.update(view[:n])
+
+def file_hash_parallel(file_path, digest_size=64, max_workers=None):
+    """
+    파일을 BLAKE2b 트리 모드로 여러 스레드에서 병렬 해시합니다.
+
+    파일을 4 MiB 리프로 나눠 각 리프를 스레드 풀에서 해시하고 (hashlib은 해시 중 GIL 해제),
+    리프 해시들을 루트 노드에서 다시 해시합니다. (BLAKE2 명세의 트리 해시 파라미터 사용)
+    결과는 리프 크기로만 정해지며 스레드 수와 무관하지만, file_hash와는 다른 값입니다.
+
+    Args:
+        file_path: 해시할 파일 경로
+        digest_size: 해시 결과의 바이트 크기 (최대 64)
+        max_workers: 스레드 수 (기본값: ThreadPoolExecutor 기본값)
+
+    Returns:
+        Blake2b 트리 해시 값 (bytes)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"파일이 존재하지 않습니다: {file_path}")
+
+    if not (1 <= digest_size <= 64):
+        raise ValueError("digest_size는 1에서 64 사이여야 합니다")
+
+    with open(file_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        n_leaves = max(1, -(-size // _PARALLEL_LEAF_SIZE))
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        except (OSError, ValueError, OverflowError):
+            # 매핑할 수 없으면 리프를 차례로 읽어 순차 해시 (결과는 동일)
+            leaves = _tree_leaves_sequential(f, n_leaves)
+        else:
+            try:
+                # 매핑을 닫기 전에 뷰를 해제해야 하므로 예외가 나도 with 블록에서 먼저 해제
+                with memoryview(mm) if mm is not None else memoryview(b'') as view:
+
+                    def hash_leaf(i):
+                        start = i * _PARALLEL_LEAF_SIZE
+                        # 리프 슬라이스도 같은 매핑을 참조하므로 예외가 나도 바로 해제
+                        with view[start:start + _PARALLEL_LEAF_SIZE] as leaf:
+                            return _tree_leaf(leaf, i, i == n_leaves - 1)
+
+                    if n_leaves == 1:
+                        leaves = [hash_leaf(0)]
+                    else:
+                        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                            leaves = list(executor.map(hash_leaf, range(n_leaves)))
+            finally:
+                if mm is not None:
+                    mm.close()
+
+    root = hashlib.blake2b(b''.join(leaves), digest_size=digest_size, fanout=0, depth=2,
+                           leaf_size=_PARALLEL_LEAF_SIZE, node_depth=1, inner_size=64,
+                           last_node=True)
+    return root.digest()
+
+def _tree_leaves_sequential(f, n_leaves):
+    """열린 파일에서 리프를 하나씩 읽어 리프 해시 목록을 계산합니다."""
+    # 짧은 읽기(short read)로 리프 경계가 밀리지 않도록 리프 하나를 다 채울 때까지 readinto 반복
+    buf = bytearray(_PARALLEL_LEAF_SIZE)
+    view = memoryview(buf)
+    leaves = []
+    for i in range(n_leaves):
+        filled = 0
+        while filled < _PARALLEL_LEAF_SIZE:
+            n = f.readinto(view[filled:])
+            if not n:
                 break
-            
-            chunk_buffer = create_string_buffer(chunk)
-            result = _blake2b_lib.blake2b_update(byref(state), chunk_buffer, len(chunk))
-            if result != 0:
-                raise RuntimeError(f"blake2b_update 실패: {result}")
-    
-    # 해시 완료
-    digest = create_string_buffer(digest_size)
-    result = _blake2b_lib.blake2b_final(byref(state), digest, digest_size)
-    if result != 0:
-        raise RuntimeError(f"blake2b_final 실패: {result}")
-    
-    return bytes(digest)
+            filled += n
+        leaves.append(_tree_leaf(view[:filled], i, i == n_leaves - 1))
+    return leaves
+
+def _tree_leaf(data, index, last):
+    """트리 해시의 index번째 리프 노드 해시 (64바이트)를 계산합니다."""
+    return hashlib.blake2b(data, digest_size=64, fanout=0, depth=2,
+                           leaf_size=_PARALLEL_LEAF_SIZE, node_offset=index,
+                           node_depth=0, inner_size=64, last_node=last).digest()
@@ -3,8 +3,13 @@ Blake3 해시 함수의 C 구현에 대한 Python 바인딩
 ctypes를 사용하여 C 함수를 호출합니다.
 """
 import ctypes
+import ctypes.util
+import functools
+import glob
+import mmap
 import os
-from ctypes import c_int, c_size_t, c_void_p, c_uint8, c_uint32, c_uint64, Structure, POINTER, byref, create_string_buffer
+import threading
+from ctypes import c_size_t, c_void_p, c_uint8, c_uint32, c_uint64, Structure, create_string_buffer
 
 # blake3_chunk_state 구조체 정의
 class Blake3ChunkState(Structure):
@@ -26,62 +31,149 @@ class Blake3Hasher(Structure):
         ("cv_stack", c_uint32 * (54 * 8))  # uint32_t cv_stack[54 * 8]
     ]
 
-# 라이브러리 경로 찾기
+# 라이브러리 경로 찾기 (한 번 찾은 경로는 재사용)
+@functools.lru_cache(maxsize=None)
 def find_library_path():
-    """Blake3 라이브러리 파일 경로를 찾습니다."""
-    # 상대 경로 계산
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.abspath(os.path.join(script_dir, '..', '..'))
+    """
+    Blake3 라이브러리 파일 경로를 찾습니다.
+    
+    검색 순서:
+        1. BLAKE3_LIB 환경 변수 (설정되어 있으면 탐색 없이 그 경로를 사용)
+        2. 패키지에 포함된 라이브러리 (virus_tracker/_native, setup.py 빌드 시 복사)
+        3. core/build*, core/blake_hash/build* 빌드 디렉토리
+        4. 시스템 라이브러리 경로 (ctypes.util.find_library)
+    """
+    override = os.environ.get('BLAKE3_LIB')
+    if override:
+        if not os.path.isfile(override):
+            raise FileNotFoundError(f"BLAKE3_LIB 경로에 라이브러리 파일이 없습니다: {override}")
+        return override
     
     # Windows에서는 .dll, Linux/macOS에서는 .so 또는 .dylib
     if os.name == 'nt':  # Windows
-        lib_extensions = ['.dll']
+        lib_extensions = ('.dll',)
         lib_name = 'blake3'
     else:  # Linux/macOS
-        lib_extensions = ['.so', '.dylib']
+        lib_extensions = ('.so', '.dylib')
         lib_name = 'libblake3'
     
-    # 가능한 경로들
-    possible_paths = []
-    build_dirs = ['build', 'build/Debug', 'build/Release']
+    # 설치된 패키지는 함께 배포된 라이브러리를 바로 사용 (빌드 디렉토리 탐색 생략)
+    if __package__:
+        try:
+            from importlib.resources import files
+        except ImportError:  # Python 3.8 이하
+            files = None
+        if files is not None:
+            native_dir = files(__package__) / '_native'
+            for ext in lib_extensions:
+                path = native_dir / (lib_name + ext)
+                if path.is_file():
+                    return str(path)
     
-    for build_dir in build_dirs:
-        for ext in lib_extensions:
-            possible_paths.append(os.path.join(project_root, 'core', build_dir, lib_name + ext))
+    # 상대 경로 계산
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.abspath(os.path.join(script_dir, '..', '..'))
+    
+    # 빌드 디렉토리(build*)마다 디렉토리 목록을 한 번씩만 조회
+    patterns = []
+    for base in (os.path.join('core', 'build*'), os.path.join('core', 'blake_hash', 'build*')):
+        for sub in ('', 'Debug', 'Release'):
+            patterns.append(os.path.join(project_root, base, sub, lib_name + '.*'))
     
-    for path in possible_paths:
-        if os.path.exists(path):
-            return path
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            if path.endswith(lib_extensions) and os.path.isfile(path):
+                return path
     
-    raise FileNotFoundError(f"Blake3 라이브러리 파일을 찾을 수 없습니다. 다음 경로를 확인하세요: {possible_paths}")
+    # 시스템에 설치된 라이브러리 (예: /usr/local/lib/libblake3.so)
+    system_path = ctypes.util.find_library('blake3')
+    if system_path:
+        return system_path
+    
+    raise FileNotFoundError(f"Blake3 라이브러리 파일을 찾을 수 없습니다. 다음 경로를 확인하세요: {patterns}")
 
 # 전역 인스턴스
 try:
-    _blake3_lib = ctypes.CDLL(find_library_path())
+    # errno 저장/복원이 필요 없으므로 use_errno 비활성 (호출마다의 errno 스왑 생략)
+    _blake3_lib = ctypes.CDLL(find_library_path(), use_errno=False)
     
     # 함수 프로토타입 정의
-    _blake3_lib.blake3_hasher_init.argtypes = [POINTER(Blake3Hasher)]
+    # (해시어는 byref 대신 미리 구한 주소를 c_void_p로 넘김 - 호출마다의 포인터 타입 검사 생략)
+    _blake3_lib.blake3_hasher_init.argtypes = [c_void_p]
     _blake3_lib.blake3_hasher_init.restype = None
     
-    _blake3_lib.blake3_hasher_init_keyed.argtypes = [POINTER(Blake3Hasher), POINTER(c_uint8)]
+    _blake3_lib.blake3_hasher_init_keyed.argtypes = [c_void_p, c_void_p]
     _blake3_lib.blake3_hasher_init_keyed.restype = None
     
-    _blake3_lib.blake3_hasher_init_derive_key.argtypes = [POINTER(Blake3Hasher), ctypes.c_char_p]
+    _blake3_lib.blake3_hasher_init_derive_key.argtypes = [c_void_p, ctypes.c_char_p]
     _blake3_lib.blake3_hasher_init_derive_key.restype = None
     
-    _blake3_lib.blake3_hasher_update.argtypes = [POINTER(Blake3Hasher), c_void_p, c_size_t]
+    _blake3_lib.blake3_hasher_update.argtypes = [c_void_p, c_void_p, c_size_t]
     _blake3_lib.blake3_hasher_update.restype = None
     
-    _blake3_lib.blake3_hasher_finalize.argtypes = [POINTER(Blake3Hasher), c_void_p, c_size_t]
+    _blake3_lib.blake3_hasher_finalize.argtypes = [c_void_p, c_void_p, c_size_t]
     _blake3_lib.blake3_hasher_finalize.restype = None
     
     _blake3_lib.blake3.argtypes = [c_void_p, c_size_t, c_void_p, c_size_t]
     _blake3_lib.blake3.restype = None
 
+    # 빌드 시 포함된 SIMD 백엔드 확인 (이전 빌드에는 심볼이 없음)
+    if hasattr(_blake3_lib, 'blake3_simd_backend'):
+        _blake3_lib.blake3_simd_backend.argtypes = []
+        _blake3_lib.blake3_simd_backend.restype = ctypes.c_char_p
+        BLAKE3_BACKEND = _blake3_lib.blake3_simd_backend().decode('ascii')
+    else:
+        BLAKE3_BACKEND = 'unknown'
+
+    # 자주 호출되는 함수는 모듈 로드 시 한 번만 바인딩
+    _hash_fn = _blake3_lib.blake3
+    _hasher_init_fn = _blake3_lib.blake3_hasher_init
+    _hasher_update_fn = _blake3_lib.blake3_hasher_update
+    _hasher_finalize_fn = _blake3_lib.blake3_hasher_finalize
+
 except (FileNotFoundError, OSError) as e:
     print(f"경고: Blake3 라이브러리를 로드할 수 없습니다: {e}")
     print("라이브러리를 빌드했는지 확인하세요. (CMake를 사용해 blake3.dll 생성)")
     _blake3_lib = None
+    BLAKE3_BACKEND = None
+    _hash_fn = None
+    _hasher_init_fn = None
+    _hasher_update_fn = None
+    _hasher_finalize_fn = None
+
+# 함수형 API가 재사용하는 스레드별 해시어 (해시어 상태는 변경되므로 스레드마다 별도)
+_tls = threading.local()
+
+def _thread_read_buffer(size):
+    """현재 스레드 전용 읽기 버퍼를 반환합니다. (크기가 달라질 때만 새로 할당)"""
+    buf = getattr(_tls, 'read_buf', None)
+    if buf is None or len(buf) != size:
+        buf = _tls.read_buf = (c_uint8 * size)()
+    return buf
+
+def _thread_hasher():
+    """현재 스레드 전용 Blake3Hasher의 주소(c_void_p)를 반환합니다. (처음 호출 시 생성)"""
+    ptr = getattr(_tls, 'hasher_ptr', None)
+    if ptr is None:
+        _tls.hasher = Blake3Hasher()
+        ptr = _tls.hasher_ptr = c_void_p(ctypes.addressof(_tls.hasher))
+    return ptr
+
+def _data_pointer(data):
+    """
+    입력 데이터를 복사 없이 C 함수에 넘길 수 있는 형태로 변환합니다.
+
+    bytes는 c_void_p 인자로 그대로 전달되며 (내부 버퍼 포인터),
+    bytearray와 쓰기 가능한 memoryview는 from_buffer로 기존 메모리를 그대로 공유합니다.
+    """
+    if isinstance(data, bytearray):
+        return (ctypes.c_char * len(data)).from_buffer(data)
+    if isinstance(data, memoryview):
+        # 쓰기 가능한 연속 뷰는 메모리 공유, 읽기 전용 뷰는 bytes로 변환
+        if not data.readonly and data.c_contiguous:
+            return (ctypes.c_char * data.nbytes).from_buffer(data)
+        return data.tobytes()
+    return data
 
 def blake3_hash(data, digest_size=32):
     """
@@ -103,10 +195,9 @@ def blake3_hash(data, digest_size=32):
     if digest_size <= 0:
         raise ValueError("digest_size는 1 이상이어야 합니다")
     
-    # Blake3 해시 계산
+    # Blake3 해시 계산 (입력 버퍼 복사 없이 전달)
     digest = create_string_buffer(digest_size)
-    data_ptr = ctypes.create_string_buffer(data)
-    _blake3_lib.blake3(data_ptr, len(data), digest, digest_size)
+    _hash_fn(_data_pointer(data), len(data), digest, digest_size)
     
     return bytes(digest)
 
@@ -134,18 +225,17 @@ def blake3_hash_keyed(data, key, digest_size=32):
     if digest_size <= 0:
         raise ValueError("digest_size는 1 이상이어야 합니다")
     
-    # Blake3 해시어 초기화
-    hasher = Blake3Hasher()
-    key_array = (c_uint8 * 32)(*key)
-    _blake3_lib.blake3_hasher_init_keyed(byref(hasher), key_array)
+    # Blake3 해시어 초기화 (스레드별 해시어 재사용)
+    hasher_ptr = _thread_hasher()
+    # 키도 ctypes 배열로 복사하지 않고 버퍼를 그대로 전달
+    _blake3_lib.blake3_hasher_init_keyed(hasher_ptr, _data_pointer(key))
     
     # 데이터 업데이트
-    data_ptr = ctypes.create_string_buffer(data)
-    _blake3_lib.blake3_hasher_update(byref(hasher), data_ptr, len(data))
+    _hasher_update_fn(hasher_ptr, _data_pointer(data), len(data))
     
     # 해시 완료
     digest = create_string_buffer(digest_size)
-    _blake3_lib.blake3_hasher_finalize(byref(hasher), digest, digest_size)
+    _hasher_finalize_fn(hasher_ptr, digest, digest_size)
     
     return bytes(digest)
 
@@ -173,29 +263,28 @@ def blake3_derive_key(context, key_material, digest_size=32):
     if digest_size <= 0:
         raise ValueError("digest_size는 1 이상이어야 합니다")
     
-    # Blake3 해시어 초기화
-    hasher = Blake3Hasher()
+    # Blake3 해시어 초기화 (스레드별 해시어 재사용)
+    hasher_ptr = _thread_hasher()
     context_bytes = context.encode('utf-8')
-    _blake3_lib.blake3_hasher_init_derive_key(byref(hasher), context_bytes)
+    _blake3_lib.blake3_hasher_init_derive_key(hasher_ptr, context_bytes)
     
     # 키 자료 업데이트
-    data_ptr = ctypes.create_string_buffer(key_material)
-    _blake3_lib.blake3_hasher_update(byref(hasher), data_ptr, len(key_material))
+    _hasher_update_fn(hasher_ptr, _data_pointer(key_material), len(key_material))
     
     # 해시 완료
     digest = create_string_buffer(digest_size)
-    _blake3_lib.blake3_hasher_finalize(byref(hasher), digest, digest_size)
+    _hasher_finalize_fn(hasher_ptr, digest, digest_size)
     
     return bytes(digest)
 
-def file_hash(file_path, digest_size=32, chunk_size=8192):
+def file_hash(file_path, digest_size=32, chunk_size=1024 * 1024):
     """
     파일의 Blake3 해시를 계산합니다.
     
     Args:
         file_path: 해시할 파일 경로
         digest_size: 해시 결과의 바이트 크기 (기본값: 32)
-        chunk_size: 한 번에 읽을 바이트 크기
+        chunk_size: mmap을 쓸 수 없을 때 한 번에 읽을 바이트 크기 (기본값: 1 MiB)
         
     Returns:
         Blake3 해시 값 (bytes)
@@ -206,23 +295,45 @@ def file_hash(file_path, digest_size=32, chunk_size=8192):
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"파일이 존재하지 않습니다: {file_path}")
     
-    # Blake3 해시어 초기화
-    hasher = Blake3Hasher()
-    _blake3_lib.blake3_hasher_init(byref(hasher))
-    
-    # 파일 청크별로 읽어서 해시 업데이트
     with open(file_path, 'rb') as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            
-            chunk_buffer = create_string_buffer(chunk)
-            _blake3_lib.blake3_hasher_update(byref(hasher), chunk_buffer, len(chunk))
+        # 파일 전체를 메모리 매핑하여 한 번의 blake3 호출로 해시
+        # (빈 파일, 파이프, 매핑할 수 없는 큰 파일 등은 청크 방식으로 처리)
+        try:
+            return _file_hash_mmap(f, digest_size)
+        except (OSError, ValueError, OverflowError):
+            return _file_hash_chunked(f, digest_size, chunk_size)
+
+def _file_hash_mmap(f, digest_size):
+    """열린 파일을 mmap으로 매핑하여 단일 blake3 호출로 해시합니다."""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY) as mm:
+        # ACCESS_COPY는 쓰기 가능한 private 매핑이라 from_buffer로 복사 없이 공유 가능
+        data = (c_uint8 * len(mm)).from_buffer(mm)
+        digest = create_string_buffer(digest_size)
+        try:
+            _hash_fn(data, len(mm), digest, digest_size)
+        finally:
+            # 매핑을 닫기 전에 버퍼 참조를 해제해야 함
+            del data
+        return bytes(digest)
+
+def _file_hash_chunked(f, digest_size, chunk_size):
+    """열린 파일을 chunk_size 단위로 읽어 점진적으로 해시합니다."""
+    # Blake3 해시어 초기화 (스레드별 해시어 재사용)
+    hasher_ptr = _thread_hasher()
+    _hasher_init_fn(hasher_ptr)
+    
+    # 청크/호출마다 새 버퍼를 만들지 않도록 스레드별 읽기 버퍼를 재사용
+    buf = _thread_read_buffer(chunk_size)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        
+        _hasher_update_fn(hasher_ptr, buf, n)
     
     # 해시 완료
     digest = create_string_buffer(digest_size)
-    _blake3_lib.blake3_hasher_finalize(byref(hasher), digest, digest_size)
+    _hasher_finalize_fn(hasher_ptr, digest, digest_size)
     
     return bytes(digest)
 
@@ -235,27 +346,28 @@ class Blake3Incremental:
             raise RuntimeError("Blake3 라이브러리가 로드되지 않았습니다.")
         
         self.hasher = Blake3Hasher()
+        # update/finalize마다 포인터를 새로 만들지 않도록 주소를 한 번만 구함
+        self._hasher_ptr = c_void_p(ctypes.addressof(self.hasher))
         
         if key is not None:
             if not isinstance(key, (bytes, bytearray)) or len(key) != 32:
                 raise ValueError("키는 32바이트 bytes 또는 bytearray여야 합니다")
-            key_array = (c_uint8 * 32)(*key)
-            _blake3_lib.blake3_hasher_init_keyed(byref(self.hasher), key_array)
+            _blake3_lib.blake3_hasher_init_keyed(self._hasher_ptr, _data_pointer(key))
         elif context is not None:
             if not isinstance(context, str):
                 raise TypeError("컨텍스트는 문자열이어야 합니다")
             context_bytes = context.encode('utf-8')
-            _blake3_lib.blake3_hasher_init_derive_key(byref(self.hasher), context_bytes)
+            _blake3_lib.blake3_hasher_init_derive_key(self._hasher_ptr, context_bytes)
         else:
-            _blake3_lib.blake3_hasher_init(byref(self.hasher))
+            _hasher_init_fn(self._hasher_ptr)
     
     def update(self, data):
-        """해시에 데이터를 추가합니다."""
-        if not isinstance(data, (bytes, bytearray)):
-            raise TypeError("데이터는 bytes 또는 bytearray 타입이어야 합니다")
+        """해시에 데이터를 추가합니다. (bytes, bytearray, memoryview)"""
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("데이터는 bytes, bytearray 또는 memoryview 타입이어야 합니다")
         
-        data_ptr = ctypes.create_string_buffer(data)
-        _blake3_lib.blake3_hasher_update(byref(self.hasher), data_ptr, len(data))
+        size = data.nbytes if isinstance(data, memoryview) else len(data)
+        _hasher_update_fn(self._hasher_ptr, _data_pointer(data), size)
     
     def finalize(self, digest_size=32):
         """최종 해시 값을 계산합니다."""
@@ -263,7 +375,7 @@ class Blake3Incremental:
             raise ValueError("digest_size는 1 이상이어야 합니다")
         
         digest = create_string_buffer(digest_size)
-        _blake3_lib.blake3_hasher_finalize(byref(self.hasher), digest, digest_size)
+        _hasher_finalize_fn(self._hasher_ptr, digest, digest_size)
         return bytes(digest)
     
     def hexdigest(self, digest_size=32):
@@ -12,6 +12,8 @@ Detective Core - BLAKE3 기반 해시 및 바이러스 시그니처 비교 Pytho
     from virus_tracker.detective_core_wrapper import hash_string, batch_hash
 
     h = hash_string("hello world")
+    raw = hash_string_raw("hello world")  # 32바이트 (DB 저장/비교용)
+    hash_bytes_into(b"data", buf)         # 호출자 버퍼에 직접 기록 (복사 없음)
     hashes = batch_hash(["code1", "code2", "code3"])
 
 2. 클래스형 API (객체지향):
@@ -38,13 +40,28 @@ Detective Core - BLAKE3 기반 해시 및 바이러스 시그니처 비교 Pytho
 """
 
 import ctypes
+import functools
+import hmac
+import logging
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import (
-    c_char_p, c_int, c_size_t, c_double, c_uint8, c_void_p,
+    c_char_p, c_int, c_size_t, c_double, c_uint8, c_uint16, c_uint32, c_void_p,
     POINTER, Structure, byref, create_string_buffer
 )
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성 (없으면 순수 Python 후처리)
+    np = None
+
+try:
+    from . import _core
+except ImportError:  # Cython 확장은 선택 사항 (없으면 ctypes로 마샬링)
+    _core = None
 
 
 # ═══════════════════════════════════════════════
@@ -69,13 +86,31 @@ class SimilarityResult(Structure):
 # 라이브러리 로딩
 # ═══════════════════════════════════════════════
 
+def _packaged_library_path(lib_name: str, lib_extensions: List[str]) -> Optional[str]:
+    """패키지 데이터(virus_tracker/_native)에 포함된 라이브러리 경로 (없으면 None)"""
+    if not __package__:
+        return None
+    try:
+        from importlib.resources import files
+    except ImportError:  # Python 3.8 이하
+        return None
+
+    native_dir = files(__package__) / '_native'
+    for ext in lib_extensions:
+        path = native_dir / (lib_name + ext)
+        if path.is_file():
+            return str(path)
+    return None
+
+
 def _find_library_path() -> str:
     """
     detective_core 네이티브 라이브러리 파일 경로를 찾습니다.
 
     검색 순서:
-        1. core/blake_hash/build/ 하위 디렉토리
-        2. 플랫폼별 파일 확장자 (.dll / .so / .dylib)
+        1. 패키지에 포함된 라이브러리 (virus_tracker/_native, setup.py 빌드 시 복사)
+        2. core/blake_hash/build/ 하위 디렉토리
+        3. 플랫폼별 파일 확장자 (.dll / .so / .dylib)
 
     Returns:
         라이브러리 파일의 절대 경로
@@ -96,6 +131,11 @@ def _find_library_path() -> str:
         lib_extensions = ['.so']
         lib_name = 'libdetective_core'
 
+    # 설치된 패키지는 함께 배포된 라이브러리를 바로 사용 (빌드 디렉토리 탐색 생략)
+    packaged = _packaged_library_path(lib_name, lib_extensions)
+    if packaged is not None:
+        return packaged
+
     build_dirs = ['build', 'build/Debug', 'build/Release']
     possible_paths = []
 
@@ -118,6 +158,9 @@ def _find_library_path() -> str:
     )
 
 
+_logger = logging.getLogger(__name__)
+
+
 def _load_library():
     """
     네이티브 라이브러리를 로드하고 함수 프로토타입을 설정합니다.
@@ -133,7 +176,7 @@ def _load_library():
         lib.blake3_hash_string.argtypes = [c_char_p]
         lib.blake3_hash_string.restype = c_char_p
 
-        lib.blake3_hash_bytes.argtypes = [POINTER(c_uint8), c_size_t,
+        lib.blake3_hash_bytes.argtypes = [c_void_p, c_size_t,
                                           POINTER(c_uint8), c_size_t]
         lib.blake3_hash_bytes.restype = None
 
@@ -148,6 +191,12 @@ def _load_library():
                                                c_size_t]
         lib.hash_hamming_distance.restype = c_int
 
+        lib.blake3_hamming_distance_many.argtypes = [
+            c_char_p, POINTER(c_void_p),
+            c_size_t, c_size_t, POINTER(c_int)
+        ]
+        lib.blake3_hamming_distance_many.restype = c_int
+
         # ── 3. 배치 해시 ──
         lib.batch_hash_strings.argtypes = [POINTER(c_char_p), c_int]
         lib.batch_hash_strings.restype = POINTER(c_char_p)
@@ -155,6 +204,14 @@ def _load_library():
         lib.free_batch_hashes.argtypes = [POINTER(c_char_p), c_int]
         lib.free_batch_hashes.restype = None
 
+        lib.batch_hash_fixed_len.argtypes = [POINTER(c_char_p), c_int,
+                                             c_size_t, POINTER(c_uint8)]
+        lib.batch_hash_fixed_len.restype = None
+
+        lib.batch_hash_many.argtypes = [POINTER(c_char_p), POINTER(c_size_t),
+                                        c_int, POINTER(c_uint8)]
+        lib.batch_hash_many.restype = None
+
         # ── 4. 배치 비교 ──
         lib.batch_compare_hash.argtypes = [c_char_p, POINTER(c_char_p),
                                             c_int, POINTER(c_int)]
@@ -171,28 +228,109 @@ def _load_library():
         ]
         lib.batch_similarity_search.restype = POINTER(SimilarityResult)
 
+        lib.batch_similarity_search_flat.argtypes = [
+            c_void_p, c_void_p, c_int, c_int,
+            c_double, POINTER(c_int)
+        ]
+        lib.batch_similarity_search_flat.restype = POINTER(SimilarityResult)
+
         lib.free_similarity_results.argtypes = [POINTER(SimilarityResult)]
         lib.free_similarity_results.restype = None
 
+        # ── 6. 연속 메모리 DB 검색 ──
+        lib.db_find_exact.argtypes = [c_void_p, c_size_t,
+                                      c_char_p, POINTER(c_uint32)]
+        lib.db_find_exact.restype = c_int
+
+        lib.db_find_all.argtypes = [c_void_p, c_size_t,
+                                    c_char_p, POINTER(c_uint32)]
+        lib.db_find_all.restype = c_size_t
+
+        lib.db_find_many.argtypes = [c_void_p, c_size_t, c_char_p, c_size_t,
+                                     c_size_t, POINTER(c_uint32), c_size_t]
+        lib.db_find_many.restype = c_size_t
+
+        lib.scan_files.argtypes = [POINTER(c_char_p), POINTER(c_size_t), c_size_t,
+                                   c_void_p, c_size_t,
+                                   POINTER(c_uint32), c_size_t, POINTER(c_uint8)]
+        lib.scan_files.restype = c_size_t
+
+        lib.hamming_scan_32b.argtypes = [c_void_p, c_size_t,
+                                         c_void_p, POINTER(c_uint16)]
+        lib.hamming_scan_32b.restype = None
+
         return lib
 
     except (FileNotFoundError, OSError) as e:
-        print(f"경고: detective_core 라이브러리 로드 실패: {e}")
+        _logger.warning("detective_core 라이브러리 로드 실패: %s", e)
         return None
 
 
+def _lib_not_loaded(*args, **kwargs):
+    raise RuntimeError("detective_core 라이브러리가 로드되지 않았습니다.")
+
+
+class _LibStub:
+    """
+    라이브러리 로드 실패 시 _lib 자리에 두는 객체.
+
+    어떤 C 함수에 접근해도 RuntimeError를 발생시키므로 API 함수마다
+    로드 여부를 검사할 필요가 없습니다. 거짓으로 평가되어 대체 경로
+    선택(`if not _lib`)에도 사용합니다.
+    """
+
+    def __bool__(self):
+        return False
+
+    def __getattr__(self, name):
+        _lib_not_loaded()
+
+
 # 전역 라이브러리 인스턴스
-_lib = _load_library()
+_lib = _load_library() or _LibStub()
+
+# 호출이 잦은 C 함수는 한 번만 바인딩해 두고 바로 호출 (호출마다 CDLL 속성 조회 생략)
+_c_hash_bytes = _c_batch_hash_many = _c_db_find_all = _c_hamming_scan = _lib_not_loaded
+if _lib:
+    _c_hash_bytes = _lib.blake3_hash_bytes
+    _c_batch_hash_many = _lib.batch_hash_many
+    _c_db_find_all = _lib.db_find_all
+    _c_hamming_scan = _lib.hamming_scan_32b
+
+# 입력 수와 전체 크기(문자 수)가 모두 이 이상이면 스레드로 나누어 인코딩 + 해시
+# (ctypes 호출 중에는 GIL이 해제되므로 코어 수만큼 병렬 처리됨)
+_PARALLEL_MIN_INPUTS = 32
+_PARALLEL_MIN_BYTES = 256 * 1024
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# 다중 대상 DB 검색 타일 크기 (행, 8192 * 32바이트 = 256KB)
+_SEARCH_TILE_ROWS = 8192
+
+# 반복 입력 해시 캐시 (키로 보관되는 입력이 커지지 않도록 크기 제한)
+_HASH_CACHE_SIZE = 4096
+_HASH_CACHE_MAX_INPUT = 4096
 
 
 # ═══════════════════════════════════════════════
 # 함수형 API
 # ═══════════════════════════════════════════════
 
+def _as_c_buffer(data):
+    """bytes는 그대로, bytearray는 복사 없이 메모리를 공유하는 ctypes 배열로 변환합니다."""
+    if isinstance(data, bytearray):
+        return (c_uint8 * len(data)).from_buffer(data)
+    return data
+
+
 def hash_string(data: str) -> str:
     """
     문자열을 BLAKE3로 해시하여 16진수 문자열로 반환합니다.
 
+    내부적으로 hash_string_raw의 결과를 16진수로 변환합니다.
+    DB 저장/비교에는 hash_string_raw의 바이너리 결과를 사용하세요.
+
     Args:
         data: 해시할 문자열
 
@@ -208,21 +346,48 @@ def hash_string(data: str) -> str:
         >>> print(h)  # "d74981..."
         >>> len(h)    # 64
     """
-    if _lib is None:
-        raise RuntimeError("detective_core 라이브러리가 로드되지 않았습니다.")
+    return hash_string_raw(data).hex()
+
+
+def hash_string_raw(data: str) -> bytes:
+    """
+    문자열을 BLAKE3로 해시하여 32바이트 바이너리로 반환합니다.
+
+    16진수 변환 없이 바이트 그대로 반환하므로 VirusSignatureDB,
+    batch_compare 등에 바로 넘길 수 있습니다.
+
+    Args:
+        data: 해시할 문자열
+
+    Returns:
+        32바이트 BLAKE3 해시
+
+    Raises:
+        RuntimeError: 라이브러리 미로드 시
+        TypeError: 입력이 문자열이 아닌 경우
+
+    사용 예시:
+        >>> h = hash_string_raw("hello world")
+        >>> len(h)     # 32
+        >>> h.hex()    # hash_string("hello world")와 동일
+    """
     if not isinstance(data, str):
         raise TypeError("입력은 문자열이어야 합니다.")
 
-    result = _lib.blake3_hash_string(data.encode('utf-8'))
-    if result is None:
-        raise RuntimeError("해시 계산 실패")
-    return result.decode('ascii')
+    encoded = data.encode('utf-8')
+    # C 문자열 API(blake3_hash_string, batch_hash_strings)와 같은 결과를 내도록
+    # 첫 NUL 이후는 해시하지 않음
+    if b'\x00' in encoded:
+        encoded = encoded[:encoded.index(b'\x00')]
+    return hash_bytes_raw(encoded)
 
 
 def hash_bytes(data: bytes, digest_size: int = 32) -> bytes:
     """
     바이트 데이터를 BLAKE3로 해시합니다.
 
+    hash_bytes_raw와 동일합니다. (기존 코드 호환용)
+
     Args:
         data: 해시할 바이트 데이터
         digest_size: 출력 해시 크기 (바이트, 기본 32)
@@ -234,24 +399,84 @@ def hash_bytes(data: bytes, digest_size: int = 32) -> bytes:
         >>> h = hash_bytes(b"binary data")
         >>> print(h.hex())  # "a8f5f1..."
     """
-    if _lib is None:
-        raise RuntimeError("detective_core 라이브러리가 로드되지 않았습니다.")
+    return hash_bytes_raw(data, digest_size)
+
+
+def hash_bytes_raw(data: bytes, digest_size: int = 32) -> bytes:
+    """
+    바이트 데이터를 BLAKE3로 해시하여 바이너리로 반환합니다.
+
+    Args:
+        data: 해시할 바이트 데이터
+        digest_size: 출력 해시 크기 (바이트, 기본 32)
+
+    Returns:
+        BLAKE3 해시 바이트
+
+    사용 예시:
+        >>> h = hash_bytes_raw(b"binary data")
+        >>> len(h)  # 32
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        raise TypeError("입력은 bytes 또는 bytearray여야 합니다.")
+
+    # bytearray는 변경 가능하므로 캐시하지 않음
+    if isinstance(data, bytes) and len(data) <= _HASH_CACHE_MAX_INPUT:
+        return _hash_bytes_cached(data, digest_size)
+    return _hash_bytes_uncached(data, digest_size)
+
+
+def hash_bytes_into(data: bytes, out) -> None:
+    """
+    바이트 데이터를 BLAKE3로 해시하여 호출자 버퍼에 직접 기록합니다.
+
+    결과를 bytes로 복사하지 않으므로 같은 버퍼를 반복해서 쓰거나
+    해시를 바로 ctypes / 연속 DB 버퍼에 넣을 때 사용합니다.
+    출력 크기는 버퍼 길이(len(out))입니다.
+
+    Args:
+        data: 해시할 바이트 데이터
+        out: 결과를 받을 쓰기 가능 버퍼 (bytearray, memoryview 또는 c_uint8 배열)
+
+    사용 예시:
+        >>> buf = bytearray(32)
+        >>> hash_bytes_into(b"binary data", buf)
+        >>> bytes(buf) == hash_bytes_raw(b"binary data")  # True
+    """
     if not isinstance(data, (bytes, bytearray)):
         raise TypeError("입력은 bytes 또는 bytearray여야 합니다.")
 
-    data_array = (c_uint8 * len(data))(*data)
+    if isinstance(out, ctypes.Array):
+        c_out = out
+        size = ctypes.sizeof(out)
+    else:
+        size = memoryview(out).nbytes
+        c_out = (c_uint8 * size).from_buffer(out)
+    if size == 0:
+        raise ValueError("출력 버퍼 길이는 1 이상이어야 합니다.")
+
+    _c_hash_bytes(_as_c_buffer(data), len(data), c_out, size)
+
+
+def _hash_bytes_uncached(data, digest_size: int) -> bytes:
+    """바이트 입력을 C에서 해시합니다. (캐시 없이)"""
     out = (c_uint8 * digest_size)()
-    _lib.blake3_hash_bytes(data_array, len(data), out, digest_size)
+    _c_hash_bytes(_as_c_buffer(data), len(data), out, digest_size)
     return bytes(out)
 
 
-def compare_hashes(hash1: str, hash2: str) -> bool:
+_hash_bytes_cached = functools.lru_cache(maxsize=_HASH_CACHE_SIZE)(_hash_bytes_uncached)
+
+
+def compare_hashes(hash1: Union[str, bytes], hash2: Union[str, bytes]) -> bool:
     """
-    두 해시 문자열이 일치하는지 비교합니다.
+    두 해시가 일치하는지 비교합니다.
+
+    바이너리 다이제스트로 변환한 뒤 hmac.compare_digest로 상수 시간 비교합니다.
 
     Args:
-        hash1: 첫 번째 해시 (16진수 문자열)
-        hash2: 두 번째 해시 (16진수 문자열)
+        hash1: 첫 번째 해시 (16진수 문자열 또는 바이너리)
+        hash2: 두 번째 해시 (16진수 문자열 또는 바이너리)
 
     Returns:
         True = 일치, False = 불일치
@@ -261,17 +486,36 @@ def compare_hashes(hash1: str, hash2: str) -> bool:
         >>> h2 = hash_string("test")
         >>> compare_hashes(h1, h2)  # True
     """
-    if _lib is None:
-        raise RuntimeError("detective_core 라이브러리가 로드되지 않았습니다.")
-
-    result = _lib.hash_compare(hash1.encode('ascii'), hash2.encode('ascii'))
-    return result == 0
+    # 16진수 문자열은 바이너리로 변환하여 상수 시간 비교
+    raw1 = _digest_bytes(hash1)
+    raw2 = _digest_bytes(hash2)
+    if raw1 is not None and raw2 is not None:
+        return hmac.compare_digest(raw1, raw2)
+
+    # 16진수가 아닌 문자열이 섞인 경우 원본 문자열끼리 비교
+    if isinstance(hash1, (bytes, bytearray)):
+        hash1 = bytes(hash1).hex()
+    if isinstance(hash2, (bytes, bytearray)):
+        hash2 = bytes(hash2).hex()
+    return hmac.compare_digest(hash1.encode('ascii'), hash2.encode('ascii'))
+
+
+def _digest_bytes(h: Union[str, bytes]) -> Optional[bytes]:
+    """해시를 바이트로 변환합니다. (바이너리는 그대로, 16진수가 아니면 None)"""
+    if isinstance(h, (bytes, bytearray)):
+        return h
+    try:
+        return bytes.fromhex(h)
+    except ValueError:
+        return None
 
 
 def batch_hash(strings: List[str]) -> List[str]:
     """
     문자열 리스트를 일괄 BLAKE3 해시합니다. (C에서 고속 처리)
 
+    입력이 많고 크면 여러 스레드로 나누어 코어 수만큼 병렬로 해시합니다.
+
     Args:
         strings: 해시할 문자열 리스트
 
@@ -283,46 +527,166 @@ def batch_hash(strings: List[str]) -> List[str]:
         >>> len(hashes)  # 3
         >>> print(hashes[0])  # "a8f5..."
     """
-    if _lib is None:
-        raise RuntimeError("detective_core 라이브러리가 로드되지 않았습니다.")
     if not strings:
         return []
 
-    count = len(strings)
+    workers = os.cpu_count() or 1
+    if (workers > 1 and len(strings) >= _PARALLEL_MIN_INPUTS
+            and sum(map(len, strings)) >= _PARALLEL_MIN_BYTES):
+        # 코어 수만큼 구간을 나누어 각 스레드에서 인코딩 + 해시
+        # (한 스레드가 GIL을 잡고 인코딩하는 동안 다른 스레드는 GIL 없이 C 해시 실행)
+        step = -(-len(strings) // workers)
+        parts = [strings[i:i + step] for i in range(0, len(strings), step)]
+        results: List[str] = []
+        for part in _get_executor().map(_batch_hash_strings, parts):
+            results.extend(part)
+        return results
+
+    return _batch_hash_strings(strings)
+
+
+def _batch_hash_strings(strings: List[str]) -> List[str]:
+    """문자열 리스트를 UTF-8로 인코딩하여 한 번에 해시합니다. (스레드 작업 단위)"""
+    if _core is not None and type(strings) is list:
+        # Cython 확장: str의 UTF-8 버퍼를 복사 없이 C 배열로 구성
+        return _core.batch_hash(strings)
+    return _batch_hash_encoded([s.encode('utf-8') for s in strings])
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """batch_hash 병렬 처리용 스레드 풀 (처음 사용할 때 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                               thread_name_prefix='detective_hash')
+    return _executor
+
+
+def _batch_hash_encoded(encoded: List[bytes]) -> List[str]:
+    """UTF-8 인코딩된 입력 리스트를 C에서 한 번에 레인 병렬 해시합니다."""
+    # NUL 포함 입력은 hash_string과 동일하게 첫 NUL 앞까지만 해시
+    encoded = [d[:d.index(b'\x00')] if b'\x00' in d else d for d in encoded]
+
+    # 한 번에 16진수로 변환한 뒤 64자씩 잘라서 반환
+    hex_out = _batch_hash_raw(encoded).hex()
+    return [hex_out[k:k + 64] for k in range(0, len(hex_out), 64)]
+
+
+def _batch_hash_raw(encoded: List[bytes]) -> bytes:
+    """바이트 입력 리스트를 C에서 한 번에 해시하여 연속 바이너리(N * 32)로 반환합니다."""
+    count = len(encoded)
+    c_inputs = (c_char_p * count)(*encoded)
+    c_lens = (c_size_t * count)(*map(len, encoded))
+    out = (c_uint8 * (count * 32))()
+    _c_batch_hash_many(c_inputs, c_lens, count, out)
+    return bytes(out)
 
-    # Python 문자열 리스트 → C 문자열 배열 변환
-    c_strings = (c_char_p * count)()
-    for i, s in enumerate(strings):
-        c_strings[i] = s.encode('utf-8')
 
-    # C 함수 호출
-    result_ptr = _lib.batch_hash_strings(c_strings, count)
-    if not result_ptr:
-        raise RuntimeError("배치 해시 실패")
+def _decode_digest(hash_str: str) -> Optional[bytes]:
+    """64자 16진수 해시를 32바이트로 변환합니다. 형식이 다르면 None."""
+    if len(hash_str) != 64:
+        return None
+    try:
+        digest = bytes.fromhex(hash_str)
+    except ValueError:
+        return None
+    return digest if len(digest) == 32 else None
 
-    # 결과 추출
-    results = []
-    for i in range(count):
-        if result_ptr[i]:
-            results.append(result_ptr[i].decode('ascii'))
+
+def _decode_digests(hashes: List[str]) -> Optional[bytes]:
+    """64자 16진수 해시 리스트를 한 번의 fromhex로 연속 바이너리(N * 32)로 변환합니다."""
+    if not all(len(h) == 64 for h in hashes):
+        return None
+    try:
+        blob = bytes.fromhex(''.join(hashes))
+    except ValueError:
+        return None
+    return blob if len(blob) == 32 * len(hashes) else None
+
+
+def _decode_digests_each(hashes: List[str]) -> Tuple[bytearray, Dict[int, str]]:
+    """
+    16진수 해시 리스트를 항목별로 연속 바이너리(N * 32)로 변환합니다.
+
+    32바이트 해시가 아닌 항목은 0으로 자리만 채우고 (인덱스 → 원본 문자열)로 따로 반환합니다.
+    """
+    blob = bytearray(32 * len(hashes))
+    invalid: Dict[int, str] = {}
+    for i, h in enumerate(hashes):
+        digest = _decode_digest(h)
+        if digest is None:
+            invalid[i] = h
         else:
-            results.append(None)
+            blob[i * 32:(i + 1) * 32] = digest
+    return blob, invalid
+
 
-    # C 측 메모리 해제
-    _lib.free_batch_hashes(result_ptr, count)
+def _find_exact_mixed(blob, count: int, target: Optional[bytes], target_str: str,
+                      invalid: Dict[int, str]) -> List[int]:
+    """
+    해시가 아닌 항목(invalid)이 섞인 연속 DB에서 일치 행을 찾습니다.
 
+    32바이트 해시 행은 SIMD 비교(db_find_all)로, invalid 행만 원본 문자열로 비교합니다.
+    (invalid 행은 blob에서 0으로 채워져 있으므로 SIMD 결과에서 제외)
+    """
+    matches = []
+    if target is not None:
+        matches = [i for i in _find_exact(blob, count, target) if i not in invalid]
+    extra = [i for i, h in invalid.items() if h == target_str]
+    return sorted(matches + extra) if extra else matches
+
+
+def _find_exact(blob, count: int, target: bytes) -> List[int]:
+    """연속 바이너리 DB(count * 32바이트)에서 target과 일치하는 행 인덱스를 찾습니다."""
+    if count == 0:
+        return []
+
+    c_blob = _as_c_buffer(blob)
+    out = (c_uint32 * count)()
+    found = _c_db_find_all(c_blob, count, bytes(target), out)
+    return out[:found]  # ctypes 배열 슬라이스는 이미 list
+
+
+def _find_exact_many(blob, count: int, targets: bytes) -> List[List[int]]:
+    """연속 바이너리 DB에서 여러 대상(len(targets) // 32개)의 일치 행을 타일 단위로 한 번에 찾습니다."""
+    m = len(targets) // 32
+    results: List[List[int]] = [[] for _ in range(m)]
+    if count == 0 or m == 0:
+        return results
+
+    c_blob = _as_c_buffer(blob)
+    capacity = m * 4
+    while True:
+        pairs = (c_uint32 * (2 * capacity))()
+        total = _lib.db_find_many(c_blob, count, targets, m, _SEARCH_TILE_ROWS,
+                                  pairs, capacity)
+        if total <= capacity:
+            break
+        # 일치가 버퍼보다 많으면 정확한 크기로 다시 검색
+        capacity = total
+
+    flat = pairs[:2 * total]
+    for row, k in zip(flat[0::2], flat[1::2]):
+        results[k].append(row)
     return results
 
 
-def batch_compare(target_hash: str, db_hashes: List[str]) -> List[int]:
+def batch_compare(target_hash: Union[str, bytes],
+                  db_hashes: Union[List[str], bytes, bytearray]) -> List[int]:
     """
     대상 해시를 DB 해시 리스트에서 검색하여 일치하는 인덱스를 반환합니다.
 
     바이러스 시그니처 DB에서 완전 일치하는 항목을 찾을 때 사용합니다.
+    해시가 모두 32바이트 BLAKE3 해시이면 한 번에 바이너리로 변환한 뒤
+    C의 SIMD 비교(db_find_all, 64행 비트맵)로 검색합니다.
+    해시가 아닌 항목이 섞여 있어도 해시 항목은 같은 방식(대소문자 무관)으로 비교하고,
+    나머지 항목만 문자열로 비교합니다.
 
     Args:
-        target_hash: 찾을 대상 해시
-        db_hashes: DB 해시 리스트
+        target_hash: 찾을 대상 해시 (16진수 문자열 또는 32바이트)
+        db_hashes: DB 해시 리스트 (16진수 문자열) 또는 연속 바이너리 (N * 32바이트)
 
     Returns:
         일치하는 인덱스 리스트 (없으면 빈 리스트)
@@ -332,33 +696,140 @@ def batch_compare(target_hash: str, db_hashes: List[str]) -> List[int]:
         >>> matches = batch_compare("hash_a", db)
         >>> print(matches)  # [0, 2]
     """
-    if _lib is None:
-        raise RuntimeError("detective_core 라이브러리가 로드되지 않았습니다.")
     if not db_hashes:
         return []
 
-    db_count = len(db_hashes)
+    if isinstance(target_hash, (bytes, bytearray)):
+        target = bytes(target_hash) if len(target_hash) == 32 else None
+    else:
+        target = _decode_digest(target_hash)
 
-    # C 배열 변환
-    c_db = (c_char_p * db_count)()
-    for i, h in enumerate(db_hashes):
-        c_db[i] = h.encode('ascii')
+    # 연속 바이너리 DB
+    if isinstance(db_hashes, (bytes, bytearray)):
+        if target is None:
+            return []
+        return _find_exact(db_hashes, len(db_hashes) // 32, target)
 
-    match_count = c_int(0)
-    result_ptr = _lib.batch_compare_hash(
-        target_hash.encode('ascii'),
-        c_db, db_count,
-        byref(match_count)
-    )
+    # 16진수 리스트 → 한 번에 디코딩 후 SIMD 비교
+    if target is not None:
+        blob = _decode_digests(db_hashes)
+        if blob is not None:
+            return _find_exact(blob, len(db_hashes), target)
 
-    # 결과 추출
-    matches = []
-    if result_ptr and match_count.value > 0:
-        for i in range(match_count.value):
-            matches.append(result_ptr[i])
-        _lib.free_match_results(result_ptr)
+    # 형식이 다른 항목이 섞인 경우 항목별로 변환하여 해시는 SIMD 비교, 나머지만 문자열 비교
+    # (잘못된 항목 하나 때문에 다른 항목의 대소문자 무관 비교가 바뀌지 않도록)
+    if isinstance(target_hash, (bytes, bytearray)):
+        target_hash = bytes(target_hash).hex()
+    blob, invalid = _decode_digests_each(db_hashes)
+    return _find_exact_mixed(blob, len(db_hashes), target, target_hash, invalid)
+
+
+def _hamming_scan(blob, count: int, target: bytes):
+    """연속 바이너리 DB(count * 32바이트) 각 행과 target의 해밍 거리를 계산합니다."""
+    if not _lib:
+        return _hamming_scan_fallback(blob, count, target)
 
-    return matches
+    c_blob = _as_c_buffer(blob)
+    dists = (c_uint16 * count)()
+    # bytes / bytearray 대상은 복사 없이 그대로 전달 (C는 앞 32바이트만 읽음)
+    c_target = _as_c_buffer(target) if isinstance(target, (bytes, bytearray)) else bytes(target[:32])
+    _c_hamming_scan(c_blob, count, c_target, dists)
+    return dists
+
+
+# numba 커널 (처음 사용할 때 컴파일, numba가 없으면 False)
+_numba_kernel = None
+
+
+def _get_numba_kernel():
+    """numba 병렬 해밍 거리 커널을 반환합니다. numba가 없으면 None."""
+    global _numba_kernel
+    if _numba_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:  # numba는 선택 의존성
+            _numba_kernel = False
+        else:
+            m1 = np.uint64(0x5555555555555555)
+            m2 = np.uint64(0x3333333333333333)
+            m4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+            h01 = np.uint64(0x0101010101010101)
+
+            @njit(parallel=True, fastmath=True, cache=True)
+            def _hamming_search_numba(target_u64, db_u64, out):
+                for i in prange(db_u64.shape[0]):
+                    acc = np.uint64(0)
+                    for j in range(4):
+                        # SWAR popcount (uint64 레인 단위)
+                        x = target_u64[j] ^ db_u64[i, j]
+                        x = x - ((x >> np.uint64(1)) & m1)
+                        x = (x & m2) + ((x >> np.uint64(2)) & m2)
+                        x = (x + (x >> np.uint64(4))) & m4
+                        acc += (x * h01) >> np.uint64(56)
+                    out[i] = acc
+
+            _numba_kernel = _hamming_search_numba
+    return _numba_kernel or None
+
+
+def _hamming_scan_fallback(blob, count: int, target: bytes):
+    """
+    네이티브 라이브러리 없이 해밍 거리를 계산합니다.
+
+    numba가 있으면 DB 행 단위 병렬 커널, 없으면 numpy bitwise_count,
+    numpy도 없으면 순수 Python 정수 XOR로 계산합니다.
+    """
+    target = bytes(target[:32])
+
+    if np is None:
+        t = int.from_bytes(target, 'little')
+        return [bin(t ^ int.from_bytes(blob[k * 32:(k + 1) * 32], 'little')).count('1')
+                for k in range(count)]
+
+    # 32바이트 해시 → uint64 레인 4개 (N, 4)
+    db_u64 = np.frombuffer(blob, dtype=np.uint64, count=count * 4).reshape(count, 4)
+    target_u64 = np.frombuffer(target, dtype=np.uint64)
+
+    kernel = _get_numba_kernel()
+    if kernel is not None:
+        out = np.empty(count, dtype=np.uint16)
+        kernel(target_u64, db_u64, out)
+        return out
+
+    xor_result = db_u64 ^ target_u64
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        return np.bitwise_count(xor_result).sum(axis=1, dtype=np.uint16)
+    bits = np.unpackbits(xor_result.view(np.uint8).reshape(count, 32), axis=1)
+    return bits.sum(axis=1, dtype=np.uint16)
+
+
+def _max_distance(threshold: float, total_bits: int = 256) -> int:
+    """유사도(1 - 거리 / total_bits)가 threshold 이상이 되는 최대 해밍 거리 (없으면 -1)"""
+    max_dist = min(max(int((1.0 - threshold) * total_bits), -1), total_bits)
+    # 부동소수점 반올림 오차 보정: 유사도 비교 결과와 정확히 일치하도록 경계 조정
+    while max_dist < total_bits and 1.0 - (max_dist + 1) / total_bits >= threshold:
+        max_dist += 1
+    while max_dist >= 0 and 1.0 - max_dist / total_bits < threshold:
+        max_dist -= 1
+    return max_dist
+
+
+def _filter_similar(dists, threshold: float,
+                    total_bits: int = 256) -> List[Tuple[int, float]]:
+    """해밍 거리 배열에서 유사도가 임계값 이상인 (인덱스, 유사도)를 유사도 내림차순으로 반환합니다."""
+    # 임계값을 정수 거리로 바꿔 uint16 거리 그대로 필터링 (유사도는 최종 결과에만 계산)
+    max_dist = _max_distance(threshold, total_bits)
+
+    if np is not None:
+        d = np.frombuffer(dists, dtype=np.uint16)
+        idx = np.where(d <= max_dist)[0]
+        order = idx[np.argsort(d[idx], kind='stable')]
+        return [(i, 1.0 - k / total_bits)
+                for i, k in zip(order.tolist(), d[order].tolist())]
+
+    results = [(i, d) for i, d in enumerate(dists) if d <= max_dist]
+    results.sort(key=lambda r: r[1])
+    return [(i, 1.0 - d / total_bits) for i, d in results]
 
 
 def similarity_search(target: bytes, db_hashes: List[bytes],
@@ -367,7 +838,10 @@ def similarity_search(target: bytes, db_hashes: List[bytes],
     """
     대상 해시와 DB 해시들의 유사도를 계산하여 임계값 이상인 결과를 반환합니다.
 
-    바이러스 변종 탐지에 사용됩니다.
+    바이러스 변종 탐지에 사용됩니다. 32바이트 해시는 연속 버퍼로 모아
+    C의 SIMD 해밍 거리 커널(hamming_scan_32b)로 한 번에 계산합니다.
+    라이브러리가 없으면 numba(설치 시) 또는 numpy로 같은 계산을 합니다.
+    그 밖의 길이도 한 연속 버퍼로 모아 batch_similarity_search_flat으로 검색합니다.
 
     Args:
         target: 대상 해시 (바이너리, 32바이트)
@@ -385,28 +859,32 @@ def similarity_search(target: bytes, db_hashes: List[bytes],
         >>> for idx, score in results:
         ...     print(f"DB[{idx}]: {score:.1%}")
     """
-    if _lib is None:
-        raise RuntimeError("detective_core 라이브러리가 로드되지 않았습니다.")
     if not db_hashes:
         return []
 
     db_count = len(db_hashes)
 
-    # 대상 해시 → C 배열
-    target_array = (c_uint8 * hash_len)(*target[:hash_len])
+    # 32바이트 해시: 연속 버퍼 + SIMD 해밍 거리 스캔
+    # (라이브러리가 없으면 numba / numpy 대체 경로)
+    if hash_len == 32 and len(target) >= 32 and all(len(h) == 32 for h in db_hashes):
+        dists = _hamming_scan(b''.join(db_hashes), db_count, target)
+        return _filter_similar(dists, threshold)
 
-    # DB 해시 → C 포인터 배열
-    db_arrays = []
-    c_db_ptrs = (POINTER(c_uint8) * db_count)()
-    for i, h in enumerate(db_hashes):
-        arr = (c_uint8 * hash_len)(*h[:hash_len])
-        db_arrays.append(arr)  # prevent GC
-        c_db_ptrs[i] = arr
+    # 대상 / DB 해시 → hash_len 단위 연속 버퍼 (짧으면 0으로 채우고 길면 자름)
+    target_buf = bytes(target[:hash_len]).ljust(hash_len, b'\x00')
+    if all(len(h) == hash_len for h in db_hashes):
+        db_flat = b''.join(db_hashes)
+    else:
+        # 0으로 초기화된 버퍼에 각 해시를 memmove (행마다 패딩된 bytes를 만들지 않음)
+        db_flat = (c_uint8 * (db_count * hash_len))()
+        base = ctypes.addressof(db_flat)
+        for i, h in enumerate(db_hashes):
+            ctypes.memmove(base + i * hash_len, _as_c_buffer(h), min(len(h), hash_len))
 
     result_count = c_int(0)
-    result_ptr = _lib.batch_similarity_search(
-        target_array, hash_len,
-        c_db_ptrs, db_count,
+    result_ptr = _lib.batch_similarity_search_flat(
+        target_buf, db_flat,
+        db_count, hash_len,
         c_double(threshold),
         byref(result_count)
     )
@@ -421,6 +899,45 @@ def similarity_search(target: bytes, db_hashes: List[bytes],
     return results
 
 
+def batch_hamming(target_bytes: bytes, db_list: List[bytes]) -> List[int]:
+    """
+    대상 해시와 DB 해시 리스트 각각의 해밍 거리를 C에서 한 번에 계산합니다.
+
+    해시 길이는 자유이며 (32바이트 BLAKE3, 64바이트 파일 해시 등)
+    빌드에 따라 AVX-512 VPOPCNTDQ / AVX2 popcount 커널을 사용합니다.
+
+    Args:
+        target_bytes: 대상 해시 (바이너리)
+        db_list: DB 해시 리스트 (각각 target_bytes와 같은 길이)
+
+    Returns:
+        DB 해시별 해밍 거리 리스트 (db_list 순서)
+
+    사용 예시:
+        >>> target = file_hash("suspicious.exe")
+        >>> distances = batch_hamming(target, [file_hash(p) for p in samples])
+    """
+    if not db_list:
+        return []
+
+    hash_len = len(target_bytes)
+    if any(len(h) != hash_len for h in db_list):
+        raise ValueError("입력 바이트 시퀀스의 길이가 다릅니다.")
+
+    # DB 해시를 연속 버퍼 하나로 모으고 행 주소 테이블은 주소 계산으로 한 번에 생성
+    db_count = len(db_list)
+    if hash_len == 0:
+        return [0] * db_count
+    db_flat = b''.join(db_list)
+    base = ctypes.cast(db_flat, c_void_p).value
+    c_db_ptrs = (c_void_p * db_count)(*range(base, base + db_count * hash_len, hash_len))
+
+    out = (c_int * db_count)()
+    _lib.blake3_hamming_distance_many(bytes(target_bytes), c_db_ptrs, db_count,
+                                      hash_len, out)
+    return out[:]
+
+
 # ═══════════════════════════════════════════════
 # 클래스형 API
 # ═══════════════════════════════════════════════
@@ -459,7 +976,7 @@ class DetectiveCore:
         Raises:
             RuntimeError: 네이티브 라이브러리 로드 실패 시
         """
-        if _lib is None:
+        if not _lib:
             raise RuntimeError(
                 "detective_core 네이티브 라이브러리가 로드되지 않았습니다.\n"
                 "빌드가 필요합니다:\n"
@@ -543,6 +1060,36 @@ class DetectiveCore:
         """
         return batch_hash(strings)
 
+    def batch_hash_gpu(self, inputs: List[Union[str, bytes]]):
+        """
+        대량 입력을 GPU에서 일괄 BLAKE3 해시합니다. (수만 개 샘플 등록용)
+
+        numba.cuda와 CUDA 장치가 있으면 virus_tracker.gpu 커널을 사용하고,
+        없으면 같은 결과를 CPU(batch_hash_many)로 계산합니다.
+        문자열은 UTF-8로 인코딩한 전체 바이트를 해시합니다.
+
+        Args:
+            inputs: 해시할 문자열 또는 바이트 리스트
+
+        Returns:
+            (n, 32) uint8 배열 (numpy가 없으면 32바이트 bytes 리스트)
+
+        사용 예시:
+            >>> core = DetectiveCore()
+            >>> digests = core.batch_hash_gpu([b"sample1", b"sample2"])
+            >>> digests.shape  # (2, 32)
+        """
+        encoded = [d.encode('utf-8') if isinstance(d, str) else bytes(d) for d in inputs]
+
+        from . import gpu  # numba 임포트 비용은 GPU 경로를 쓸 때만
+        if gpu.is_available():
+            return gpu.batch_hash_gpu(encoded)
+
+        raw = _batch_hash_raw(encoded) if encoded else b''
+        if np is not None:
+            return np.frombuffer(raw, dtype=np.uint8).reshape(len(encoded), 32).copy()
+        return [raw[k:k + 32] for k in range(0, len(raw), 32)]
+
     def batch_compare(self, target_hash: str, db_hashes: List[str]) -> List[int]:
         """
         대상 해시를 DB 해시 리스트에서 검색합니다.
@@ -613,51 +1160,73 @@ class VirusSignatureDB:
         ...     print(f"바이러스 #{idx}: {score:.1%} 유사")
     """
 
-    def __init__(self, hashes: Optional[List[str]] = None):
+    def __init__(self, hashes: Optional[List[Union[str, bytes]]] = None,
+                 fast_mode: bool = False):
         """
         VirusSignatureDB 초기화.
 
         Args:
-            hashes: 초기 해시 리스트 (16진수 문자열)
+            hashes: 초기 해시 리스트 (16진수 문자열 또는 32바이트 바이너리)
+            fast_mode: True이면 해시 → 인덱스 해시 테이블을 함께 유지하여
+                       완전 일치 검색을 DB 크기와 무관하게 O(1)로 처리
 
         사용 예시:
             >>> db = VirusSignatureDB(["hash1", "hash2"])
             >>> db = VirusSignatureDB()  # 빈 DB로 시작
+            >>> db = VirusSignatureDB(known_hashes, fast_mode=True)
         """
-        self._hashes: List[str] = list(hashes) if hashes else []
-        self._raw_hashes: List[bytes] = []
+        # 해시는 32바이트 바이너리로 연속 저장 (N * 32바이트)
+        self._blob = bytearray()
 
-        # 16진수 문자열을 바이너리로도 저장 (유사도 검색용)
-        for h in self._hashes:
-            try:
-                self._raw_hashes.append(bytes.fromhex(h))
-            except ValueError:
-                self._raw_hashes.append(b'')
+        # 32바이트 해시가 아닌 항목: 인덱스 → 원본 문자열 (blob에는 0으로 자리만 채움)
+        self._invalid: Dict[int, str] = {}
+
+        # 소문자가 아닌 16진수 해시: 인덱스 → 원본 문자열 (get_hash가 추가한 표기 그대로 반환)
+        self._spelling: Dict[int, str] = {}
+
+        # fast_mode: 32바이트 해시 → 인덱스 리스트
+        # (BLAKE3 출력은 이미 균일 분포이므로 별도의 비암호 해시 없이 그대로 키로 사용)
+        self.fast_mode = fast_mode
+        self._index: Dict[bytes, List[int]] = {}
+
+        if hashes:
+            self.add_many(hashes)
 
     @property
     def count(self) -> int:
         """DB에 등록된 시그니처 수"""
-        return len(self._hashes)
+        return len(self._blob) // 32
 
-    def add(self, hash_str: str) -> None:
+    def add(self, hash_str: Union[str, bytes]) -> None:
         """
         새 해시를 DB에 추가합니다.
 
         Args:
-            hash_str: 추가할 해시 (16진수 문자열)
+            hash_str: 추가할 해시 (16진수 문자열 또는 32바이트 바이너리)
 
         사용 예시:
             >>> db = VirusSignatureDB()
             >>> db.add("a8f5f167...")
-            >>> db.count  # 1
+            >>> db.add(hash_string_raw("code"))
+            >>> db.count  # 2
         """
-        self._hashes.append(hash_str)
-        try:
-            self._raw_hashes.append(bytes.fromhex(hash_str))
-        except ValueError:
-            self._raw_hashes.append(b'')
-
-    def add_many(self, hashes: List[str]) -> None:
+        if isinstance(hash_str, (bytes, bytearray)):
+            digest = bytes(hash_str) if len(hash_str) == 32 else None
+            if digest is None:
+                hash_str = bytes(hash_str).hex()
+        else:
+            digest = _decode_digest(hash_str)
+            if digest is not None and hash_str != hash_str.lower():
+                self._spelling[self.count] = hash_str
+
+        if digest is None:
+            self._invalid[self.count] = hash_str
+            digest = bytes(32)
+        elif self.fast_mode:
+            self._index.setdefault(digest, []).append(self.count)
+        self._blob += digest
+
+    def add_many(self, hashes: List[Union[str, bytes]]) -> None:
         """
         여러 해시를 한 번에 DB에 추가합니다.
 
@@ -669,15 +1238,43 @@ class VirusSignatureDB:
             >>> db.add_many(["hash1", "hash2", "hash3"])
             >>> db.count  # 3
         """
-        for h in hashes:
-            self.add(h)
-
-    def search(self, target_hash: str) -> List[int]:
+        hashes = list(hashes)
+        if not hashes:
+            return
+
+        # 모두 64자 16진수 또는 32바이트 바이너리이면 한 번에 변환하여 연속 추가
+        if all(isinstance(h, str) for h in hashes):
+            block = _decode_digests(hashes)
+        elif all(isinstance(h, (bytes, bytearray)) and len(h) == 32 for h in hashes):
+            block = b''.join(hashes)
+        else:
+            block = None
+
+        if block is None:
+            # 형식이 섞여 있거나 잘못된 항목이 있으면 항목별로 추가
+            for h in hashes:
+                self.add(h)
+            return
+
+        start = self.count
+        self._blob += block
+        if not isinstance(hashes[0], (bytes, bytearray)):
+            for k, h in enumerate(hashes):
+                if h != h.lower():
+                    self._spelling[start + k] = h
+        if self.fast_mode:
+            index = self._index
+            for k in range(len(hashes)):
+                index.setdefault(block[k * 32:(k + 1) * 32], []).append(start + k)
+
+    def search(self, target_hash: Union[str, bytes]) -> List[int]:
         """
         대상 해시와 완전 일치하는 DB 항목을 검색합니다.
 
+        fast_mode이면 해시 테이블 조회, 아니면 연속 DB를 SIMD로 선형 스캔합니다.
+
         Args:
-            target_hash: 검색할 해시
+            target_hash: 검색할 해시 (16진수 문자열 또는 32바이트 바이너리)
 
         Returns:
             일치하는 인덱스 리스트
@@ -686,7 +1283,112 @@ class VirusSignatureDB:
             >>> db = VirusSignatureDB(["hash_a", "hash_b", "hash_a"])
             >>> db.search("hash_a")  # [0, 2]
         """
-        return batch_compare(target_hash, self._hashes)
+        if isinstance(target_hash, (bytes, bytearray)):
+            target = bytes(target_hash) if len(target_hash) == 32 else None
+            target_str = bytes(target_hash).hex()
+        else:
+            target = _decode_digest(target_hash)
+            target_str = target_hash
+
+        if self.fast_mode and target is not None:
+            return list(self._index.get(target, ()))
+
+        if not self._invalid:
+            return _find_exact(self._blob, self.count, target) if target is not None else []
+
+        # 해시가 아닌 항목은 blob에 0으로 자리만 채워 두었으므로 그 행만 문자열로 비교
+        return _find_exact_mixed(self._blob, self.count, target, target_str, self._invalid)
+
+    def search_many(self, targets: List[Union[str, bytes]]) -> List[List[int]]:
+        """
+        여러 대상 해시를 한 번에 검색합니다.
+
+        DB를 캐시 크기의 타일로 나누어 타일마다 모든 대상을 비교하므로
+        DB가 클 때 대상마다 search를 호출하는 것보다 메모리 접근이 적습니다.
+
+        Args:
+            targets: 검색할 해시 리스트 (16진수 문자열 또는 32바이트 바이너리)
+
+        Returns:
+            대상별 일치 인덱스 리스트 (targets와 같은 순서)
+
+        사용 예시:
+            >>> db = VirusSignatureDB(["hash_a", "hash_b", "hash_a"])
+            >>> db.search_many(["hash_a", "hash_c"])  # [[0, 2], []]
+        """
+        digests = []
+        for t in targets:
+            if isinstance(t, (bytes, bytearray)):
+                digests.append(bytes(t) if len(t) == 32 else None)
+            else:
+                digests.append(_decode_digest(t))
+
+        # 형식이 다른 대상이 있거나 fast_mode이면 대상별 검색
+        if self.fast_mode or any(d is None for d in digests):
+            return [self.search(t) for t in targets]
+        return self._drop_invalid(_find_exact_many(self._blob, self.count, b''.join(digests)))
+
+    def scan(self, contents: List[Union[str, bytes]]) -> List[List[int]]:
+        """
+        여러 내용(파일 내용 등)을 해시하여 DB에서 한 번에 검색합니다.
+
+        해시 계산과 타일 단위 DB 검색을 C의 scan_files 한 번의 호출로 처리합니다.
+        문자열은 hash_string과 같은 방식으로 해시됩니다.
+
+        Args:
+            contents: 검사할 내용 리스트 (문자열 또는 바이트)
+
+        Returns:
+            내용별 일치 인덱스 리스트 (contents와 같은 순서)
+
+        사용 예시:
+            >>> db = VirusSignatureDB([hash_string("virus_code")])
+            >>> db.scan(["safe_code", "virus_code"])  # [[], [0]]
+        """
+        m = len(contents)
+        if m == 0:
+            return []
+
+        encoded = []
+        for c in contents:
+            if isinstance(c, str):
+                c = c.encode('utf-8')
+                # hash_string과 동일하게 첫 NUL 이후는 해시하지 않음
+                if b'\x00' in c:
+                    c = c[:c.index(b'\x00')]
+            encoded.append(bytes(c))
+
+        c_data = (c_char_p * m)(*encoded)
+        c_lens = (c_size_t * m)(*map(len, encoded))
+        digests = (c_uint8 * (m * 32))()
+
+        # fast_mode이면 해시만 C에서 계산하고 검색은 search로
+        if self.fast_mode or self.count == 0:
+            _lib.scan_files(c_data, c_lens, m, None, 0, None, 0, digests)
+            raw = bytes(digests)
+            return [self.search(raw[k * 32:(k + 1) * 32]) for k in range(m)]
+
+        c_blob = _as_c_buffer(self._blob)
+        capacity = m * 4
+        pairs = (c_uint32 * (2 * capacity))()
+        total = _lib.scan_files(c_data, c_lens, m, c_blob, self.count,
+                                pairs, capacity, digests)
+        if total > capacity:
+            # 일치가 버퍼보다 많으면 계산된 다이제스트로 다시 검색
+            return self._drop_invalid(_find_exact_many(self._blob, self.count, bytes(digests)))
+
+        results: List[List[int]] = [[] for _ in range(m)]
+        flat = pairs[:2 * total]
+        for row, k in zip(flat[0::2], flat[1::2]):
+            results[k].append(row)
+        return self._drop_invalid(results)
+
+    def _drop_invalid(self, results: List[List[int]]) -> List[List[int]]:
+        """해시 검색 결과에서 해시가 아닌 항목(0으로 채운 자리)의 행을 제외합니다."""
+        if not self._invalid:
+            return results
+        invalid = self._invalid
+        return [[i for i in rows if i not in invalid] for rows in results]
 
     def similarity_search(self, target: bytes,
                           threshold: float = 0.85) -> List[Tuple[int, float]]:
@@ -707,9 +1409,27 @@ class VirusSignatureDB:
             >>> for idx, score in results:
             ...     print(f"바이러스 #{idx}: {score:.1%}")
         """
-        if not self._raw_hashes:
+        if self.count == 0:
             return []
-        return similarity_search(target, self._raw_hashes, threshold)
+
+        # 모두 32바이트 해시이면 연속 버퍼를 복사 없이 바로 스캔
+        if not self._invalid and len(target) >= 32:
+            return _filter_similar(_hamming_scan(self._blob, self.count, target), threshold)
+
+        return similarity_search(target, self._raw_hashes(), threshold)
+
+    def _raw_hashes(self) -> List[bytes]:
+        """항목별 바이너리 해시 리스트 (16진수가 아닌 항목은 빈 바이트)"""
+        raw = []
+        for i in range(self.count):
+            if i in self._invalid:
+                try:
+                    raw.append(bytes.fromhex(self._invalid[i]))
+                except ValueError:
+                    raw.append(b'')
+            else:
+                raw.append(bytes(self._blob[i * 32:(i + 1) * 32]))
+        return raw
 
     def get_hash(self, index: int) -> str:
         """
@@ -725,7 +1445,12 @@ class VirusSignatureDB:
             >>> db = VirusSignatureDB(["hash_a", "hash_b"])
             >>> db.get_hash(0)  # "hash_a"
         """
-        return self._hashes[index]
+        index = range(self.count)[index]
+        if index in self._invalid:
+            return self._invalid[index]
+        if index in self._spelling:
+            return self._spelling[index]
+        return self._blob[index * 32:(index + 1) * 32].hex()
 
     def get_all_hashes(self) -> List[str]:
         """
@@ -734,4 +1459,10 @@ class VirusSignatureDB:
         Returns:
             해시 리스트 (복사본)
         """
-        return list(self._hashes)
+        hex_blob = self._blob.hex()
+        hashes = [hex_blob[i:i + 64] for i in range(0, len(hex_blob), 64)]
+        for i, h in self._invalid.items():
+            hashes[i] = h
+        for i, h in self._spelling.items():
+            hashes[i] = h
+        return hashes
@@ -0,0 +1,240 @@
+"""
+GPU 배치 해시 모듈 (선택 기능)
+
+numba.cuda로 입력 하나당 CUDA 스레드 하나가 BLAKE3 해시 전체
+(청크 압축 + 부모 노드 트리 병합)를 계산합니다.
+수만 개의 샘플을 한 번에 등록할 때 CPU batch_hash 대신 사용합니다.
+
+numba 또는 CUDA 장치가 없으면 is_available()이 False를 반환하며,
+DetectiveCore.batch_hash_gpu()는 자동으로 CPU 경로를 사용합니다.
+
+설치:
+    pip install virus_tracker[cuda]
+"""
+
+from typing import List
+
+try:
+    import numpy as np
+    from numba import cuda, uint64
+except ImportError:  # numpy / numba는 선택 의존성
+    np = None
+    cuda = None
+
+
+# ═══════════════════════════════════════════════
+# BLAKE3 상수
+# ═══════════════════════════════════════════════
+
+_OUT_LEN = 32
+_BLOCK_LEN = 64
+_CHUNK_LEN = 1024
+
+_CHUNK_START = 1
+_CHUNK_END = 2
+_PARENT = 4
+_ROOT = 8
+
+_MASK32 = 0xFFFFFFFF
+
+# 블록당 스레드 수
+_THREADS_PER_BLOCK = 128
+
+
+def is_available() -> bool:
+    """numba.cuda와 CUDA 장치를 사용할 수 있는지 확인합니다."""
+    if cuda is None:
+        return False
+    try:
+        return cuda.is_available()
+    except Exception:
+        return False
+
+
+if cuda is not None:
+    _IV = np.array([0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A,
+                    0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19], dtype=np.uint64)
+
+    # 라운드별 메시지 워드 순서 (MSG_PERMUTATION을 미리 적용한 7라운드 스케줄)
+    _MSG_SCHEDULE = np.array([
+        [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
+        [2, 6, 3, 10, 7, 0, 4, 13, 1, 11, 12, 5, 9, 14, 15, 8],
+        [3, 4, 10, 12, 13, 2, 7, 14, 6, 5, 9, 0, 11, 15, 8, 1],
+        [10, 7, 12, 9, 14, 3, 13, 15, 4, 0, 11, 2, 5, 8, 1, 6],
+        [12, 13, 9, 11, 15, 10, 14, 8, 7, 2, 5, 3, 0, 1, 6, 4],
+        [9, 14, 11, 5, 8, 12, 15, 1, 13, 3, 0, 10, 2, 6, 4, 7],
+        [11, 15, 5, 0, 1, 9, 8, 6, 14, 10, 2, 12, 3, 4, 7, 13],
+    ], dtype=np.int64)
+
+    @cuda.jit(device=True)
+    def _rotr(x, n):
+        return ((x >> n) | (x << (32 - n))) & _MASK32
+
+    @cuda.jit(device=True)
+    def _g(s, a, b, c, d, mx, my):
+        s[a] = (s[a] + s[b] + mx) & _MASK32
+        s[d] = _rotr(s[d] ^ s[a], 16)
+        s[c] = (s[c] + s[d]) & _MASK32
+        s[b] = _rotr(s[b] ^ s[c], 12)
+        s[a] = (s[a] + s[b] + my) & _MASK32
+        s[d] = _rotr(s[d] ^ s[a], 8)
+        s[c] = (s[c] + s[d]) & _MASK32
+        s[b] = _rotr(s[b] ^ s[c], 7)
+
+    @cuda.jit(device=True)
+    def _compress(cv, m, counter, block_len, flags, out_cv):
+        """BLAKE3 압축 함수: out_cv = compress(cv, m, ...)[0:8] (32비트 값을 uint64에 저장)"""
+        s = cuda.local.array(16, dtype=uint64)
+        for k in range(8):
+            s[k] = cv[k]
+        for k in range(4):
+            s[8 + k] = _IV[k]
+        s[12] = counter & _MASK32
+        s[13] = (counter >> 32) & _MASK32
+        s[14] = block_len
+        s[15] = flags
+
+        for r in range(7):
+            sc = _MSG_SCHEDULE[r]
+            _g(s, 0, 4, 8, 12, m[sc[0]], m[sc[1]])
+            _g(s, 1, 5, 9, 13, m[sc[2]], m[sc[3]])
+            _g(s, 2, 6, 10, 14, m[sc[4]], m[sc[5]])
+            _g(s, 3, 7, 11, 15, m[sc[6]], m[sc[7]])
+            _g(s, 0, 5, 10, 15, m[sc[8]], m[sc[9]])
+            _g(s, 1, 6, 11, 12, m[sc[10]], m[sc[11]])
+            _g(s, 2, 7, 8, 13, m[sc[12]], m[sc[13]])
+            _g(s, 3, 4, 9, 14, m[sc[14]], m[sc[15]])
+
+        for k in range(8):
+            out_cv[k] = s[k] ^ s[k + 8]
+
+    @cuda.jit(device=True)
+    def _load_block(data, pos, block_len, m):
+        """data[pos:pos+block_len]를 리틀 엔디언 워드 16개로 읽습니다. (부족분은 0)"""
+        for k in range(16):
+            m[k] = 0
+        for k in range(block_len):
+            m[k >> 2] |= uint64(data[pos + k]) << (8 * (k & 3))
+
+    @cuda.jit
+    def _blake3_kernel(data, offsets, out):
+        i = cuda.grid(1)
+        if i >= out.shape[0]:
+            return
+
+        start = offsets[i]
+        length = offsets[i + 1] - start
+
+        cv_stack = cuda.local.array((54, 8), dtype=uint64)
+        depth = 0
+        cv = cuda.local.array(8, dtype=uint64)
+        m = cuda.local.array(16, dtype=uint64)
+
+        # 마지막 출력 노드 (루트 플래그는 마지막에 붙여서 압축)
+        out_cv = cuda.local.array(8, dtype=uint64)
+        out_counter = 0
+        out_block_len = 0
+        out_flags = 0
+
+        n_chunks = max(1, (length + _CHUNK_LEN - 1) // _CHUNK_LEN)
+        for c in range(n_chunks):
+            chunk_pos = c * _CHUNK_LEN
+            chunk_len = min(_CHUNK_LEN, length - chunk_pos)
+            n_blocks = max(1, (chunk_len + _BLOCK_LEN - 1) // _BLOCK_LEN)
+
+            for k in range(8):
+                cv[k] = _IV[k]
+
+            # 마지막 블록 전까지 체이닝
+            for b in range(n_blocks - 1):
+                _load_block(data, start + chunk_pos + b * _BLOCK_LEN, _BLOCK_LEN, m)
+                flags = _CHUNK_START if b == 0 else 0
+                _compress(cv, m, c, _BLOCK_LEN, flags, cv)
+
+            last = n_blocks - 1
+            block_len = chunk_len - last * _BLOCK_LEN
+            _load_block(data, start + chunk_pos + last * _BLOCK_LEN, block_len, m)
+            flags = _CHUNK_END | (_CHUNK_START if last == 0 else 0)
+
+            if c == n_chunks - 1:
+                for k in range(8):
+                    out_cv[k] = cv[k]
+                out_counter = c
+                out_block_len = block_len
+                out_flags = flags
+                break
+
+            # 완성된 청크 CV를 스택에 넣고 완성된 서브트리는 병합
+            _compress(cv, m, c, block_len, flags, cv)
+            total = c + 1
+            while (total & 1) == 0:
+                depth -= 1
+                for k in range(8):
+                    m[k] = cv_stack[depth, k]
+                    m[8 + k] = cv[k]
+                for k in range(8):
+                    cv[k] = _IV[k]
+                _compress(cv, m, 0, _BLOCK_LEN, _PARENT, cv)
+                total >>= 1
+            for k in range(8):
+                cv_stack[depth, k] = cv[k]
+            depth += 1
+
+        # 스택에 남은 CV를 오른쪽부터 병합 (마지막 노드는 루트로 압축)
+        while depth > 0:
+            _compress(out_cv, m, out_counter, out_block_len, out_flags, cv)
+            depth -= 1
+            for k in range(8):
+                m[k] = cv_stack[depth, k]
+                m[8 + k] = cv[k]
+                out_cv[k] = _IV[k]
+            out_counter = 0
+            out_block_len = _BLOCK_LEN
+            out_flags = _PARENT
+
+        _compress(out_cv, m, out_counter, out_block_len, out_flags | _ROOT, cv)
+        for k in range(32):
+            out[i, k] = (cv[k >> 2] >> (8 * (k & 3))) & 0xFF
+
+
+def batch_hash_gpu(inputs: List[bytes]):
+    """
+    바이트 입력 리스트를 GPU에서 일괄 BLAKE3 해시합니다.
+
+    입력을 하나의 연속 버퍼와 오프셋 배열로 모아 장치로 한 번에 복사하고,
+    입력마다 CUDA 스레드 하나가 해시를 계산합니다.
+
+    Args:
+        inputs: 해시할 바이트 입력 리스트
+
+    Returns:
+        (n, 32) uint8 배열 (행마다 BLAKE3 해시)
+
+    Raises:
+        RuntimeError: numba.cuda 또는 CUDA 장치를 사용할 수 없을 때
+
+    사용 예시:
+        >>> from virus_tracker import gpu
+        >>> if gpu.is_available():
+        ...     digests = gpu.batch_hash_gpu([b"sample1", b"sample2"])
+    """
+    if not is_available():
+        raise RuntimeError("CUDA 장치를 사용할 수 없습니다.")
+
+    n = len(inputs)
+    if n == 0:
+        return np.empty((0, _OUT_LEN), dtype=np.uint8)
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum([len(d) for d in inputs], out=offsets[1:])
+    data = np.frombuffer(b''.join(inputs), dtype=np.uint8)
+    if data.size == 0:
+        data = np.zeros(1, dtype=np.uint8)  # 빈 입력만 있어도 장치 버퍼는 필요
+
+    d_data = cuda.to_device(data)
+    d_offsets = cuda.to_device(offsets)
+    d_out = cuda.device_array((n, _OUT_LEN), dtype=np.uint8)
+
+    blocks = (n + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+    _blake3_kernel[blocks, _THREADS_PER_BLOCK](d_data, d_offsets, d_out)
+    return d_out.copy_to_host()
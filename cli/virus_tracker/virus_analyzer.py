@@ -4,7 +4,37 @@
 import os
 import json
 import datetime
-from .virus_comparator import file_hash, hex_hash, compare_virus_with_hamming
+from contextlib import contextmanager
+from .blake3_wrapper import Blake3Incremental
+from .virus_comparator import file_hash, batch_file_hash, hex_hash, hamming_distance
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성 (없으면 Python 리스트로 정렬)
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성 (없으면 표준 json 사용)
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# 샘플 복사 + 해시 청크 크기 (1MB)
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# 메타데이터에 저장하는 해시의 버전
+# (1: 수정된 BLAKE3 구현. 버전 정보가 없는 항목은 이전 구현의 해시이므로 다시 계산)
+_HASH_VERSION = 1
 
 class VirusAnalyzer:
     def __init__(self, virus_db_path=None):
@@ -23,6 +53,8 @@ class VirusAnalyzer:
         self.virus_db_path = virus_db_path
         self.virus_samples = {}  # 바이러스 샘플 정보 (이름:메타데이터)
         self.virus_hashes = {}   # 바이러스 해시 (이름:해시값)
+        self._dirty = False      # 저장되지 않은 메타데이터 변경 여부
+        self._ingest_depth = 0   # batch_ingest 중첩 깊이 (0보다 크면 저장을 미룸)
         
         # DB 디렉토리가 없는 경우 생성
         if not os.path.exists(self.virus_db_path):
@@ -39,41 +71,74 @@ class VirusAnalyzer:
         """바이러스 데이터베이스 메타데이터 로드"""
         if os.path.exists(self.metadata_file):
             try:
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    self.virus_samples = json.load(f)
+                with open(self.metadata_file, 'rb') as f:
+                    self.virus_samples = _json_loads(f.read())
                 print(f"{len(self.virus_samples)}개의 바이러스 샘플 메타데이터를 로드했습니다.")
             except (json.JSONDecodeError, IOError) as e:
                 print(f"메타데이터 파일 로드 중 오류 발생: {e}")
                 self.virus_samples = {}
         
-        # 해시값 계산/캐싱
+        # 해시값 캐싱 (현재 버전으로 저장된 해시가 있으면 사용)
+        to_hash = []
         for virus_name, metadata in self.virus_samples.items():
             virus_path = os.path.join(self.virus_db_path, virus_name)
             if os.path.exists(virus_path):
-                # 이미 저장된 해시가 있으면 사용
-                if 'hash' in metadata:
+                if 'hash' in metadata and metadata.get('hash_version') == _HASH_VERSION:
                     self.virus_hashes[virus_name] = bytes.fromhex(metadata['hash'])
                 else:
-                    # 해시 계산
-                    try:
-                        hash_bytes = file_hash(virus_path)
-                        self.virus_hashes[virus_name] = hash_bytes
-                        # 메타데이터 업데이트
-                        metadata['hash'] = hash_bytes.hex()
-                    except Exception as e:
-                        print(f"바이러스 파일 '{virus_name}' 해시 계산 중 오류: {e}")
+                    to_hash.append((virus_name, virus_path))
+        
+        if not to_hash:
+            return
+        
+        # 해시가 없거나 이전 버전인 샘플은 한 번에 병렬 계산
+        results = batch_file_hash([virus_path for _, virus_path in to_hash])
+        for (virus_name, _), (hash_bytes, error) in zip(to_hash, results):
+            if error is not None:
+                print(f"바이러스 파일 '{virus_name}' 해시 계산 중 오류: {error}")
+                continue
+            self.virus_hashes[virus_name] = hash_bytes
+            # 메타데이터 업데이트
+            self.virus_samples[virus_name]['hash'] = hash_bytes.hex()
+            self.virus_samples[virus_name]['hash_version'] = _HASH_VERSION
+            self._dirty = True
+        
+        # 다시 계산한 해시를 저장하여 다음 실행에서는 재계산하지 않음
+        if self._dirty:
+            self._save_metadata()
     
     def _save_metadata(self):
         """바이러스 데이터베이스 메타데이터 저장"""
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self.virus_samples, f, indent=2, ensure_ascii=False)
+            with open(self.metadata_file, 'wb') as f:
+                f.write(_json_dumps(self.virus_samples))
+            self._dirty = False
             return True
         except IOError as e:
             print(f"메타데이터 저장 중 오류 발생: {e}")
             return False
     
-    def add_virus_sample(self, file_path, virus_name=None, metadata=None):
+    @contextmanager
+    def batch_ingest(self):
+        """
+        여러 샘플을 추가하는 동안 메타데이터 저장을 미루고 끝날 때 한 번만 저장
+        
+        샘플마다 metadata.json 전체를 다시 쓰지 않으므로 대량 등록 시 쓰기가 N번에서 1번으로 줄어듭니다.
+        
+        사용 예시:
+            with analyzer.batch_ingest():
+                for path in files:
+                    analyzer.add_virus_sample(path)
+        """
+        self._ingest_depth += 1
+        try:
+            yield self
+        finally:
+            self._ingest_depth -= 1
+            if self._ingest_depth == 0 and self._dirty:
+                self._save_metadata()
+    
+    def add_virus_sample(self, file_path, virus_name=None, metadata=None, flush=True):
         """
         바이러스 샘플을 데이터베이스에 추가
         
@@ -81,6 +146,7 @@ class VirusAnalyzer:
             file_path: 바이러스 파일 경로
             virus_name: 바이러스 이름 (미지정 시 파일 이름 사용)
             metadata: 추가 메타데이터 (딕셔너리)
+            flush: True이면 바로 metadata.json 저장 (batch_ingest 안에서는 블록이 끝날 때 저장)
             
         Returns:
             성공 여부 (Boolean)
@@ -97,28 +163,37 @@ class VirusAnalyzer:
             timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
             virus_name = f"{virus_name}_{timestamp}"
         
-        # 바이러스 DB에 파일 복사
+        # 바이러스 DB에 파일 복사 (복사하면서 같은 청크로 해시 계산, 파일은 한 번만 읽음)
         dest_path = os.path.join(self.virus_db_path, virus_name)
+        try:
+            hasher = Blake3Incremental()
+        except Exception as e:
+            print(f"해시 계산 중 오류 발생: {e}")
+            return False
+        
+        buf = bytearray(_COPY_CHUNK_SIZE)
+        view = memoryview(buf)
         try:
             with open(file_path, 'rb') as src, open(dest_path, 'wb') as dest:
-                dest.write(src.read())
+                while True:
+                    n = src.readinto(buf)
+                    if not n:
+                        break
+                    dest.write(view[:n])
+                    hasher.update(view[:n])
         except IOError as e:
             print(f"파일 복사 중 오류 발생: {e}")
             return False
         
-        # 해시 계산
-        try:
-            hash_bytes = file_hash(dest_path)
-            hash_hex = hash_bytes.hex()
-        except Exception as e:
-            print(f"해시 계산 중 오류 발생: {e}")
-            return False
+        hash_bytes = hasher.finalize()
+        hash_hex = hash_bytes.hex()
         
         # 메타데이터 생성
         sample_metadata = {
             'added_date': datetime.datetime.now().isoformat(),
             'original_path': file_path,
             'hash': hash_hex,
+            'hash_version': _HASH_VERSION,
             'size': os.path.getsize(file_path)
         }
         
@@ -131,7 +206,9 @@ class VirusAnalyzer:
         self.virus_hashes[virus_name] = hash_bytes
         
         # 메타데이터 파일 업데이트
-        self._save_metadata()
+        self._dirty = True
+        if flush and self._ingest_depth == 0:
+            self._save_metadata()
         
         print(f"바이러스 샘플 '{virus_name}'이(가) 데이터베이스에 추가되었습니다.")
         return True
@@ -156,17 +233,63 @@ class VirusAnalyzer:
             return []
         
         # 분석할 파일의 해시 계산
-        target_hash = file_hash(file_path)
-        results = []
+        return self._match_hash(file_hash(file_path), similarity_threshold)
+    
+    def analyze_files(self, file_paths, similarity_threshold=0.85):
+        """
+        여러 파일을 한 번에 분석 (파일 해시는 병렬로 계산)
         
-        # 각 바이러스 샘플과 비교
-        for virus_name, virus_hash in self.virus_hashes.items():
-            # 해밍 거리 기반 유사도 계산
-            distance, similarity = compare_virus_with_hamming(
-                file_path, 
-                os.path.join(self.virus_db_path, virus_name)
-            )
+        Args:
+            file_paths: 분석할 파일 경로 리스트
+            similarity_threshold: 유사도 임계값 (0~1, 이 값 이상이면 보고)
             
+        Returns:
+            (파일 경로, (일치한 바이러스 이름, 유사도) 튜플의 리스트) 쌍의 리스트
+            (file_paths와 같은 순서, 같은 경로가 여러 번 있으면 그만큼 반복)
+        """
+        for file_path in file_paths:
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"파일이 존재하지 않습니다: {file_path}")
+        
+        # DB에 바이러스가 없으면 빈 결과 반환
+        if not self.virus_hashes:
+            print("바이러스 데이터베이스가 비어있습니다.")
+            return [(file_path, []) for file_path in file_paths]
+        
+        reports = []
+        for file_path, (target_hash, error) in zip(file_paths, batch_file_hash(file_paths)):
+            if error is not None:
+                raise error
+            reports.append((file_path, self._match_hash(target_hash, similarity_threshold)))
+        return reports
+    
+    def _match_hash(self, target_hash, similarity_threshold):
+        """대상 해시와 저장된 해시를 비교하여 임계값 이상인 바이러스를 유사도 순으로 반환"""
+        results = []
+        
+        # 저장된 해시 중 대상과 길이가 같은 것만 비교 (파일을 다시 읽지 않음)
+        names = [name for name, h in self.virus_hashes.items() if len(h) == len(target_hash)]
+        hashes = [self.virus_hashes[name] for name in names]
+        total_bits = len(target_hash) * 8
+        
+        # 해밍 거리 일괄 계산 (네이티브 라이브러리가 없으면 Python으로 계산)
+        # detective_core는 비교할 때만 로드 (add/list 등은 라이브러리 없이 동작)
+        try:
+            from .detective_core_wrapper import batch_hamming
+            distances = batch_hamming(target_hash, hashes)
+        except RuntimeError:
+            distances = [hamming_distance(target_hash, h) for h in hashes]
+        
+        if np is not None:
+            # 임계값 필터링과 유사도 내림차순 정렬을 numpy에서 처리 (동률은 DB 순서 유지)
+            similarities = 1.0 - np.asarray(distances, dtype=np.float64) / total_bits
+            matched = np.nonzero(similarities >= similarity_threshold)[0]
+            order = matched[np.argsort(-similarities[matched], kind='stable')]
+            return [(names[i], similarity)
+                    for i, similarity in zip(order.tolist(), similarities[order].tolist())]
+        
+        for virus_name, distance in zip(names, distances):
+            similarity = 1.0 - (distance / total_bits)
             if similarity >= similarity_threshold:
                 results.append((virus_name, similarity))
         
@@ -186,6 +309,15 @@ class VirusAnalyzer:
         """
         return self.virus_samples.get(virus_name)
     
+    def get_all_virus_info(self):
+        """
+        모든 바이러스 샘플의 상세 정보를 한 번에 조회
+        
+        Returns:
+            {바이러스 이름: 바이러스 정보 딕셔너리} 딕셔너리 (등록 순서 유지)
+        """
+        return dict(self.virus_samples)
+    
     def get_all_viruses(self):
         """
         모든 바이러스 샘플 목록 반환
@@ -4,8 +4,22 @@ Blake3 해시를 이용해 바이러스 파일의 유사도를 계산합니다.
 """
 import os
 import binascii
+from concurrent.futures import ThreadPoolExecutor
 from .blake3_wrapper import file_hash
 
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성 (없으면 정수 XOR로 계산)
+    np = None
+
+try:
+    from hexhamming import hamming_distance_bytes as _hexhamming_bytes
+except ImportError:  # hexhamming은 선택 의존성 (없으면 정수 XOR로 계산)
+    _hexhamming_bytes = None
+
+# 이 크기(바이트)를 넘는 입력은 numpy로 해밍 거리 / 일치 바이트 계산 (해시 크기에서는 정수 연산이 더 빠름)
+_NUMPY_HAMMING_MIN_BYTES = 4096
+
 def compare_virus_files(file_path1, file_path2, digest_size=64):
     """
     두 바이러스 파일을 비교하여 유사도를 계산합니다.
@@ -32,8 +46,7 @@ def compare_virus_files(file_path1, file_path2, digest_size=64):
         return True, 1.0
     
     # 해시 바이트 단위로 유사도 계산
-    matching_bytes = sum(b1 == b2 for b1, b2 in zip(hash1, hash2))
-    similarity = matching_bytes / len(hash1)
+    similarity = matching_bytes(hash1, hash2) / len(hash1)
     
     return False, similarity
 
@@ -51,6 +64,33 @@ def hex_hash(file_path, digest_size=64):
     hash_bytes = file_hash(file_path, digest_size)
     return binascii.hexlify(hash_bytes).decode('ascii')
 
+def batch_file_hash(file_paths, digest_size=32, max_workers=None):
+    """
+    여러 파일의 Blake3 해시를 스레드 풀에서 병렬로 계산합니다.
+    Blake3 C 호출 중에는 GIL이 해제되므로 파일 읽기와 해시가 여러 코어에서 동시에 진행됩니다.
+    
+    Args:
+        file_paths: 해시할 파일 경로 리스트
+        digest_size: 해시 결과의 바이트 크기 (기본값: 32)
+        max_workers: 스레드 수 (기본값: CPU 코어 수)
+        
+    Returns:
+        입력 순서대로 (해시 값, 오류) 튜플의 리스트
+        (성공하면 오류가 None, 실패하면 해시 값이 None)
+    """
+    def hash_one(path):
+        try:
+            return file_hash(path, digest_size), None
+        except Exception as e:
+            return None, e
+    
+    file_paths = list(file_paths)
+    if len(file_paths) <= 1:
+        return [hash_one(path) for path in file_paths]
+    
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(hash_one, file_paths))
+
 def hamming_distance(bytes1, bytes2):
     """
     두 바이트 시퀀스 간의 해밍 거리를 계산합니다.
@@ -66,18 +106,58 @@ def hamming_distance(bytes1, bytes2):
     if len(bytes1) != len(bytes2):
         raise ValueError("입력 바이트 시퀀스의 길이가 다릅니다.")
     
-    # XOR 연산으로 다른 비트 찾기
-    xor_result = bytearray(a ^ b for a, b in zip(bytes1, bytes2))
+    # hexhamming은 bytes 타입만 받음 (SIMD popcount로 원시 바이트를 직접 비교)
+    if _hexhamming_bytes is not None and type(bytes1) is bytes and type(bytes2) is bytes:
+        return _hexhamming_bytes(bytes1, bytes2)
+    
+    if np is not None and len(bytes1) > _NUMPY_HAMMING_MIN_BYTES:
+        return _hamming_distance_numpy(bytes1, bytes2)
+    
+    # 바이트열 전체를 정수 하나로 보고 XOR 후 1인 비트 개수 세기
+    xor_result = int.from_bytes(bytes1, 'little') ^ int.from_bytes(bytes2, 'little')
+    return _popcount(xor_result)
+
+def matching_bytes(bytes1, bytes2):
+    """
+    두 같은 길이 바이트 시퀀스에서 같은 위치의 값이 일치하는 바이트 수를 셉니다.
+    
+    Args:
+        bytes1: 첫 번째 바이트 시퀀스
+        bytes2: 두 번째 바이트 시퀀스
+        
+    Returns:
+        일치하는 바이트 개수
+    """
+    if np is not None and len(bytes1) > _NUMPY_HAMMING_MIN_BYTES:
+        a = np.frombuffer(bytes1, dtype=np.uint8)
+        b = np.frombuffer(bytes2, dtype=np.uint8)
+        return int(np.count_nonzero(a == b))
+    
+    # 정수 XOR 결과를 다시 바이트열로 바꾸면 일치한 위치는 0 바이트
+    xor_result = int.from_bytes(bytes1, 'little') ^ int.from_bytes(bytes2, 'little')
+    return xor_result.to_bytes(len(bytes1), 'little').count(0)
+
+def _popcount(value):
+    """정수의 1인 비트 개수를 셉니다."""
+    if hasattr(value, 'bit_count'):  # Python 3.10+
+        return value.bit_count()
+    return bin(value).count('1')
+
+def _hamming_distance_numpy(bytes1, bytes2):
+    """numpy로 큰 바이트 시퀀스의 해밍 거리를 계산합니다. (8바이트 단위 XOR)"""
+    a = np.frombuffer(bytes1, dtype=np.uint8)
+    b = np.frombuffer(bytes2, dtype=np.uint8)
     
-    # 1인 비트 개수 세기
-    bit_count = 0
-    for byte in xor_result:
-        # 각 바이트 내의 1 비트 개수 세기
-        while byte:
-            bit_count += byte & 1
-            byte >>= 1
+    # 8바이트 배수로 0 패딩하여 uint64 단위로 XOR
+    pad = -len(a) % 8
+    if pad:
+        a = np.concatenate([a, np.zeros(pad, dtype=np.uint8)])
+        b = np.concatenate([b, np.zeros(pad, dtype=np.uint8)])
+    xor_result = np.bitwise_xor(a.view(np.uint64), b.view(np.uint64))
     
-    return bit_count
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        return int(np.bitwise_count(xor_result).sum())
+    return int(np.unpackbits(xor_result.view(np.uint8)).sum())
 
 def compare_virus_with_hamming(file_path1, file_path2, digest_size=64):
     """
@@ -43,4 +43,18 @@ void blake3_hasher_finalize(const blake3_hasher *self, uint8_t *out, size_t out_
 // 편의 함수
 void blake3(const void *input, size_t input_len, uint8_t *out, size_t out_len);
 
+// 단일 청크(1024바이트 이하) 입력 전용 32바이트 해시 (더 긴 입력은 blake3()로 처리)
+void blake3_short(const void *input, size_t input_len, uint8_t out[BLAKE3_OUT_LEN]);
+
+// 길이가 같은 입력 num_inputs개를 병렬 해시 (out: num_inputs * BLAKE3_OUT_LEN 바이트)
+void blake3_hash_many(const uint8_t *const *inputs, size_t num_inputs,
+                      size_t input_len, uint8_t *out);
+
+// 길이가 서로 다른 입력 num_inputs개를 병렬 해시 (lens: 입력별 길이, out: num_inputs * BLAKE3_OUT_LEN 바이트)
+void blake3_hash_many_ragged(const uint8_t *const *inputs, const size_t *lens,
+                             size_t num_inputs, uint8_t *out);
+
+// 빌드 시 활성화된 SIMD 백엔드 이름 ("avx512", "avx2", "sse41", "sse2", "portable")
+const char *blake3_simd_backend(void);
+
 #endif //BLAKE3_H
\ No newline at end of file
@@ -8,6 +8,7 @@
  *   3. 대량 배치 해시 생성 (Python 리스트 대응)
  *   4. 대량 배치 해시 비교 (바이러스 DB 매칭)
  *   5. 유사도 기반 배치 검색
+ *   6. 연속 메모리 DB 검색 (완전 일치 / 해밍 거리)
  *
  * ──────────────────────────────────────────────
  * 사용 예시 (Python ctypes):
@@ -60,6 +61,9 @@
 /** 해시의 16진수 문자열 길이 (32바이트 * 2 + null terminator) */
 #define DETECTIVE_HEX_LEN      (DETECTIVE_HASH_LEN * 2 + 1)
 
+/** 다중 대상 DB 검색 기본 타일 크기 (8192행 * 32바이트 = 256KB, L2에 상주) */
+#define DETECTIVE_SEARCH_TILE_ROWS  8192
+
 /* ═══════════════════════════════════════════════
  * 유사도 결과 구조체
  * ═══════════════════════════════════════════════ */
@@ -156,6 +160,23 @@ EXPORT int hash_compare(const char* hash1, const char* hash2);
 EXPORT int hash_hamming_distance(const uint8_t* hash1, const uint8_t* hash2,
                                  size_t len);
 
+/**
+ * @brief 대상 해시와 DB 해시 n개 사이의 해밍 거리 일괄 계산
+ *
+ * @param target  대상 해시 (len 바이트)
+ * @param db      DB 해시 포인터 배열 (각 len 바이트)
+ * @param n       DB 해시 개수
+ * @param len     해시 길이 (바이트, 자유)
+ * @param out     [out] 해시별 해밍 거리 (호출자가 n개 할당, NULL 항목은 -1)
+ * @return 0 = 성공, -1 = 잘못된 인자
+ *
+ * 사용 예시 (C):
+ *   int dists[DB_SIZE];
+ *   blake3_hamming_distance_many(target, db_ptrs, DB_SIZE, 64, dists);
+ */
+EXPORT int blake3_hamming_distance_many(const uint8_t* target, const uint8_t** db,
+                                        size_t n, size_t len, int* out);
+
 /* ═══════════════════════════════════════════════
  * 3. 배치 해시 처리 (Python List 대응)
  * ═══════════════════════════════════════════════ */
@@ -186,6 +207,45 @@ EXPORT char** batch_hash_strings(const char** strings, int count);
  */
 EXPORT void free_batch_hashes(char** hashes, int count);
 
+/**
+ * @brief 길이가 같은 입력들을 SIMD 레인에 나눠 담아 일괄 해시 (바이너리 결과)
+ *
+ * 짧은 입력(1 청크 = 1024바이트 이하)은 최대 8개씩 한 번에 압축합니다.
+ * 결과는 호출자가 할당한 연속 버퍼에 입력 순서대로 32바이트씩 기록됩니다.
+ *
+ * @param inputs     입력 데이터 포인터 배열 (모두 input_len 바이트)
+ * @param count      입력 개수
+ * @param input_len  각 입력의 길이 (바이트)
+ * @param out        결과 버퍼 (최소 count * DETECTIVE_HASH_LEN 바이트)
+ *
+ * 사용 예시 (C):
+ *   const uint8_t* inputs[] = {(uint8_t*)"code1", (uint8_t*)"code2"};
+ *   uint8_t out[2 * 32];
+ *   batch_hash_fixed_len(inputs, 2, 5, out);
+ */
+EXPORT void batch_hash_fixed_len(const uint8_t** inputs, int count,
+                                 size_t input_len, uint8_t* out);
+
+/**
+ * @brief 길이가 서로 다른 입력들을 SIMD 레인에 나눠 담아 일괄 해시 (바이너리 결과)
+ *
+ * 블록 수가 같은 입력끼리 최대 8개씩 묶어 한 번에 압축하고,
+ * 1 청크(1024바이트)를 넘는 입력은 개별 해시합니다.
+ *
+ * @param inputs  입력 데이터 포인터 배열
+ * @param lens    입력별 길이 (바이트)
+ * @param count   입력 개수
+ * @param out     결과 버퍼 (최소 count * DETECTIVE_HASH_LEN 바이트)
+ *
+ * 사용 예시 (C):
+ *   const uint8_t* inputs[] = {(uint8_t*)"a", (uint8_t*)"bcd"};
+ *   size_t lens[] = {1, 3};
+ *   uint8_t out[2 * 32];
+ *   batch_hash_many(inputs, lens, 2, out);
+ */
+EXPORT void batch_hash_many(const uint8_t** inputs, const size_t* lens,
+                            int count, uint8_t* out);
+
 /* ═══════════════════════════════════════════════
  * 4. 배치 해시 비교 (바이러스 DB 매칭)
  * ═══════════════════════════════════════════════ */
@@ -254,6 +314,31 @@ EXPORT SimilarityResult* batch_similarity_search(
     const uint8_t** db_hashes, int db_count,
     double threshold, int* result_count);
 
+/**
+ * @brief 연속 바이너리 DB에서 대상 해시와 유사한 항목 검색
+ *
+ * batch_similarity_search()와 결과가 같지만 DB를 포인터 배열 대신
+ * 연속 버퍼(db_count * hash_len 바이트, 행 우선)로 받습니다.
+ *
+ * @param target_hash   대상 해시 (hash_len 바이트)
+ * @param db_flat       연속 DB 버퍼 (db_count * hash_len 바이트)
+ * @param db_count      DB 해시 개수
+ * @param hash_len      해시 길이 (바이트)
+ * @param threshold     유사도 임계값 (0.0 ~ 1.0)
+ * @param result_count  [out] 결과 개수가 저장될 포인터
+ * @return              SimilarityResult 배열 (free_similarity_results()로 해제)
+ *
+ * 사용 예시 (C):
+ *   int count;
+ *   SimilarityResult* results = batch_similarity_search_flat(
+ *       target, db_flat, db_size, 32, 0.85, &count);
+ *   free_similarity_results(results);
+ */
+EXPORT SimilarityResult* batch_similarity_search_flat(
+    const uint8_t* target_hash, const uint8_t* db_flat,
+    int db_count, int hash_len,
+    double threshold, int* result_count);
+
 /**
  * @brief batch_similarity_search()가 반환한 결과 배열 메모리 해제
  *
@@ -261,4 +346,102 @@ EXPORT SimilarityResult* batch_similarity_search(
  */
 EXPORT void free_similarity_results(SimilarityResult* results);
 
+/* ═══════════════════════════════════════════════
+ * 6. 연속 메모리 DB 검색
+ * ═══════════════════════════════════════════════ */
+
+/**
+ * @brief 연속 바이너리 DB에서 대상 해시와 완전 일치하는 행 검색
+ *
+ * DB는 32바이트 해시 n개를 이어붙인 하나의 버퍼(SoA)입니다.
+ * 문자열 포인터 배열을 쓰는 batch_compare_hash()와 달리
+ * 포인터 추적 없이 순차 접근합니다.
+ *
+ * @param blob     n * DETECTIVE_HASH_LEN 바이트의 연속 DB
+ * @param n        DB 행 개수
+ * @param target   대상 해시 (바이너리 32바이트)
+ * @param out_idx  [out] 일치 인덱스 버퍼 (호출자가 n개 이상 할당)
+ * @return         일치한 행 개수
+ *
+ * 사용 예시 (C):
+ *   uint32_t idx[DB_SIZE];
+ *   int found = db_find_exact(blob, DB_SIZE, target, idx);
+ */
+EXPORT int db_find_exact(const uint8_t* blob, size_t n,
+                         const uint8_t* target, uint32_t* out_idx);
+
+/**
+ * @brief 연속 바이너리 DB에서 완전 일치 행 검색 (64행 비트맵 + ctz 방식)
+ *
+ * db_find_exact와 결과가 같으며, 행마다 분기하지 않고 64행씩
+ * 일치 비트맵을 만든 뒤 설정된 비트만 인덱스로 꺼냅니다.
+ *
+ * @param db       n * DETECTIVE_HASH_LEN 바이트의 연속 DB
+ * @param n        DB 행 개수
+ * @param target   찾을 해시 (바이너리 32바이트)
+ * @param out_idx  [out] 일치한 행 인덱스 (호출자가 n개 할당)
+ * @return 일치한 행 개수
+ *
+ * 사용 예시 (C):
+ *   uint32_t idx[DB_SIZE];
+ *   size_t found = db_find_all(blob, DB_SIZE, target, idx);
+ */
+EXPORT size_t db_find_all(const uint8_t* db, size_t n,
+                          const uint8_t* target, uint32_t* out_idx);
+
+/**
+ * @brief 여러 대상 해시를 연속 바이너리 DB에서 타일 단위로 검색
+ *
+ * DB를 tile_rows행씩 나누어 타일마다 모든 대상을 검색하므로
+ * DB가 캐시보다 커도 메모리에서 한 번만 읽습니다.
+ *
+ * @param db         n * DETECTIVE_HASH_LEN 바이트의 연속 DB
+ * @param n          DB 행 개수
+ * @param targets    m * DETECTIVE_HASH_LEN 바이트의 대상 해시들
+ * @param m          대상 개수
+ * @param tile_rows  타일 크기 (행, 0이면 DETECTIVE_SEARCH_TILE_ROWS)
+ * @param out_pairs  [out] (행 인덱스, 대상 인덱스) 쌍 (max_pairs * 2개 할당)
+ * @param max_pairs  out_pairs에 기록할 최대 쌍 개수
+ * @return 전체 일치 개수 (max_pairs보다 크면 버퍼를 늘려 다시 호출)
+ */
+EXPORT size_t db_find_many(const uint8_t* db, size_t n,
+                           const uint8_t* targets, size_t m, size_t tile_rows,
+                           uint32_t* out_pairs, size_t max_pairs);
+
+/**
+ * @brief 여러 입력을 해시한 뒤 DB에서 한 번에 검색 (해시 + 검색 결합)
+ *
+ * @param data         입력 포인터 배열 (m개)
+ * @param lens         입력별 바이트 길이 (m개)
+ * @param m            입력 개수
+ * @param db           n * DETECTIVE_HASH_LEN 바이트의 연속 DB (NULL이면 해시만 계산)
+ * @param n            DB 행 개수
+ * @param out_pairs    [out] (행 인덱스, 입력 인덱스) 쌍 (max_pairs * 2개 할당)
+ * @param max_pairs    out_pairs에 기록할 최대 쌍 개수
+ * @param out_digests  [out] 입력별 다이제스트 (호출자가 m * DETECTIVE_HASH_LEN 바이트 할당, 필수)
+ * @return 전체 일치 개수
+ */
+EXPORT size_t scan_files(const uint8_t** data, const size_t* lens, size_t m,
+                         const uint8_t* db, size_t n,
+                         uint32_t* out_pairs, size_t max_pairs,
+                         uint8_t* out_digests);
+
+/**
+ * @brief 연속 바이너리 DB 각 행과 대상 해시 사이의 해밍 거리 계산
+ *
+ * 32바이트 해시 전용입니다. 거리는 0 ~ 256 범위이며
+ * 유사도 = 1.0 - 거리 / 256.0 으로 환산합니다.
+ *
+ * @param db         n * DETECTIVE_HASH_LEN 바이트의 연속 DB
+ * @param n          DB 행 개수
+ * @param target     대상 해시 (바이너리 32바이트)
+ * @param out_dists  [out] 행별 해밍 거리 (호출자가 n개 할당)
+ *
+ * 사용 예시 (C):
+ *   uint16_t dists[DB_SIZE];
+ *   hamming_scan_32b(blob, DB_SIZE, target, dists);
+ */
+EXPORT void hamming_scan_32b(const uint8_t* db, size_t n,
+                             const uint8_t* target, uint16_t* out_dists);
+
 #endif /* DETECTIVE_CORE_H */
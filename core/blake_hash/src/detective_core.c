@@ -1,6 +1,6 @@
-* @file detective_core.c
-* @brief Detective-H Core Module - BLAKE3 해시 및 배치 비교 구현
 /**
+ * @file detective_core.c
+ * @brief Detective-H Core Module - BLAKE3 해시 및 배치 비교 구현
  *
  * 이 파일은 detective_core.h에 선언된 모든 함수를 구현합니다.
  * 내부적으로 blake3.h의 BLAKE3 알고리즘을 사용합니다.
@@ -23,6 +23,10 @@
 #include "../include/detective_core.h"
 #include "../include/blake3.h"
 
+#if defined(__AVX2__)
+#include <immintrin.h>
+#endif
+
 /* ═══════════════════════════════════════════════
  * 내부 유틸리티 함수
  * ═══════════════════════════════════════════════ */
@@ -47,18 +51,135 @@ static void bytes_to_hex(const uint8_t* bytes, size_t len, char* hex_out) {
 }
 
 /**
- * @brief popcount - 바이트 내 1인 비트 개수 세기
+ * @brief popcount64 - 64비트 워드 내 1인 비트 개수 세기
  *
- * 해밍 거리 계산에 사용됩니다.
- * 컴파일러 built-in을 사용할 수 없을 때 fallback입니다.
+ * GCC/Clang에서는 POPCNT 명령으로 컴파일되는 built-in을 사용하고,
+ * 그 외 컴파일러에서는 SWAR 방식으로 계산합니다.
  */
-static int count_bits(uint8_t byte) {
-    int count = 0;
-    while (byte) {
-        count += byte & 1;
-        byte >>= 1;
+static int popcount64(uint64_t x) {
+#if defined(__GNUC__) || defined(__clang__)
+    return __builtin_popcountll(x);
+#else
+    x = x - ((x >> 1) & 0x5555555555555555ULL);
+    x = (x & 0x3333333333333333ULL) + ((x >> 2) & 0x3333333333333333ULL);
+    x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0FULL;
+    return (int)((x * 0x0101010101010101ULL) >> 56);
+#endif
+}
+
+/**
+ * @brief ctz64 - 64비트 워드의 최하위 1 비트 위치 (x != 0)
+ *
+ * GCC/Clang에서는 TZCNT/BSF로 컴파일되는 built-in을 사용합니다.
+ */
+static int ctz64(uint64_t x) {
+#if defined(__GNUC__) || defined(__clang__)
+    return __builtin_ctzll(x);
+#else
+    /* 최하위 비트만 남긴 뒤 그 아래 비트 수 = 위치 */
+    return popcount64((x & (0 - x)) - 1);
+#endif
+}
+
+#if defined(__AVX2__)
+/**
+ * @brief popcount_epi8 - 32바이트 각 바이트의 비트 수 (Muła 니블 LUT 방식)
+ *
+ * 하위/상위 니블을 VPSHUFB로 4비트 popcount 테이블에서 조회해 더합니다.
+ */
+static inline __m256i popcount_epi8(__m256i v) {
+    const __m256i lut = _mm256_setr_epi8(
+        0, 1, 1, 2, 1, 2, 2, 3, 1, 2, 2, 3, 2, 3, 3, 4,
+        0, 1, 1, 2, 1, 2, 2, 3, 1, 2, 2, 3, 2, 3, 3, 4);
+    const __m256i low_mask = _mm256_set1_epi8(0x0f);
+    __m256i lo = _mm256_and_si256(v, low_mask);
+    __m256i hi = _mm256_and_si256(_mm256_srli_epi16(v, 4), low_mask);
+    return _mm256_add_epi8(_mm256_shuffle_epi8(lut, lo),
+                           _mm256_shuffle_epi8(lut, hi));
+}
+#endif
+
+/**
+ * @brief hamming32 - 32바이트(BLAKE3 기본 길이) 해시 전용 해밍 거리
+ *
+ * 길이가 고정이므로 루프와 꼬리 처리 없이 256비트 XOR 한 번으로 계산합니다.
+ * AVX-512 VPOPCNTDQ+VL 빌드: VPOPCNTQ 한 번 + 수평 합
+ * AVX2 빌드: 니블 LUT popcount + VPSADBW
+ * 그 외: 64비트 워드 4개 popcount64
+ */
+static inline size_t hamming32(const uint8_t* a, const uint8_t* b) {
+#if defined(__AVX512VPOPCNTDQ__) && defined(__AVX512VL__)
+    __m256i x = _mm256_xor_si256(_mm256_loadu_si256((const __m256i*)a),
+                                 _mm256_loadu_si256((const __m256i*)b));
+    __m256i p = _mm256_popcnt_epi64(x);
+    __m128i s = _mm_add_epi64(_mm256_castsi256_si128(p), _mm256_extracti128_si256(p, 1));
+    return (size_t)(_mm_cvtsi128_si64(s) + _mm_extract_epi64(s, 1));
+#elif defined(__AVX2__)
+    __m256i x = _mm256_xor_si256(_mm256_loadu_si256((const __m256i*)a),
+                                 _mm256_loadu_si256((const __m256i*)b));
+    __m256i p = _mm256_sad_epu8(popcount_epi8(x), _mm256_setzero_si256());
+    __m128i s = _mm_add_epi64(_mm256_castsi256_si128(p), _mm256_extracti128_si256(p, 1));
+    return (size_t)(_mm_cvtsi128_si64(s) + _mm_extract_epi64(s, 1));
+#else
+    uint64_t x[4], y[4];
+    memcpy(x, a, DETECTIVE_HASH_LEN);
+    memcpy(y, b, DETECTIVE_HASH_LEN);
+    return (size_t)(popcount64(x[0] ^ y[0]) + popcount64(x[1] ^ y[1]) +
+                    popcount64(x[2] ^ y[2]) + popcount64(x[3] ^ y[3]));
+#endif
+}
+
+/**
+ * @brief hamming_bytes - 임의 길이 바이트열 사이의 해밍 거리
+ *
+ * AVX-512 VPOPCNTDQ 빌드: 64바이트씩 XOR + VPOPCNTQ, 꼬리는 마스크 로드
+ * AVX2 빌드: 32바이트씩 XOR + 니블 LUT popcount + VPSADBW
+ * 그 외: 8바이트 워드 단위 popcount64
+ * 32바이트는 hamming32 전용 경로로 바로 분기
+ */
+static size_t hamming_bytes(const uint8_t* a, const uint8_t* b, size_t len) {
+    if (len == DETECTIVE_HASH_LEN) {
+        return hamming32(a, b);
     }
-    return count;
+
+    size_t i = 0;
+    size_t distance = 0;
+#if defined(__AVX512F__) && defined(__AVX512BW__) && defined(__AVX512VPOPCNTDQ__)
+    __m512i acc = _mm512_setzero_si512();
+    for (; i + 64 <= len; i += 64) {
+        __m512i x = _mm512_xor_si512(_mm512_loadu_si512((const void*)(a + i)),
+                                     _mm512_loadu_si512((const void*)(b + i)));
+        acc = _mm512_add_epi64(acc, _mm512_popcnt_epi64(x));
+    }
+    if (i < len) {
+        __mmask64 m = (__mmask64)(~0ULL >> (64 - (len - i)));
+        __m512i x = _mm512_xor_si512(_mm512_maskz_loadu_epi8(m, a + i),
+                                     _mm512_maskz_loadu_epi8(m, b + i));
+        acc = _mm512_add_epi64(acc, _mm512_popcnt_epi64(x));
+        i = len;
+    }
+    distance = (size_t)_mm512_reduce_add_epi64(acc);
+#elif defined(__AVX2__)
+    __m256i acc = _mm256_setzero_si256();
+    const __m256i zero = _mm256_setzero_si256();
+    for (; i + 32 <= len; i += 32) {
+        __m256i x = _mm256_xor_si256(_mm256_loadu_si256((const __m256i*)(a + i)),
+                                     _mm256_loadu_si256((const __m256i*)(b + i)));
+        acc = _mm256_add_epi64(acc, _mm256_sad_epu8(popcount_epi8(x), zero));
+    }
+    __m128i s = _mm_add_epi64(_mm256_castsi256_si128(acc), _mm256_extracti128_si256(acc, 1));
+    distance = (size_t)_mm_cvtsi128_si64(s) + (size_t)_mm_extract_epi64(s, 1);
+#endif
+    for (; i + 8 <= len; i += 8) {
+        uint64_t x, y;
+        memcpy(&x, a + i, 8);
+        memcpy(&y, b + i, 8);
+        distance += (size_t)popcount64(x ^ y);
+    }
+    for (; i < len; i++) {
+        distance += (size_t)popcount64((uint64_t)(a[i] ^ b[i]));
+    }
+    return distance;
 }
 
 /* ═══════════════════════════════════════════════
@@ -177,13 +298,34 @@ EXPORT int hash_hamming_distance(const uint8_t* hash1, const uint8_t* hash2,
         return -1;
     }
 
-    int distance = 0;
-    for (size_t i = 0; i < len; i++) {
-        /* XOR로 다른 비트를 찾고 popcount */
-        uint8_t diff = hash1[i] ^ hash2[i];
-        distance += count_bits(diff);
+    /* XOR로 다른 비트를 찾고 popcount (SIMD 빌드는 벡터 popcount) */
+    return (int)hamming_bytes(hash1, hash2, len);
+}
+
+/**
+ * blake3_hamming_distance_many - 대상 해시와 DB 해시 n개 사이의 해밍 거리 일괄 계산
+ *
+ * 해시 길이(len)는 자유이며 (32바이트 BLAKE3, 64바이트 파일 해시 등)
+ * 빌드에 따라 AVX-512 VPOPCNTDQ / AVX2 / 스칼라 popcount를 사용합니다.
+ *
+ * 사용 예시 (C):
+ *   int dists[DB_SIZE];
+ *   blake3_hamming_distance_many(target, db_ptrs, DB_SIZE, 32, dists);
+ *
+ * 사용 예시 (Python):
+ *   distances = batch_hamming(target_hash, db_hashes)
+ *
+ * @return 0 = 성공, -1 = 잘못된 인자
+ */
+EXPORT int blake3_hamming_distance_many(const uint8_t* target, const uint8_t** db,
+                                        size_t n, size_t len, int* out) {
+    if (target == NULL || db == NULL || out == NULL) {
+        return -1;
     }
-    return distance;
+    for (size_t i = 0; i < n; i++) {
+        out[i] = db[i] == NULL ? -1 : (int)hamming_bytes(target, db[i], len);
+    }
+    return 0;
 }
 
 /* ═══════════════════════════════════════════════
@@ -262,6 +404,47 @@ EXPORT void free_batch_hashes(char** hashes, int count) {
     free(hashes);
 }
 
+/**
+ * batch_hash_fixed_len - 같은 길이 입력들의 레인 병렬 해시
+ *
+ * blake3_hash_many()로 최대 8개 입력을 한 번에 압축합니다.
+ * 결과는 hex 문자열 대신 연속된 바이너리 버퍼로 반환되어
+ * 입력마다 malloc 할 필요가 없습니다.
+ *
+ * 사용 예시 (Python):
+ *   c_inputs = (c_char_p * n)(*encoded)
+ *   out = (c_uint8 * (n * 32))()
+ *   lib.batch_hash_fixed_len(c_inputs, n, length, out)
+ */
+EXPORT void batch_hash_fixed_len(const uint8_t** inputs, int count,
+                                 size_t input_len, uint8_t* out) {
+    if (inputs == NULL || out == NULL || count <= 0) {
+        return;
+    }
+    blake3_hash_many(inputs, (size_t)count, input_len, out);
+}
+
+/**
+ * batch_hash_many - 길이가 서로 다른 입력들의 레인 병렬 해시
+ *
+ * 입력을 블록 수별로 모아 최대 8개씩 SIMD 레인에 배정합니다.
+ * (blake3_hash_many_ragged) 결과는 입력 순서대로 32바이트씩
+ * 호출자가 할당한 연속 버퍼 하나에 기록됩니다.
+ *
+ * 사용 예시 (Python):
+ *   c_inputs = (c_char_p * n)(*encoded)
+ *   c_lens = (c_size_t * n)(*map(len, encoded))
+ *   out = (c_uint8 * (n * 32))()
+ *   lib.batch_hash_many(c_inputs, c_lens, n, out)
+ */
+EXPORT void batch_hash_many(const uint8_t** inputs, const size_t* lens,
+                            int count, uint8_t* out) {
+    if (inputs == NULL || lens == NULL || out == NULL || count <= 0) {
+        return;
+    }
+    blake3_hash_many_ragged(inputs, lens, (size_t)count, out);
+}
+
 /* ═══════════════════════════════════════════════
  * 4. 배치 해시 비교 구현 (바이러스 DB 매칭)
  * ═══════════════════════════════════════════════ */
@@ -342,6 +525,47 @@ EXPORT void free_match_results(int* results) {
  * 5. 유사도 기반 배치 검색 구현
  * ═══════════════════════════════════════════════ */
 
+/**
+ * finish_similarity_results - 수집한 유사도 결과를 정렬하고 크기에 맞게 재할당
+ *
+ * batch_similarity_search / batch_similarity_search_flat 공용 마무리 단계입니다.
+ * 결과가 없으면 temp를 해제하고 NULL을 반환합니다.
+ */
+static SimilarityResult* finish_similarity_results(SimilarityResult* temp, int count,
+                                                   int* result_count) {
+    *result_count = count;
+
+    /* 결과 없으면 메모리 해제 */
+    if (count == 0) {
+        free(temp);
+        return NULL;
+    }
+
+    /* 유사도 내림차순 정렬 (간단한 선택 정렬) */
+    for (int i = 0; i < count - 1; i++) {
+        int max_idx = i;
+        for (int j = i + 1; j < count; j++) {
+            if (temp[j].similarity > temp[max_idx].similarity) {
+                max_idx = j;
+            }
+        }
+        if (max_idx != i) {
+            SimilarityResult swap = temp[i];
+            temp[i] = temp[max_idx];
+            temp[max_idx] = swap;
+        }
+    }
+
+    /* 정확한 크기로 재할당 */
+    SimilarityResult* results = (SimilarityResult*)realloc(
+        temp, sizeof(SimilarityResult) * count);
+    if (results == NULL) {
+        return temp;
+    }
+
+    return results;
+}
+
 /**
  * batch_similarity_search - 유사도 임계값 이상인 DB 항목 검색
  *
@@ -413,37 +637,60 @@ EXPORT SimilarityResult* batch_similarity_search(
         }
     }
 
-    *result_count = count;
+    return finish_similarity_results(temp, count, result_count);
+}
 
-    /* 결과 없으면 메모리 해제 */
-    if (count == 0) {
-        free(temp);
+/**
+ * batch_similarity_search_flat - 연속 바이너리 DB(db_count * hash_len)에서 유사 항목 검색
+ *
+ * batch_similarity_search와 결과가 같지만 DB를 포인터 배열 대신
+ * 하나의 연속 버퍼로 받으므로 호출자가 행마다 포인터를 만들 필요가 없고
+ * 행을 순차 접근하여 하드웨어 프리페처가 그대로 동작합니다.
+ *
+ * 사용 예시 (C):
+ *   int result_count;
+ *   SimilarityResult* results = batch_similarity_search_flat(
+ *       target, db_flat, db_size, 64, 0.85, &result_count);
+ *   free_similarity_results(results);
+ *
+ * 사용 예시 (Python):
+ *   results = similarity_search(target_bytes, db_list, 0.85, hash_len=64)
+ */
+EXPORT SimilarityResult* batch_similarity_search_flat(
+    const uint8_t* target_hash, const uint8_t* db_flat,
+    int db_count, int hash_len,
+    double threshold, int* result_count) {
+
+    if (target_hash == NULL || db_flat == NULL || db_count <= 0 ||
+        result_count == NULL || hash_len <= 0) {
+        if (result_count) *result_count = 0;
         return NULL;
     }
 
-    /* 유사도 내림차순 정렬 (간단한 선택 정렬) */
-    for (int i = 0; i < count - 1; i++) {
-        int max_idx = i;
-        for (int j = i + 1; j < count; j++) {
-            if (temp[j].similarity > temp[max_idx].similarity) {
-                max_idx = j;
-            }
-        }
-        if (max_idx != i) {
-            SimilarityResult swap = temp[i];
-            temp[i] = temp[max_idx];
-            temp[max_idx] = swap;
-        }
+    SimilarityResult* temp = (SimilarityResult*)malloc(
+        sizeof(SimilarityResult) * db_count);
+    if (temp == NULL) {
+        *result_count = 0;
+        return NULL;
     }
 
-    /* 정확한 크기로 재할당 */
-    SimilarityResult* results = (SimilarityResult*)realloc(
-        temp, sizeof(SimilarityResult) * count);
-    if (results == NULL) {
-        return temp;
+    int total_bits = hash_len * 8;
+    int count = 0;
+
+    for (int i = 0; i < db_count; i++) {
+        size_t distance = hamming_bytes(target_hash,
+                                        db_flat + (size_t)i * (size_t)hash_len,
+                                        (size_t)hash_len);
+        double similarity = 1.0 - ((double)distance / total_bits);
+
+        if (similarity >= threshold) {
+            temp[count].index = i;
+            temp[count].similarity = similarity;
+            count++;
+        }
     }
 
-    return results;
+    return finish_similarity_results(temp, count, result_count);
 }
 
 /**
@@ -454,3 +701,212 @@ EXPORT void free_similarity_results(SimilarityResult* results) {
         free(results);
     }
 }
+
+/* ═══════════════════════════════════════════════
+ * 6. 연속 메모리 DB 검색 구현
+ * ═══════════════════════════════════════════════ */
+
+/**
+ * db_find_exact - 연속 바이너리 DB(n * 32바이트)에서 완전 일치 행 검색
+ *
+ * 기존 int 반환형 호환용이며, 실제 검색은 db_find_all이 수행합니다.
+ *
+ * 사용 예시 (C):
+ *   uint32_t idx[3];
+ *   int found = db_find_exact(blob, 3, target, idx);
+ *   for (int i = 0; i < found; i++) printf("바이러스 #%u\n", idx[i]);
+ *
+ * 사용 예시 (Python):
+ *   matches = db.search(target_hash)
+ *
+ * @return 일치한 행 개수 (out_idx에 인덱스가 오름차순으로 기록됨)
+ */
+EXPORT int db_find_exact(const uint8_t* blob, size_t n,
+                         const uint8_t* target, uint32_t* out_idx) {
+    return (int)db_find_all(blob, n, target, out_idx);
+}
+
+/**
+ * db_find_all - 연속 바이너리 DB(n * 32바이트)에서 완전 일치 행 검색 (비트맵 방식)
+ *
+ * 64행 단위로 행별 일치 여부를 분기 없이 uint64_t 비트맵에 모은 뒤,
+ * 설정된 비트만 ctz로 꺼내 인덱스를 기록합니다. 일치가 드물고
+ * 흩어져 있어도 행마다 분기 예측 실패가 발생하지 않습니다.
+ *
+ * 사용 예시 (C):
+ *   uint32_t idx[DB_SIZE];
+ *   size_t found = db_find_all(blob, DB_SIZE, target, idx);
+ *
+ * 사용 예시 (Python):
+ *   matches = batch_compare(target_hash, blob)
+ *
+ * @return 일치한 행 개수 (out_idx에 인덱스가 오름차순으로 기록됨)
+ */
+EXPORT size_t db_find_all(const uint8_t* db, size_t n,
+                          const uint8_t* target, uint32_t* out_idx) {
+    if (db == NULL || target == NULL || out_idx == NULL) {
+        return 0;
+    }
+
+    size_t count = 0;
+#if defined(__AVX2__)
+    const __m256i t = _mm256_loadu_si256((const __m256i*)target);
+#else
+    uint64_t t[4];
+    memcpy(t, target, DETECTIVE_HASH_LEN);
+#endif
+
+    for (size_t base = 0; base < n; base += 64) {
+        size_t rows = (n - base < 64) ? n - base : 64;
+        const uint8_t* block = db + base * DETECTIVE_HASH_LEN;
+
+        /* 1) 일치 여부를 비트맵으로 수집 (분기 없음) */
+        uint64_t bitmap = 0;
+        for (size_t j = 0; j < rows; j++) {
+#if defined(__AVX2__)
+            __m256i row = _mm256_loadu_si256((const __m256i*)(block + j * DETECTIVE_HASH_LEN));
+            uint32_t mask = (uint32_t)_mm256_movemask_epi8(_mm256_cmpeq_epi8(row, t));
+            bitmap |= (uint64_t)(mask == 0xFFFFFFFFu) << j;
+#else
+            uint64_t row[4];
+            memcpy(row, block + j * DETECTIVE_HASH_LEN, DETECTIVE_HASH_LEN);
+            uint64_t diff = (row[0] ^ t[0]) | (row[1] ^ t[1]) |
+                            (row[2] ^ t[2]) | (row[3] ^ t[3]);
+            bitmap |= (uint64_t)(diff == 0) << j;
+#endif
+        }
+
+        /* 2) 설정된 비트만 인덱스로 변환 */
+        while (bitmap) {
+            out_idx[count++] = (uint32_t)(base + (size_t)ctz64(bitmap));
+            bitmap &= bitmap - 1;
+        }
+    }
+    return count;
+}
+
+/**
+ * db_find_many - 여러 대상 해시를 연속 바이너리 DB에서 한 번에 검색 (타일 방식)
+ *
+ * DB를 tile_rows행(기본 8192행 = 256KB) 단위로 나누고, 타일 하나가
+ * 캐시에 올라와 있는 동안 모든 대상 해시를 그 타일에 대해 검색합니다.
+ * DB가 L2보다 커도 대상 m개에 대해 DB를 메모리에서 한 번만 읽습니다.
+ *
+ * 결과는 (행 인덱스, 대상 인덱스) 쌍으로 out_pairs에 기록되며,
+ * 같은 대상에 대해서는 행 인덱스 오름차순입니다.
+ *
+ * 사용 예시 (C):
+ *   uint32_t pairs[2 * 64];
+ *   size_t total = db_find_many(blob, DB_SIZE, targets, 3, 0, pairs, 64);
+ *   // total > 64이면 버퍼를 total 크기로 늘려 다시 호출
+ *
+ * 사용 예시 (Python):
+ *   matches = db.search_many([target1, target2, target3])
+ *
+ * @return 전체 일치 개수 (max_pairs를 넘으면 앞의 max_pairs개만 기록됨)
+ */
+EXPORT size_t db_find_many(const uint8_t* db, size_t n,
+                           const uint8_t* targets, size_t m, size_t tile_rows,
+                           uint32_t* out_pairs, size_t max_pairs) {
+    if (db == NULL || targets == NULL || n == 0 || m == 0) {
+        return 0;
+    }
+    if (tile_rows == 0) {
+        tile_rows = DETECTIVE_SEARCH_TILE_ROWS;
+    }
+    if (tile_rows > n) {
+        tile_rows = n;
+    }
+
+    /* db_find_all의 비트맵 단위(64행)로 나누어 검색하므로 인덱스 버퍼는 스택의 64개면 충분
+     * (힙 할당 실패를 "일치 없음"으로 잘못 보고하지 않도록 할당하지 않음) */
+    uint32_t block_idx[64];
+
+    size_t total = 0;
+    for (size_t base = 0; base < n; base += tile_rows) {
+        size_t rows = (n - base < tile_rows) ? n - base : tile_rows;
+        const uint8_t* tile = db + base * DETECTIVE_HASH_LEN;
+
+        /* 타일이 캐시에 남아 있는 동안 모든 대상 검색 */
+        for (size_t k = 0; k < m; k++) {
+            const uint8_t* target = targets + k * DETECTIVE_HASH_LEN;
+            for (size_t sub = 0; sub < rows; sub += 64) {
+                size_t block_rows = (rows - sub < 64) ? rows - sub : 64;
+                size_t found = db_find_all(tile + sub * DETECTIVE_HASH_LEN, block_rows,
+                                           target, block_idx);
+                for (size_t f = 0; f < found; f++, total++) {
+                    if (out_pairs != NULL && total < max_pairs) {
+                        out_pairs[2 * total] = (uint32_t)(base + sub + block_idx[f]);
+                        out_pairs[2 * total + 1] = (uint32_t)k;
+                    }
+                }
+            }
+        }
+    }
+
+    return total;
+}
+
+/**
+ * scan_files - 여러 입력을 해시한 뒤 DB에서 한 번에 검색 (해시 + 검색 결합)
+ *
+ * m개 입력(각 lens[i] 바이트)을 blake3_hash_many_ragged로 한 번에 해시하고, 그 다이제스트들을
+ * db_find_many로 타일 단위 검색합니다. Python에서 파일마다
+ * 해시/검색을 따로 호출하던 왕복을 한 번의 호출로 줄입니다.
+ *
+ * db가 NULL이거나 n이 0이면 해시만 계산합니다.
+ *
+ * 사용 예시 (C):
+ *   uint32_t pairs[2 * 64];
+ *   uint8_t digests[M * 32];
+ *   size_t total = scan_files(data, lens, M, blob, DB_SIZE, pairs, 64, digests);
+ *
+ * 사용 예시 (Python):
+ *   matches = db.scan([content1, content2, ...])
+ *
+ * @return 전체 일치 개수 (out_pairs 형식은 db_find_many와 동일)
+ */
+EXPORT size_t scan_files(const uint8_t** data, const size_t* lens, size_t m,
+                         const uint8_t* db, size_t n,
+                         uint32_t* out_pairs, size_t max_pairs,
+                         uint8_t* out_digests) {
+    /* 다이제스트 버퍼는 호출자가 할당 (내부 할당 실패를 "일치 없음"으로 보고하지 않도록) */
+    if (data == NULL || lens == NULL || out_digests == NULL || m == 0) {
+        return 0;
+    }
+
+    /* 1) 입력 해시 (batch_hash_many와 같이 블록 수가 같은 입력끼리 SIMD 레인에 묶어 한 번에 해시) */
+    blake3_hash_many_ragged(data, lens, m, out_digests);
+
+    /* 2) 다이제스트 전체를 타일 단위로 DB 검색 */
+    size_t total = 0;
+    if (db != NULL && n > 0) {
+        total = db_find_many(db, n, out_digests, m, 0, out_pairs, max_pairs);
+    }
+    return total;
+}
+
+/**
+ * hamming_scan_32b - 연속 바이너리 DB 각 행과 대상 해시의 해밍 거리 계산
+ *
+ * 행마다 hamming32로 32바이트(256비트) 거리를 한 번에 구합니다.
+ * (AVX-512 VPOPCNTDQ: VPOPCNTQ, AVX2: VPXOR + 니블 LUT popcount + VPSADBW)
+ *
+ * 사용 예시 (C):
+ *   uint16_t dists[DB_SIZE];
+ *   hamming_scan_32b(blob, DB_SIZE, target, dists);
+ *   double similarity = 1.0 - dists[0] / 256.0;
+ *
+ * 사용 예시 (Python):
+ *   results = similarity_search(target, db_hashes, threshold=0.85)
+ */
+EXPORT void hamming_scan_32b(const uint8_t* db, size_t n,
+                             const uint8_t* target, uint16_t* out_dists) {
+    if (db == NULL || target == NULL || out_dists == NULL) {
+        return;
+    }
+
+    for (size_t i = 0; i < n; i++) {
+        out_dists[i] = (uint16_t)hamming32(db + i * DETECTIVE_HASH_LEN, target);
+    }
+}
@@ -163,6 +163,7 @@ static void chunk_state_update(blake3_chunk_state *self, const uint8_t *input, s
             blake3_compress_in_place(self->cv, self->buf, BLAKE3_BLOCK_LEN, self->chunk_counter, block_flags);
             self->blocks_compressed += 1;
             self->buf_len = 0;
+            memset(self->buf, 0, BLAKE3_BLOCK_LEN);
         }
         
         size_t want = BLAKE3_BLOCK_LEN - self->buf_len;
@@ -186,7 +187,7 @@ static void parent_output(const uint8_t block[64], const uint32_t key[8], uint8_
 }
 
 static void parent_cv(const uint8_t block[64], const uint32_t key[8], uint8_t flags, uint32_t out[8]) {
-    uint8_t cv_bytes[32];
+    uint8_t cv_bytes[64];
     parent_output(block, key, flags, cv_bytes);
     for (size_t i = 0; i < 8; i++) {
         out[i] = ((uint32_t)cv_bytes[4 * i]) |
@@ -197,8 +198,8 @@ static void parent_cv(const uint8_t block[64], const uint32_t key[8], uint8_t fl
 }
 
 static void add_chunk_cv(blake3_hasher *self, uint32_t new_cv[8], uint64_t total_chunks) {
-    // 스택에 CV 추가
-    while (total_chunks & 1) {
+    // 스택에 CV 추가 (완성된 서브트리만큼 부모 노드로 병합)
+    while ((total_chunks & 1) == 0) {
         uint8_t parent_block[64];
         memcpy(parent_block, &self->cv_stack[(self->cv_stack_len - 1) * 8], 32);
         memcpy(parent_block + 32, new_cv, 32);
@@ -235,7 +236,7 @@ void blake3_hasher_init_derive_key(blake3_hasher *self, const char *context) {
     uint8_t context_key[BLAKE3_KEY_LEN];
     blake3_hasher_finalize(&context_hasher, context_key, BLAKE3_KEY_LEN);
     blake3_hasher_init_keyed(self, context_key);
-    self->chunk.flags |= DERIVE_KEY_MATERIAL;
+    self->chunk.flags = DERIVE_KEY_MATERIAL;
 }
 
 void blake3_hasher_update(blake3_hasher *self, const void *input, size_t input_len) {
@@ -255,9 +256,10 @@ void blake3_hasher_update(blake3_hasher *self, const void *input, size_t input_l
                                    ((uint32_t)chunk_cv[4 * i + 2] << 16) |
                                    ((uint32_t)chunk_cv[4 * i + 3] << 24);
             }
-            add_chunk_cv(self, chunk_cv_words, self->chunk.chunk_counter + 1);
+            uint64_t total_chunks = self->chunk.chunk_counter + 1;
+            add_chunk_cv(self, chunk_cv_words, total_chunks);
             chunk_state_init(&self->chunk, self->key, self->chunk.flags);
-            self->chunk.chunk_counter += 1;
+            self->chunk.chunk_counter = total_chunks;
         }
         
         size_t want = BLAKE3_CHUNK_LEN - (self->chunk.blocks_compressed * BLAKE3_BLOCK_LEN + self->chunk.buf_len);
@@ -269,47 +271,327 @@ void blake3_hasher_update(blake3_hasher *self, const void *input, size_t input_l
 }
 
 void blake3_hasher_finalize(const blake3_hasher *self, uint8_t *out, size_t out_len) {
-    // 현재 청크의 CV 계산
-    uint8_t chunk_cv[64];
-    chunk_state_output(&self->chunk, chunk_cv);
-    uint32_t chunk_cv_words[8];
-    for (size_t i = 0; i < 8; i++) {
-        chunk_cv_words[i] = ((uint32_t)chunk_cv[4 * i]) |
-                           ((uint32_t)chunk_cv[4 * i + 1] << 8) |
-                           ((uint32_t)chunk_cv[4 * i + 2] << 16) |
-                           ((uint32_t)chunk_cv[4 * i + 3] << 24);
-    }
-    
-    // 루트 노드 계산
-    uint32_t parent_nodes[8];
-    memcpy(parent_nodes, chunk_cv_words, 32);
-    
+    // 루트 노드의 압축 입력 (cv, block, block_len, counter, flags)
+    uint32_t root_cv[8];
+    uint8_t root_block[BLAKE3_BLOCK_LEN];
+    uint8_t root_block_len;
+    uint64_t root_counter;
+    uint8_t root_flags;
+
+    // 현재 청크가 루트 후보
+    memcpy(root_cv, self->chunk.cv, 32);
+    memcpy(root_block, self->chunk.buf, BLAKE3_BLOCK_LEN);
+    root_block_len = self->chunk.buf_len;
+    root_counter = self->chunk.chunk_counter;
+    root_flags = self->chunk.flags |
+                 (self->chunk.blocks_compressed == 0 ? CHUNK_START : 0) |
+                 CHUNK_END;
+
+    // 스택에 남은 CV들과 차례로 병합하여 루트 부모 노드 구성
     for (size_t i = self->cv_stack_len; i > 0; i--) {
-        uint8_t parent_block[64];
-        memcpy(parent_block, &self->cv_stack[(i - 1) * 8], 32);
-        memcpy(parent_block + 32, parent_nodes, 32);
-        parent_cv(parent_block, self->key, self->chunk.flags, parent_nodes);
+        uint8_t wide[64];
+        blake3_compress_xof(root_cv, root_block, root_block_len, root_counter, root_flags, wide);
+        memcpy(root_block, &self->cv_stack[(i - 1) * 8], 32);
+        memcpy(root_block + 32, wide, 32);
+        memcpy(root_cv, self->key, 32);
+        root_block_len = BLAKE3_BLOCK_LEN;
+        root_counter = 0;
+        root_flags = self->chunk.flags | PARENT;
     }
-    
-    // 최종 출력 생성
+
+    // 최종 출력 생성 (64바이트 단위 XOF)
     uint8_t wide_buf[64];
-    blake3_compress_xof(parent_nodes, (uint8_t*)parent_nodes, 32, 0, self->chunk.flags | ROOT, wide_buf);
-    memcpy(out, wide_buf, out_len < 64 ? out_len : 64);
-    
-    // 64바이트보다 더 많이 요청된 경우
-    if (out_len > 64) {
-        for (size_t output_block_counter = 1; out_len > 64; output_block_counter++) {
-            blake3_compress_xof(parent_nodes, (uint8_t*)parent_nodes, 32, output_block_counter, self->chunk.flags | ROOT, wide_buf);
-            size_t this_block_len = out_len > 64 ? 64 : out_len;
-            memcpy(out + 64 * output_block_counter, wide_buf, this_block_len);
-            out_len -= this_block_len;
-        }
+    for (uint64_t output_block_counter = 0; out_len > 0; output_block_counter++) {
+        blake3_compress_xof(root_cv, root_block, root_block_len, output_block_counter, root_flags | ROOT, wide_buf);
+        size_t this_block_len = out_len < 64 ? out_len : 64;
+        memcpy(out, wide_buf, this_block_len);
+        out += this_block_len;
+        out_len -= this_block_len;
+    }
+}
+
+// ═══════════════════════════════════════════════
+// 단일 청크 입력 전용 해시
+//
+// 입력이 한 청크(1024바이트) 이하이면 트리가 생기지 않으므로
+// 해시어 상태 머신(CV 스택, 버퍼링, finalize 분기) 없이
+// 블록을 순서대로 압축하고 마지막 블록에 CHUNK_END | ROOT를 붙입니다.
+// ═══════════════════════════════════════════════
+void blake3_short(const void *input, size_t input_len, uint8_t out[BLAKE3_OUT_LEN]) {
+    if (input_len > BLAKE3_CHUNK_LEN) {
+        blake3(input, input_len, out, BLAKE3_OUT_LEN);
+        return;
+    }
+
+    const uint8_t *in = (const uint8_t *)input;
+    uint32_t cv[8];
+    memcpy(cv, blake3_IV, sizeof(cv));
+
+    // 마지막 블록 전까지는 64바이트 전체 블록
+    uint8_t flags = CHUNK_START;
+    while (input_len > BLAKE3_BLOCK_LEN) {
+        blake3_compress_in_place(cv, in, BLAKE3_BLOCK_LEN, 0, flags);
+        in += BLAKE3_BLOCK_LEN;
+        input_len -= BLAKE3_BLOCK_LEN;
+        flags = 0;
+    }
+
+    // 마지막 블록 (0 패딩) = 루트 출력
+    uint8_t block[BLAKE3_BLOCK_LEN] = {0};
+    if (input_len > 0) {
+        memcpy(block, in, input_len);
+    }
+    blake3_compress_in_place(cv, block, (uint8_t)input_len, 0, flags | CHUNK_END | ROOT);
+
+    for (size_t i = 0; i < 8; i++) {
+        out[4 * i] = (uint8_t)cv[i];
+        out[4 * i + 1] = (uint8_t)(cv[i] >> 8);
+        out[4 * i + 2] = (uint8_t)(cv[i] >> 16);
+        out[4 * i + 3] = (uint8_t)(cv[i] >> 24);
     }
 }
 
 void blake3(const void *input, size_t input_len, uint8_t *out, size_t out_len) {
+    // 32바이트 출력 + 단일 청크 입력은 전용 경로
+    if (out_len == BLAKE3_OUT_LEN && input_len <= BLAKE3_CHUNK_LEN) {
+        blake3_short(input, input_len, out);
+        return;
+    }
+
     blake3_hasher hasher;
     blake3_hasher_init(&hasher);
     blake3_hasher_update(&hasher, input, input_len);
     blake3_hasher_finalize(&hasher, out, out_len);
-}
\ No newline at end of file
+}
+
+// ═══════════════════════════════════════════════
+// 다중 입력 병렬 해시 (레인 인터리빙)
+//
+// 단일 청크 입력 여러 개를 레인 하나씩 배정해 동시에 압축합니다. (레인별 길이는 달라도 됨)
+// 상태를 [워드][레인] 형태(SoA)로 두어 레인 루프가 SIMD 레지스터
+// (AVX2: 8 x 32비트)로 벡터화됩니다.
+// ═══════════════════════════════════════════════
+#define BLAKE3_SIMD_DEGREE 8
+
+static uint32_t load32(const uint8_t *src) {
+    return ((uint32_t)src[0]) |
+           ((uint32_t)src[1] << 8) |
+           ((uint32_t)src[2] << 16) |
+           ((uint32_t)src[3] << 24);
+}
+
+static void store32(uint8_t *dst, uint32_t w) {
+    dst[0] = (uint8_t)w;
+    dst[1] = (uint8_t)(w >> 8);
+    dst[2] = (uint8_t)(w >> 16);
+    dst[3] = (uint8_t)(w >> 24);
+}
+
+static void g_lanes(uint32_t v[16][BLAKE3_SIMD_DEGREE], size_t a, size_t b, size_t c, size_t d,
+                    const uint32_t x[BLAKE3_SIMD_DEGREE], const uint32_t y[BLAKE3_SIMD_DEGREE]) {
+    for (size_t l = 0; l < BLAKE3_SIMD_DEGREE; l++) {
+        v[a][l] = v[a][l] + v[b][l] + x[l];
+        v[d][l] = rotr32(v[d][l] ^ v[a][l], 16);
+        v[c][l] = v[c][l] + v[d][l];
+        v[b][l] = rotr32(v[b][l] ^ v[c][l], 12);
+        v[a][l] = v[a][l] + v[b][l] + y[l];
+        v[d][l] = rotr32(v[d][l] ^ v[a][l], 8);
+        v[c][l] = v[c][l] + v[d][l];
+        v[b][l] = rotr32(v[b][l] ^ v[c][l], 7);
+    }
+}
+
+static void compress_lanes(uint32_t cv[8][BLAKE3_SIMD_DEGREE],
+                           const uint32_t msg[16][BLAKE3_SIMD_DEGREE],
+                           const uint32_t block_len[BLAKE3_SIMD_DEGREE],
+                           const uint32_t flags[BLAKE3_SIMD_DEGREE]) {
+    uint32_t v[16][BLAKE3_SIMD_DEGREE];
+
+    for (size_t l = 0; l < BLAKE3_SIMD_DEGREE; l++) {
+        for (size_t i = 0; i < 8; i++) {
+            v[i][l] = cv[i][l];
+        }
+        v[8][l] = blake3_IV[0];
+        v[9][l] = blake3_IV[1];
+        v[10][l] = blake3_IV[2];
+        v[11][l] = blake3_IV[3];
+        v[12][l] = 0;  // 단일 청크 루트이므로 카운터는 항상 0
+        v[13][l] = 0;
+        v[14][l] = block_len[l];
+        v[15][l] = flags[l];
+    }
+
+    for (size_t round = 0; round < 7; round++) {
+        const uint8_t *s = blake3_msg_schedule[round];
+        // 열 믹싱
+        g_lanes(v, 0, 4, 8, 12, msg[s[0]], msg[s[1]]);
+        g_lanes(v, 1, 5, 9, 13, msg[s[2]], msg[s[3]]);
+        g_lanes(v, 2, 6, 10, 14, msg[s[4]], msg[s[5]]);
+        g_lanes(v, 3, 7, 11, 15, msg[s[6]], msg[s[7]]);
+        // 대각선 믹싱
+        g_lanes(v, 0, 5, 10, 15, msg[s[8]], msg[s[9]]);
+        g_lanes(v, 1, 6, 11, 12, msg[s[10]], msg[s[11]]);
+        g_lanes(v, 2, 7, 8, 13, msg[s[12]], msg[s[13]]);
+        g_lanes(v, 3, 4, 9, 14, msg[s[14]], msg[s[15]]);
+    }
+
+    for (size_t i = 0; i < 8; i++) {
+        for (size_t l = 0; l < BLAKE3_SIMD_DEGREE; l++) {
+            cv[i][l] = v[i][l] ^ v[i + 8][l];
+        }
+    }
+}
+
+static size_t num_blocks_of(size_t input_len) {
+    return input_len == 0 ? 1 : (input_len + BLAKE3_BLOCK_LEN - 1) / BLAKE3_BLOCK_LEN;
+}
+
+// 레인마다 길이가 다를 수 있는 단일 청크 입력(최대 BLAKE3_SIMD_DEGREE개)을 동시에 해시
+// 블록 수가 적은 레인은 자기 마지막 블록 이후 CV를 그대로 유지합니다.
+static void hash_many_lanes(const uint8_t *const *inputs, const size_t *lens, size_t lanes,
+                            uint8_t *const *outs) {
+    uint32_t cv[8][BLAKE3_SIMD_DEGREE];
+    uint32_t prev[8][BLAKE3_SIMD_DEGREE];
+    uint32_t msg[16][BLAKE3_SIMD_DEGREE];
+    uint32_t block_len[BLAKE3_SIMD_DEGREE];
+    uint32_t flags[BLAKE3_SIMD_DEGREE];
+    size_t lane_blocks[BLAKE3_SIMD_DEGREE] = {0};
+    size_t max_blocks = 0;
+
+    for (size_t l = 0; l < lanes; l++) {
+        lane_blocks[l] = num_blocks_of(lens[l]);
+        if (lane_blocks[l] > max_blocks) {
+            max_blocks = lane_blocks[l];
+        }
+    }
+
+    for (size_t i = 0; i < 8; i++) {
+        for (size_t l = 0; l < BLAKE3_SIMD_DEGREE; l++) {
+            cv[i][l] = blake3_IV[i];
+        }
+    }
+
+    for (size_t b = 0; b < max_blocks; b++) {
+        size_t offset = b * BLAKE3_BLOCK_LEN;
+        int ragged = 0;
+
+        // 각 레인의 블록을 [워드][레인]으로 전치 (사용하지 않는 레인은 0)
+        memset(msg, 0, sizeof(msg));
+        memset(block_len, 0, sizeof(block_len));
+        memset(flags, 0, sizeof(flags));
+        for (size_t l = 0; l < lanes; l++) {
+            if (b >= lane_blocks[l]) {
+                ragged = 1;
+                continue;
+            }
+            int last = (b == lane_blocks[l] - 1);
+            size_t len = last ? lens[l] - offset : BLAKE3_BLOCK_LEN;
+            uint8_t block[BLAKE3_BLOCK_LEN] = {0};
+            if (len > 0) {
+                memcpy(block, inputs[l] + offset, len);
+            }
+            for (size_t i = 0; i < 16; i++) {
+                msg[i][l] = load32(block + 4 * i);
+            }
+            block_len[l] = (uint32_t)len;
+            flags[l] = (b == 0 ? CHUNK_START : 0) | (last ? (CHUNK_END | ROOT) : 0);
+        }
+
+        if (ragged) {
+            memcpy(prev, cv, sizeof(cv));
+        }
+        compress_lanes(cv, msg, block_len, flags);
+        if (ragged) {
+            // 이미 끝난 레인은 압축 전 CV(최종 출력)로 되돌림
+            for (size_t l = 0; l < lanes; l++) {
+                if (b >= lane_blocks[l]) {
+                    for (size_t i = 0; i < 8; i++) {
+                        cv[i][l] = prev[i][l];
+                    }
+                }
+            }
+        }
+    }
+
+    for (size_t l = 0; l < lanes; l++) {
+        for (size_t i = 0; i < 8; i++) {
+            store32(outs[l] + 4 * i, cv[i][l]);
+        }
+    }
+}
+
+void blake3_hash_many(const uint8_t *const *inputs, size_t num_inputs,
+                      size_t input_len, uint8_t *out) {
+    // 한 청크를 넘는 입력은 트리 모드가 필요하므로 개별 해시
+    if (input_len > BLAKE3_CHUNK_LEN) {
+        for (size_t i = 0; i < num_inputs; i++) {
+            blake3(inputs[i], input_len, out + i * BLAKE3_OUT_LEN, BLAKE3_OUT_LEN);
+        }
+        return;
+    }
+
+    size_t lens[BLAKE3_SIMD_DEGREE];
+    uint8_t *outs[BLAKE3_SIMD_DEGREE];
+    for (size_t l = 0; l < BLAKE3_SIMD_DEGREE; l++) {
+        lens[l] = input_len;
+    }
+
+    while (num_inputs > 0) {
+        size_t lanes = num_inputs < BLAKE3_SIMD_DEGREE ? num_inputs : BLAKE3_SIMD_DEGREE;
+        for (size_t l = 0; l < lanes; l++) {
+            outs[l] = out + l * BLAKE3_OUT_LEN;
+        }
+        hash_many_lanes(inputs, lens, lanes, outs);
+        inputs += lanes;
+        out += lanes * BLAKE3_OUT_LEN;
+        num_inputs -= lanes;
+    }
+}
+
+void blake3_hash_many_ragged(const uint8_t *const *inputs, const size_t *lens,
+                             size_t num_inputs, uint8_t *out) {
+    // 블록 수(1~16)별로 입력을 모아 같은 레인 묶음의 길이 차이를 줄임 (계수 정렬)
+    // 한 청크를 넘는 입력은 개별 해시
+    const uint8_t *lane_in[BLAKE3_SIMD_DEGREE];
+    size_t lane_len[BLAKE3_SIMD_DEGREE];
+    uint8_t *lane_out[BLAKE3_SIMD_DEGREE];
+    size_t lanes = 0;
+
+    for (size_t blocks = 1; blocks <= BLAKE3_CHUNK_LEN / BLAKE3_BLOCK_LEN; blocks++) {
+        for (size_t i = 0; i < num_inputs; i++) {
+            if (lens[i] > BLAKE3_CHUNK_LEN || num_blocks_of(lens[i]) != blocks) {
+                continue;
+            }
+            lane_in[lanes] = inputs[i];
+            lane_len[lanes] = lens[i];
+            lane_out[lanes] = out + i * BLAKE3_OUT_LEN;
+            if (++lanes == BLAKE3_SIMD_DEGREE) {
+                hash_many_lanes(lane_in, lane_len, lanes, lane_out);
+                lanes = 0;
+            }
+        }
+    }
+    if (lanes > 0) {
+        hash_many_lanes(lane_in, lane_len, lanes, lane_out);
+    }
+
+    for (size_t i = 0; i < num_inputs; i++) {
+        if (lens[i] > BLAKE3_CHUNK_LEN) {
+            blake3(inputs[i], lens[i], out + i * BLAKE3_OUT_LEN, BLAKE3_OUT_LEN);
+        }
+    }
+}
+
+const char *blake3_simd_backend(void) {
+#if defined(__AVX512F__) && defined(__AVX512VL__)
+    return "avx512";
+#elif defined(__AVX2__)
+    return "avx2";
+#elif defined(__SSE4_1__)
+    return "sse41";
+#elif defined(__SSE2__) || defined(_M_X64) || defined(_M_AMD64)
+    return "sse2";
+#else
+    return "portable";
+#endif
+}